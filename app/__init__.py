@@ -1,8 +1,11 @@
+import os
 from flask import Flask
 from flask_cors import CORS
 from app.docs.config.swagger import api_bp
 from app.routes.route import scraper_bp
+from app.routes.admin import admin_bp
 from app.mcp import mcp_bp
+from app.services.prewarm import prewarm_scheduler
 
 def create_app():
     app = Flask(__name__)
@@ -11,5 +14,9 @@ def create_app():
     # Registrasi Blueprints
     app.register_blueprint(scraper_bp, url_prefix='/api')
     app.register_blueprint(mcp_bp, url_prefix='/api/mcp')
-    
+    app.register_blueprint(admin_bp, url_prefix='/api/admin')
+
+    if os.environ.get('PREWARM_ENABLED', 'false').lower() == 'true':
+        prewarm_scheduler.start()
+
     return app
\ No newline at end of file
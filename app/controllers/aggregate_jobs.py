@@ -3,9 +3,43 @@ Aggregate Jobs Controller
 Returns top 20 filtered jobs from all sources
 """
 
-from flask import jsonify, request
-import asyncio
-from app.services.job_aggregator import aggregate_jobs
+from flask import Response, jsonify, request, stream_with_context
+import json
+from app.services.job_aggregator import aggregate_jobs, stream_aggregate_jobs
+from app.singletons.event_loop import AsyncRuntime
+
+
+def _read_search_params():
+    """
+    Read keyword, location and the scoring preferences from the query string
+    """
+    keyword = request.args.get('keyword', 'developer')
+    location = request.args.get('location', '')
+    job_title = request.args.get('jobTitle', keyword)
+    work_mode = request.args.get('workMode', '')  # remote | hybrid | onsite | any
+    max_days_old = request.args.get('maxDaysOld', '14')
+    profile = request.args.get('profile', '')  # ranking profile; RANKING_PROFILE when empty
+    
+    # User preferences for scoring
+    user_preferences = {
+        'jobTitle': job_title,
+        'location': location,
+        'workMode': work_mode,
+        'maxDaysOld': max_days_old,
+        'profile': profile
+    }
+    return keyword, location, user_preferences
+
+
+def _read_budget_ms():
+    """
+    Optional request-level deadline (?budgetMs=8000); None when absent or invalid
+    """
+    try:
+        budget_ms = int(request.args.get('budgetMs', ''))
+    except ValueError:
+        return None
+    return budget_ms if budget_ms > 0 else None
 
 
 def get_aggregate_jobs():
@@ -15,32 +49,21 @@ def get_aggregate_jobs():
     - keyword: Job title/keyword
     - location: Job location
     - jobTitle: User's preferred job title (for scoring)
+    - profile: Ranking profile (default, fresh, local, remote, neutral, ...)
+    - budgetMs: Deadline in ms; sources still pending are cut off and ranking
+      runs on partial results
     """
     try:
         # Get query parameters
-        keyword = request.args.get('keyword', 'developer')
-        location = request.args.get('location', '')
-        job_title = request.args.get('jobTitle', keyword)
-        work_mode = request.args.get('workMode', '')  # remote | hybrid | onsite | any
-        max_days_old = request.args.get('maxDaysOld', '14')
-        
-        # User preferences for scoring
-        user_preferences = {
-            'jobTitle': job_title,
-            'location': location,
-            'workMode': work_mode,
-            'maxDaysOld': max_days_old
-        }
+        keyword, location, user_preferences = _read_search_params()
+        budget_ms = _read_budget_ms()
         
         print(f"🎯 Aggregating jobs for: {keyword} in {location}")
         
-        # Run async aggregation
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
-            aggregate_jobs(keyword, location, user_preferences)
+        # Run async aggregation on the shared runtime loop
+        result = AsyncRuntime.get_instance().run(
+            aggregate_jobs(keyword, location, user_preferences, budget_ms)
         )
-        loop.close()
         
         if result['status'] == 'success':
             return jsonify(result), 200
@@ -58,3 +81,59 @@ def get_aggregate_jobs():
             'data': {'jobs': []},
             'progress': 100
         }), 500
+
+
+async def _next_event(agen):
+    return await agen.__anext__()
+
+
+def _iterate_events(agen):
+    """
+    Drive an async event generator from sync (WSGI) code on the shared runtime loop
+    """
+    runtime = AsyncRuntime.get_instance()
+    try:
+        while True:
+            try:
+                yield runtime.run(_next_event(agen))
+            except StopAsyncIteration:
+                break
+    finally:
+        runtime.run(agen.aclose())
+
+
+def stream_aggregate_jobs_response():
+    """
+    Same as get_aggregate_jobs but streams an event per source as soon as it finishes
+    Query params: same as get_aggregate_jobs, plus
+    - format: 'sse' (text/event-stream, default) or 'ndjson' (one JSON object per line)
+    """
+    keyword, location, user_preferences = _read_search_params()
+    budget_ms = _read_budget_ms()
+    stream_format = request.args.get('format', 'sse').lower()
+    
+    print(f"🎯 Streaming aggregated jobs for: {keyword} in {location}")
+    
+    def generate():
+        try:
+            for event in _iterate_events(stream_aggregate_jobs(keyword, location, user_preferences, budget_ms=budget_ms)):
+                payload = json.dumps(event, default=str)
+                if stream_format == 'ndjson':
+                    yield payload + '\n'
+                else:
+                    yield f"event: {event['event']}\ndata: {payload}\n\n"
+        except Exception as e:
+            print(f"❌ Aggregation stream error: {str(e)}")
+            error = json.dumps({
+                'event': 'error',
+                'status': 'failed',
+                'message': f'Job aggregation error: {str(e)}',
+                'progress': 100
+            })
+            yield error + '\n' if stream_format == 'ndjson' else f"event: error\ndata: {error}\n\n"
+    
+    mimetype = 'application/x-ndjson' if stream_format == 'ndjson' else 'text/event-stream'
+    return Response(stream_with_context(generate()), mimetype=mimetype, headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
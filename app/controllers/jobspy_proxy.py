@@ -6,7 +6,8 @@ Runs the jobspy docker image to fetch jobs and normalizes output
 import json
 import subprocess
 from flask import request
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.source_cache import source_cache
 
 
 def _build_args(params: dict) -> list:
@@ -43,17 +44,13 @@ def _build_args(params: dict) -> list:
     return args
 
 
-def jobspy_search():
+@source_cache.cached('jobspy')
+def fetch_jobspy_jobs(params: dict) -> dict:
+    """
+    Run the jobspy docker image and return normalized jobs as plain Python data.
+    Raises ScraperError on failure.
+    """
     try:
-        # Read query params
-        params = {
-            'site_names': request.args.get('site_names', 'indeed,linkedin'),
-            'search_term': request.args.get('search_term') or request.args.get('keyword', 'developer'),
-            'location': request.args.get('location', ''),
-            'results_wanted': request.args.get('results_wanted', '20'),
-            'hours_old': request.args.get('hours_old', '96')
-        }
-
         args = _build_args(params)
         cmd = ['docker', 'run', '--rm', 'jobspy'] + args
 
@@ -82,10 +79,24 @@ def jobspy_search():
                 'source': j.get('site') or j.get('via') or 'JobSpy'
             })
 
-        return ResponseHelper.success_response('Success fetching from JobSpy', {
-            'jobs': jobs
-        })
+        return {'jobs': jobs}
     except subprocess.TimeoutExpired:
-        return ResponseHelper.failure_response('JobSpy request timed out', status_code=504)
+        raise ScraperError('JobSpy request timed out', status_code=504)
     except Exception as e:
-        return ResponseHelper.failure_response(f'JobSpy error: {str(e)}', status_code=500)
+        raise ScraperError(f'JobSpy error: {str(e)}', status_code=500)
+
+
+def jobspy_search():
+    try:
+        # Read query params
+        params = {
+            'site_names': request.args.get('site_names', 'indeed,linkedin'),
+            'search_term': request.args.get('search_term') or request.args.get('keyword', 'developer'),
+            'location': request.args.get('location', ''),
+            'results_wanted': request.args.get('results_wanted', '20'),
+            'hours_old': request.args.get('hours_old', '96')
+        }
+
+        return ResponseHelper.success_response('Success fetching from JobSpy', fetch_jobspy_jobs(params))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
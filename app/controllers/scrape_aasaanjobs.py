@@ -1,12 +1,16 @@
 from bs4 import BeautifulSoup
 from flask import jsonify
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
 
-def scrape_aasaanjobs(keyword='developer', location='bangalore', page='1'):
+@source_cache.cached('aasaanjobs')
+def fetch_aasaanjobs_jobs(keyword='developer', location='bangalore', page='1'):
     """
     Scrape jobs from AasaanJobs
+    Returns plain Python data, raises ScraperError on failure.
     
     Args:
         keyword: Search keyword (default: 'developer')
@@ -31,10 +35,10 @@ def scrape_aasaanjobs(keyword='developer', location='bangalore', page='1'):
         }
         
         # Send request
-        response = scraper.get(url, headers=headers, timeout=30)
+        response = get_with_retries('aasaanjobs', scraper, url, headers=headers, timeout=30)
         
         if response.status_code == 403:
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "AasaanJobs is currently blocking requests. Please try again later.",
                 status_code=503
             )
@@ -134,31 +138,41 @@ def scrape_aasaanjobs(keyword='developer', location='bangalore', page='1'):
         
         current_page_num = int(page) if page.isdigit() else 1
         
-        return ResponseHelper.success_response('Success scraping AasaanJobs', {
+        return {
             'jobs': results,
             'pagination': {
                 'current_page': current_page_num,
                 'last_page': current_page_num,
                 'next_page': None
             }
-        })
+        }
         
+    except ScraperError:
+        raise
+
     except Exception as e:
         error_msg = str(e)
         
         if "403" in error_msg or "Forbidden" in error_msg:
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "AasaanJobs is currently blocking requests.",
                 status_code=503
             )
         
         if "timeout" in error_msg.lower():
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "AasaanJobs request timed out.",
                 status_code=504
             )
         
-        return ResponseHelper.failure_response(
+        raise ScraperError(
             f"Error scraping AasaanJobs: {error_msg}",
             status_code=500
         )
+
+
+def scrape_aasaanjobs(keyword='developer', location='bangalore', page='1'):
+    try:
+        return ResponseHelper.success_response('Success scraping AasaanJobs', fetch_aasaanjobs_jobs(keyword, location, page))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -1,11 +1,20 @@
-import requests
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import source_retries
+from app.services.source_cache import source_cache
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
 
 
-def scrape_dare2compete(opportunity_type='internships', page='1'):
+@source_cache.cached_async('dare2compete')
+async def fetch_dare2compete_jobs_async(opportunity_type='internships', page='1'):
     """
     Scrape opportunities from Dare2Compete (uses their API)
+    Runs on the AsyncRuntime loop with the shared HTTP client.
+    Returns plain Python data, raises ScraperError on failure.
     
     Args:
         opportunity_type: Type of opportunity (default: 'internships')
@@ -23,16 +32,21 @@ def scrape_dare2compete(opportunity_type='internships', page='1'):
             'Referer': 'https://dare2compete.com/'
         }
         
-        response = requests.get(url, headers=headers, timeout=30)
-        
-        if response.status_code == 403:
-            return ResponseHelper.failure_response(
-                "Dare2Compete is currently blocking requests.",
-                status_code=503
-            )
-        
-        response.raise_for_status()
-        data = response.json()
+        session = await AsyncHttpClient.get_instance().get_session()
+
+        async def _get_opportunities():
+            await host_rate_limiter.acquire_async(url)
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 403:
+                    raise ScraperError(
+                        "Dare2Compete is currently blocking requests.",
+                        status_code=503
+                    )
+                
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        data = await source_retries.call_async('dare2compete', _get_opportunities)
         
         # Extract jobs from response
         jobs = data.get('data', {}).get('data', [])
@@ -72,31 +86,54 @@ def scrape_dare2compete(opportunity_type='internships', page='1'):
         current_page_num = int(page) if page.isdigit() else 1
         total_pages = data.get('data', {}).get('last_page', 1)
         
-        return ResponseHelper.success_response('Success scraping Dare2Compete', {
+        return {
             'jobs': results,
             'pagination': {
                 'current_page': current_page_num,
                 'last_page': total_pages,
                 'next_page': current_page_num + 1 if current_page_num < total_pages else None
             }
-        })
+        }
         
+    except ScraperError:
+        raise
+
+    except asyncio.TimeoutError:
+        raise ScraperError(
+            "Dare2Compete request timed out.",
+            status_code=504
+        )
+
     except Exception as e:
         error_msg = str(e)
         
         if "403" in error_msg or "Forbidden" in error_msg:
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Dare2Compete is currently blocking requests.",
                 status_code=503
             )
         
         if "timeout" in error_msg.lower():
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Dare2Compete request timed out.",
                 status_code=504
             )
         
-        return ResponseHelper.failure_response(
+        raise ScraperError(
             f"Error scraping Dare2Compete: {error_msg}",
             status_code=500
         )
+
+
+def fetch_dare2compete_jobs(opportunity_type='internships', page='1'):
+    """
+    Blocking fetch_dare2compete_jobs_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(fetch_dare2compete_jobs_async(opportunity_type, page))
+
+
+def scrape_dare2compete(opportunity_type='internships', page='1'):
+    try:
+        return ResponseHelper.success_response('Success scraping Dare2Compete', fetch_dare2compete_jobs(opportunity_type, page))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
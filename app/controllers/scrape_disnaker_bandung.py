@@ -1,11 +1,17 @@
 import re
 from bs4 import BeautifulSoup
 from flask import jsonify
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
 
-def scrape_disnaker_bandung(page="1"):
+@source_cache.cached('disnaker_bandung')
+def fetch_disnaker_bandung_jobs(page="1"):
+    """
+    Fetch Disnaker Bandung jobs as plain Python data, raises ScraperError on failure.
+    """
     url = f"https://disnaker.bandung.go.id/loker?page={page}"
 
     try:
@@ -13,7 +19,7 @@ def scrape_disnaker_bandung(page="1"):
         scraper = CloudScraper.get_instance()
 
         # Kirim permintaan ke URL
-        response = scraper.get(url)
+        response = get_with_retries('disnaker_bandung', scraper, url)
         response.raise_for_status()
         html = response.text
 
@@ -111,31 +117,43 @@ def scrape_disnaker_bandung(page="1"):
             and total_pages == 0
             and total_results == 0
         ):
-            return ResponseHelper.success_response(
-                "No more data available.",
-                {
-                    "jobs": [],
-                    "total_results": 0,
-                    "showing_start": 0,
-                    "showing_end": 0,
-                    "total_pages": 0,
-                    "current_page": int(page),
-                    "is_last_page": True,
-                },
-            )
-
-        return ResponseHelper.success_response(
-            "Success scraping Disnaker Bandung jobs",
-            {
-                "jobs": results,
-                "total_results": total_results,
-                "showing_start": showing_start,
-                "showing_end": showing_end,
-                "total_pages": total_pages,
+            return {
+                "jobs": [],
+                "total_results": 0,
+                "showing_start": 0,
+                "showing_end": 0,
+                "total_pages": 0,
                 "current_page": int(page),
-                "is_last_page": showing_end == total_results,
-            },
-        )
-
+                "is_last_page": True,
+            }
+
+        return {
+            "jobs": results,
+            "total_results": total_results,
+            "showing_start": showing_start,
+            "showing_end": showing_end,
+            "total_pages": total_pages,
+            "current_page": int(page),
+            "is_last_page": showing_end == total_results,
+        }
+
+    except ScraperError:
+        raise
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}")
+        raise ScraperError(f"Error: {str(e)}")
+
+
+def scrape_disnaker_bandung(page="1"):
+    try:
+        data = fetch_disnaker_bandung_jobs(page)
+        message = (
+            "No more data available."
+            if data["showing_start"] == 0
+            and data["showing_end"] == 0
+            and data["total_pages"] == 0
+            and data["total_results"] == 0
+            else "Success scraping Disnaker Bandung jobs"
+        )
+        return ResponseHelper.success_response(message, data)
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -1,11 +1,15 @@
 from bs4 import BeautifulSoup
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
 
-def scrape_freshersworld(keyword='', location='bangalore', limit='50'):
+@source_cache.cached('freshersworld')
+def fetch_freshersworld_jobs(keyword='', location='bangalore', limit='50'):
     """
-    Scrape jobs from FreshersWorld
+    Fetch jobs from FreshersWorld as plain Python data.
+    Raises ScraperError on failure.
     """
     
     url = f'https://www.freshersworld.com/jobs/jobsearch?txt={keyword}&limit={limit}'
@@ -18,7 +22,7 @@ def scrape_freshersworld(keyword='', location='bangalore', limit='50'):
             'Referer': 'https://www.freshersworld.com/'
         }
         
-        response = scraper.get(url, headers=headers, timeout=30)
+        response = get_with_retries('freshersworld', scraper, url, headers=headers, timeout=30)
         response.raise_for_status()
         
         page_soup = BeautifulSoup(response.text, 'html.parser')
@@ -93,10 +97,22 @@ def scrape_freshersworld(keyword='', location='bangalore', limit='50'):
             except Exception as e:
                 continue
         
-        return ResponseHelper.success_response('Success scraping FreshersWorld', {
+        return {
             'jobs': results,
             'pagination': {'current_page': 1, 'last_page': 1, 'next_page': None}
-        })
+        }
         
+    except ScraperError:
+        raise
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}", status_code=500)
+        raise ScraperError(f"Error: {str(e)}", status_code=500)
+
+
+def scrape_freshersworld(keyword='', location='bangalore', limit='50'):
+    """
+    Scrape jobs from FreshersWorld
+    """
+    try:
+        return ResponseHelper.success_response('Success scraping FreshersWorld', fetch_freshersworld_jobs(keyword, location, limit))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
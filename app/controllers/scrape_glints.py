@@ -1,9 +1,15 @@
 import re
 from bs4 import BeautifulSoup
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper  
 
-def scrape_glints(work='Programmer', job_type='FULL_TIME', option_work='ONSITE',location_id='',location_name='All+Cities/Provinces',page='1',cookies_file='app/config/glints.json'):
+@source_cache.cached('glints')
+def fetch_glints_jobs(work='Programmer', job_type='FULL_TIME', option_work='ONSITE',location_id='',location_name='All+Cities/Provinces',page='1',cookies_file='app/config/glints.json'):
+    """
+    Fetch Glints jobs as plain Python data, raises ScraperError on failure.
+    """
      # Validasi parameter
     valid_job_types = ['FULL_TIME', 'PART_TIME', 'CONTRACT', 'INTERNSHIP']
     valid_work_options = ['ONSITE', 'HYBRID', 'REMOTE']
@@ -11,23 +17,23 @@ def scrape_glints(work='Programmer', job_type='FULL_TIME', option_work='ONSITE',
     valid_location_id = ['','JABODETABEK','82f248c3-3fb3-4600-98fe-4afb47d7558d','06c9e480-42e7-4f11-9d6c-67ad64ccc0f6','78d63064-78a1-4577-8516-036a6c5e903e','078b37b2-e791-4739-958e-c29192e5df3e','af0ed74f-1b51-43cf-a14c-459996e39105','ae3c458e-5947-4833-8f1b-e001ce2fad1d','ea61f4ac-5864-4b2b-a2c8-aa744a2aafea','86a3dc56-1bd7-4cd3-8225-d3e4b976e552']
 
     if job_type not in valid_job_types:
-        return ResponseHelper.failure_response(f"Invalid job_type: {job_type}. Valid options: {valid_job_types}")
+        raise ScraperError(f"Invalid job_type: {job_type}. Valid options: {valid_job_types}")
 
     if option_work not in valid_work_options:
-        return ResponseHelper.failure_response(f"Invalid option_work: {option_work}. Valid options: {valid_work_options}")
+        raise ScraperError(f"Invalid option_work: {option_work}. Valid options: {valid_work_options}")
 
     if location_id not in valid_location_id:
-        return ResponseHelper.failure_response(f"Invalid location_id: {location_id}. Valid options: {valid_location_id}") 
+        raise ScraperError(f"Invalid location_id: {location_id}. Valid options: {valid_location_id}") 
 
     if location_name not in valid_location_name:
-        return ResponseHelper.failure_response(f"Invalid location_name: {location_name}. Valid options: {valid_location_name}")    
+        raise ScraperError(f"Invalid location_name: {location_name}. Valid options: {valid_location_name}")    
 
     try:
         page = int(page)
         if page <= 0:
-            return ResponseHelper.failure_response("Page must be a positive integer.")
+            raise ScraperError("Page must be a positive integer.")
     except ValueError:
-        return ResponseHelper.failure_response("Invalid page parameter. Must be an integer.")
+        raise ScraperError("Invalid page parameter. Must be an integer.")
 
     url = (
         f"https://glints.com/id/opportunities/jobs/explore?"
@@ -39,7 +45,7 @@ def scrape_glints(work='Programmer', job_type='FULL_TIME', option_work='ONSITE',
         scraper = CloudScraper.get_instance(cookies_file)
 
         # Kirim permintaan ke URL
-        response = scraper.get(url)
+        response = get_with_retries('glints', scraper, url)
         response.raise_for_status()
         html = response.text
 
@@ -168,12 +174,23 @@ def scrape_glints(work='Programmer', job_type='FULL_TIME', option_work='ONSITE',
         print(f"Successfully scraped {len(results)} unique jobs (removed duplicates)")
 
         # Tambahkan informasi halaman terakhir ke dalam hasil
-        return ResponseHelper.success_response('Success find job', {
+        return {
             'jobs': results,
             'total_jobs': len(results),
             'duplicates_removed': len(job_cards) - len(results) if job_cards else 0
-        })
+        }
 
+    except ScraperError:
+        raise
     except Exception as e:
         print(f"Error in scraping: {str(e)}")
-        return ResponseHelper.failure_response(f"Error: {str(e)}")
\ No newline at end of file
+        raise ScraperError(f"Error: {str(e)}")
+
+
+def scrape_glints(work='Programmer', job_type='FULL_TIME', option_work='ONSITE',location_id='',location_name='All+Cities/Provinces',page='1',cookies_file='app/config/glints.json'):
+    try:
+        return ResponseHelper.success_response('Success find job', fetch_glints_jobs(
+            work, job_type, option_work, location_id, location_name, page, cookies_file
+        ))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
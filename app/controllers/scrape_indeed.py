@@ -1,10 +1,14 @@
 import re
 from bs4 import BeautifulSoup
 from flask import jsonify
-from app.helpers.response import ResponseHelper
+from app.helpers.pages import fetch_pages, page_count
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
-def scrape_indeed(keyword='programmer', location='', country='id', page=''):
+@source_cache.cached('indeed')
+def fetch_indeed_jobs(keyword='programmer', location='', country='id', page=''):
     country_urls = {
         "id": "https://id.indeed.com/jobs?q={keyword}&l={location}{page_param}",
         "nl": "https://nl.indeed.com/jobs?q={keyword}&l={location}{page_param}",
@@ -57,11 +61,11 @@ def scrape_indeed(keyword='programmer', location='', country='id', page=''):
         }
         
         # Kirim permintaan ke URL with better headers
-        response = scraper.get(url, headers=headers, timeout=30)
+        response = get_with_retries('indeed', scraper, url, headers=headers, timeout=30)
         
         # Check for blocking
         if response.status_code == 403:
-            return ResponseHelper.failure_response("Indeed is currently blocking requests. Please try other job sources.", status_code=503)
+            raise ScraperError("Indeed is currently blocking requests. Please try other job sources.", status_code=503)
         
         response.raise_for_status()
         html = response.text
@@ -153,31 +157,56 @@ def scrape_indeed(keyword='programmer', location='', country='id', page=''):
         current_page = int(page)
         next_page = int(page) + 10 if page.isdigit() and int(page) + 10 < last_page * 10 else None
 
-        return ResponseHelper.success_response('Success scraping Indeed jobs', {
+        return {
             'jobs': results,
             'pagination': {
                 'current_page': current_page,
                 'last_page': last_page,
                 'next_page': next_page
             }
-        })
+        }
+
+    except ScraperError:
+        raise
 
     except Exception as e:
         error_msg = str(e)
         
         # Check if it's a 403 blocking error
         if "403" in error_msg or "Forbidden" in error_msg:
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Indeed is currently blocking requests. Please try other job sources (Jobstreet, RemoteOK).",
                 status_code=503
             )
         
         # Check if it's a timeout
         if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Indeed request timed out. Please try again or use other job sources.",
                 status_code=504
             )
         
         # General error
-        return ResponseHelper.failure_response(f"Error scraping Indeed: {error_msg}", status_code=500)
\ No newline at end of file
+        raise ScraperError(f"Error scraping Indeed: {error_msg}", status_code=500)
+
+
+@source_cache.cached('indeed')
+def fetch_indeed_pages(keyword='programmer', location='', country='id', page='0', pages=1):
+    """
+    Fetch `pages` consecutive result pages (Indeed pages by `start` offset, 10 per page)
+    concurrently, merged in order and de-duplicated. Raises ScraperError if the first page fails.
+    """
+    start = int(page) if str(page).isdigit() else 0
+    offsets = [str(start + 10 * i) for i in range(page_count(pages))]
+    return fetch_pages(lambda offset: fetch_indeed_jobs.uncached(keyword, location, country, offset), offsets)
+
+
+def scrape_indeed(keyword='programmer', location='', country='id', page='', pages=1):
+    try:
+        if pages > 1:
+            data = fetch_indeed_pages(keyword, location, country, page, pages)
+        else:
+            data = fetch_indeed_jobs(keyword, location, country, page)
+        return ResponseHelper.success_response('Success scraping Indeed jobs', data)
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -1,13 +1,18 @@
 import re
 from bs4 import BeautifulSoup
 from flask import jsonify
-from app.helpers.response import ResponseHelper
+from app.helpers.pages import fetch_pages, page_count
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
 
-def scrape_internshala(keyword='developer', location='bangalore', page='1'):
+@source_cache.cached('internshala')
+def fetch_internshala_jobs(keyword='developer', location='bangalore', page='1'):
     """
     Scrape internships from Internshala
+    Returns plain Python data, raises ScraperError on failure.
     
     Args:
         keyword: Search keyword (e.g., 'developer', 'python', 'design')
@@ -44,11 +49,11 @@ def scrape_internshala(keyword='developer', location='bangalore', page='1'):
         }
         
         # Send request
-        response = scraper.get(url, headers=headers, timeout=30)
+        response = get_with_retries('internshala', scraper, url, headers=headers, timeout=30)
         
         # Check for blocking
         if response.status_code == 403:
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Internshala is currently blocking requests. Please try again later.",
                 status_code=503
             )
@@ -220,34 +225,59 @@ def scrape_internshala(keyword='developer', location='bangalore', page='1'):
         
         next_page = current_page_num + 1 if current_page_num < last_page else None
         
-        return ResponseHelper.success_response('Success scraping Internshala internships', {
+        return {
             'jobs': results,
             'pagination': {
                 'current_page': current_page_num,
                 'last_page': last_page,
                 'next_page': next_page
             }
-        })
+        }
         
+    except ScraperError:
+        raise
+
     except Exception as e:
         error_msg = str(e)
         
         # Check if it's a 403 blocking error
         if "403" in error_msg or "Forbidden" in error_msg:
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Internshala is currently blocking requests. Please try other sources.",
                 status_code=503
             )
         
         # Check if it's a timeout
         if "timeout" in error_msg.lower() or "timed out" in error_msg.lower():
-            return ResponseHelper.failure_response(
+            raise ScraperError(
                 "Internshala request timed out. Please try again.",
                 status_code=504
             )
         
         # General error
-        return ResponseHelper.failure_response(
+        raise ScraperError(
             f"Error scraping Internshala: {error_msg}",
             status_code=500
         )
+
+
+@source_cache.cached('internshala')
+def fetch_internshala_pages(keyword='developer', location='bangalore', page='1', pages=1):
+    """
+    Fetch `pages` consecutive result pages concurrently, merged in order and
+    de-duplicated. Raises ScraperError if the first page fails.
+    """
+    first = int(page) if str(page).isdigit() else 1
+    numbers = [str(first + i) for i in range(page_count(pages))]
+    return fetch_pages(lambda number: fetch_internshala_jobs.uncached(keyword, location, number), numbers)
+
+
+def scrape_internshala(keyword='developer', location='bangalore', page='1', pages=1):
+    try:
+        if pages > 1:
+            data = fetch_internshala_pages(keyword, location, page, pages)
+        else:
+            data = fetch_internshala_jobs(keyword, location, page)
+        return ResponseHelper.success_response('Success scraping Internshala internships', data)
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
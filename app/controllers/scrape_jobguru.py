@@ -1,12 +1,20 @@
-import requests
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
 from html import unescape
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import source_retries
+from app.services.source_cache import source_cache
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
 
 
-def scrape_jobguru():
+@source_cache.cached_async('jobguru')
+async def fetch_jobguru_jobs_async():
     """
-    Scrape jobs from JobGuru (uses their API)
+    Fetch jobs from JobGuru (uses their API) as plain Python data.
+    Runs on the AsyncRuntime loop with the shared HTTP client. Raises ScraperError on failure.
     """
     
     url = 'https://www.jobguru.in/jobs_response.php'
@@ -17,10 +25,16 @@ def scrape_jobguru():
             'Referer': 'https://www.jobguru.in/'
         }
         
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        session = await AsyncHttpClient.get_instance().get_session()
+
+        async def _get_jobs():
+            await host_rate_limiter.acquire_async(url)
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        data = await source_retries.call_async('jobguru', _get_jobs)
         
-        data = response.json()
         jobs = data.get('jobs', [])
         
         print(f"🔍 Found {len(jobs)} jobs from JobGuru")
@@ -63,10 +77,31 @@ def scrape_jobguru():
             except Exception as e:
                 continue
         
-        return ResponseHelper.success_response('Success scraping JobGuru', {
+        return {
             'jobs': results,
             'pagination': {'current_page': 1, 'last_page': 1, 'next_page': None}
-        })
+        }
         
+    except ScraperError:
+        raise
+    except asyncio.TimeoutError:
+        raise ScraperError("JobGuru request timed out.", status_code=504)
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}", status_code=500)
+        raise ScraperError(f"Error: {str(e)}", status_code=500)
+
+
+def fetch_jobguru_jobs():
+    """
+    Blocking fetch_jobguru_jobs_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(fetch_jobguru_jobs_async())
+
+
+def scrape_jobguru():
+    """
+    Scrape jobs from JobGuru (uses their API)
+    """
+    try:
+        return ResponseHelper.success_response('Success scraping JobGuru', fetch_jobguru_jobs())
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -1,17 +1,23 @@
 import re
 from bs4 import BeautifulSoup
 from flask import jsonify
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
 
-def scrape_jobstreet(
+@source_cache.cached('jobstreet')
+def fetch_jobstreet_jobs(
     work="Programmer",
     location="",
     country="id",
     page=1,
     cookies_file="app/config/jobstreet.json",
 ):
+    """
+    Fetch JobStreet jobs as plain Python data, raises ScraperError on failure.
+    """
     country_urls = {
         "id": "https://id.jobstreet.com/id/{work}-jobs/in-{location}?page={page}",
         "my": "https://my.jobstreet.com/{work}-jobs/in-{location}?page={page}",
@@ -30,7 +36,7 @@ def scrape_jobstreet(
         scraper = CloudScraper.get_instance()
 
         # Kirim permintaan ke URL
-        response = scraper.get(url)
+        response = get_with_retries('jobstreet', scraper, url)
         response.raise_for_status()
         html = response.text
 
@@ -153,19 +159,34 @@ def scrape_jobstreet(
                     }
                 )
 
-        return ResponseHelper.success_response(
-            "Success find job",
-            {
-                "total_jobs": total_jobs,
-                "jobs": results,
-                "pagination": {
-                    "current_page": current_page,
-                    "last_page": last_page,
-                    "has_next": has_next,
-                },
-                "suggestion_location": suggestion_location,
+        return {
+            "total_jobs": total_jobs,
+            "jobs": results,
+            "pagination": {
+                "current_page": current_page,
+                "last_page": last_page,
+                "has_next": has_next,
             },
-        )
+            "suggestion_location": suggestion_location,
+        }
 
+    except ScraperError:
+        raise
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}")
+        raise ScraperError(f"Error: {str(e)}")
+
+
+def scrape_jobstreet(
+    work="Programmer",
+    location="",
+    country="id",
+    page=1,
+    cookies_file="app/config/jobstreet.json",
+):
+    try:
+        return ResponseHelper.success_response(
+            "Success find job",
+            fetch_jobstreet_jobs(work, location, country, page, cookies_file),
+        )
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -4,9 +4,38 @@ Full Selenium-based implementation
 """
 
 from flask import jsonify
+from app.helpers.response import ScraperError
+from app.services.source_cache import source_cache
 from app.providers.linkedin_scraper import scrape_linkedin_route
 
 
+@source_cache.cached('linkedin')
+def fetch_linkedin_result(keyword, location='', limit=25):
+    """
+    The scraper's successful result ({'status', 'message', 'data': {'jobs': [...], ...}}), unchanged.
+    Raises ScraperError when the scraper reports a failure.
+    """
+    result = scrape_linkedin_route(keyword, location, filters=None, limit=int(limit))
+
+    if result['status'] != 'success':
+        raise ScraperError(result['message'], status_code=503)
+
+    return result
+
+
+def fetch_linkedin_jobs(keyword, location='', limit=25):
+    """
+    Fetch LinkedIn jobs as plain Python data ({'jobs': [...], ...}).
+    Raises ScraperError when the scraper reports a failure.
+    """
+    return fetch_linkedin_result(keyword, location, limit)['data']
+
+
+# Same cache entry as fetch_linkedin_result, for the pre-warming scheduler
+fetch_linkedin_jobs.refresh = lambda *args, **kwargs: fetch_linkedin_result.refresh(*args, **kwargs)['data']
+fetch_linkedin_jobs.peek = lambda *args, **kwargs: (fetch_linkedin_result.peek(*args, **kwargs) or {}).get('data')
+
+
 def scrape_linkedin(keyword, location='', limit=25):
     """
     Scrape LinkedIn jobs using Selenium
@@ -22,13 +51,17 @@ def scrape_linkedin(keyword, location='', limit=25):
     
     try:
         # Call the scraper
-        result = scrape_linkedin_route(keyword, location, filters=None, limit=int(limit))
+        result = fetch_linkedin_result(keyword, location, limit)
         
-        if result['status'] == 'success':
-            return jsonify(result), 200
-        else:
-            return jsonify(result), 503
+        return jsonify(result), 200
         
+    except ScraperError as e:
+        return jsonify({
+            "status": "failed",
+            "message": e.message,
+            "data": {"jobs": []}
+        }), e.status_code
+
     except Exception as e:
         return jsonify({
             "status": "failed",
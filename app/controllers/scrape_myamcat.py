@@ -1,73 +1,132 @@
-import requests
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
-from app.helpers.response import ResponseHelper
+from typing import Any, Dict, List, Optional
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import source_retries
+from app.services.source_cache import source_cache
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
 
 
-def scrape_myamcat(start_limit='117', max_pages=3):
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/json',
+    'X-Requested-With': 'XMLHttpRequest',
+    'Referer': 'https://www.myamcat.com/jobs'
+}
+
+
+def _html_to_text_batch(fragments: List[str]) -> List[str]:
     """
-    Scrape jobs from MyAmcat (uses their AJAX API)
+    Plain text of many HTML fragments with a single lxml parse: each fragment
+    is wrapped in its own element and read back in order. Falls back to one
+    parse per fragment if broken markup merged, nested or split the wrappers.
+    """
+    document = ''.join(f'<jobdesc>{fragment}</jobdesc>' for fragment in fragments)
+    nodes = BeautifulSoup(document, 'lxml').find_all('jobdesc')
+    if len(nodes) != len(fragments) or any(node.find('jobdesc') is not None for node in nodes):
+        nodes = [BeautifulSoup(fragment, 'lxml') for fragment in fragments]
+    return [' '.join(node.stripped_strings).replace('\xa0', ' ') for node in nodes]
+
+
+async def _fetch_page(session: aiohttp.ClientSession, i: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Jobs on one page, None if the page failed. ScraperError (e.g. RateLimitExceeded) propagates.
+    """
+    url = f'https://www.myamcat.com/jobs-search-ajax?strEventID=1&strCompanyID=&strMinSalary=0&strMaxSalary=9900000&strStartLimit=0&strKeyword=&strAdvCategoryName=0&strAdvLocationID=0&strAdvSectorID=&strAdvFlagID=0&sortBy=2&strJobRolesList=&strCompaniesList=&strInvitedJobs=0&strFreeSearchText=0&strHeaderJobSearchLocation=&_=1524471212{i}'
+
+    async def _get_page():
+        await host_rate_limiter.acquire_async(url)
+        async with session.get(url, headers=HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    try:
+        data = await source_retries.call_async('myamcat', _get_page)
+        return [job for job in data.get('1', []) if isinstance(job, dict)]
+    except ScraperError:
+        raise
+    except Exception as e:
+        print(f"⚠️ Error fetching page {i}: {str(e)}")
+        return None
+
+
+@source_cache.cached_async('myamcat')
+async def fetch_myamcat_jobs_async(start_limit='117', max_pages=3):
+    """
+    Fetch jobs from MyAmcat (uses their AJAX API) as plain Python data.
+    All pages are requested at once and their descriptions converted to text in one batch.
+    Runs on the AsyncRuntime loop with the shared HTTP client. Raises ScraperError on failure,
+    including when every page failed (so an empty result is never cached).
     """
     
     try:
-        results = []
+        session = await AsyncHttpClient.get_instance().get_session()
+        first = int(start_limit)
+        # Let every page settle before surfacing a ScraperError, so none is left running
+        pages = await asyncio.gather(*[_fetch_page(session, i) for i in range(first, first + int(max_pages))],
+                                     return_exceptions=True)
+        for page in pages:
+            if isinstance(page, BaseException):
+                raise page
+        if all(page is None for page in pages):
+            raise ScraperError('Error: every MyAmcat page failed', status_code=502)
+        jobs = [job for page in pages if page is not None for job in page]
         
-        for i in range(int(start_limit), int(start_limit) + max_pages):
-            url = f'https://www.myamcat.com/jobs-search-ajax?strEventID=1&strCompanyID=&strMinSalary=0&strMaxSalary=9900000&strStartLimit=0&strKeyword=&strAdvCategoryName=0&strAdvLocationID=0&strAdvSectorID=&strAdvFlagID=0&sortBy=2&strJobRolesList=&strCompaniesList=&strInvitedJobs=0&strFreeSearchText=0&strHeaderJobSearchLocation=&_=1524471212{i}'
+        # One HTML parse for every description, off the event loop
+        descriptions = await asyncio.to_thread(
+            _html_to_text_batch, [str(job.get('description') or '') for job in jobs]
+        )
+        
+        results = []
+        for job, description in zip(jobs, descriptions):
+            # Build link
+            jd_link = job.get('jdLink', '')
+            link = 'https://www.myamcat.com' + jd_link if jd_link else 'N/A'
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'application/json',
-                'X-Requested-With': 'XMLHttpRequest',
-                'Referer': 'https://www.myamcat.com/jobs'
-            }
+            # Min job experience
+            min_exp = job.get('minJobEx', 0)
+            experience = f"{min_exp} yrs" if min_exp else 'Fresher'
             
-            try:
-                response = requests.get(url, headers=headers, timeout=15)
-                response.raise_for_status()
-                
-                data = response.json()
-                jobs = data.get('1', [])
-                
-                for job in jobs:
-                    try:
-                        # Extract description
-                        desc_html = job.get('description', '')
-                        soup = BeautifulSoup(desc_html, 'lxml')
-                        description = ' '.join(soup.stripped_strings).replace('\xa0', ' ')
-                        
-                        # Build link
-                        jd_link = job.get('jdLink', '')
-                        link = 'https://www.myamcat.com' + jd_link if jd_link else 'N/A'
-                        
-                        # Min job experience
-                        min_exp = job.get('minJobEx', 0)
-                        experience = f"{min_exp} yrs" if min_exp else 'Fresher'
-                        
-                        results.append({
-                            'title': job.get('jobprofileName', 'N/A'),
-                            'company': job.get('companyName', 'N/A'),
-                            'location': job.get('cityName', 'India'),
-                            'salary': job.get('salary', 'Not disclosed'),
-                            'experience': experience,
-                            'description': description[:200] if description else '',
-                            'link': link,
-                            'posted_on': job.get('datePosted', 'Recently'),
-                            'source': 'MyAmcat'
-                        })
-                        
-                    except Exception as e:
-                        continue
-                        
-            except Exception as e:
-                print(f"⚠️ Error fetching page {i}: {str(e)}")
-                continue
+            results.append({
+                'title': job.get('jobprofileName', 'N/A'),
+                'company': job.get('companyName', 'N/A'),
+                'location': job.get('cityName', 'India'),
+                'salary': job.get('salary', 'Not disclosed'),
+                'experience': experience,
+                'description': description[:200] if description else '',
+                'link': link,
+                'posted_on': job.get('datePosted', 'Recently'),
+                'source': 'MyAmcat'
+            })
         
         print(f"🔍 Found {len(results)} jobs from MyAmcat")
         
-        return ResponseHelper.success_response('Success scraping MyAmcat', {
+        return {
             'jobs': results,
             'pagination': {'current_page': 1, 'last_page': 1, 'next_page': None}
-        })
+        }
         
+    except ScraperError:
+        raise
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}", status_code=500)
+        raise ScraperError(f"Error: {str(e)}", status_code=500)
+
+
+def fetch_myamcat_jobs(start_limit='117', max_pages=3):
+    """
+    Blocking fetch_myamcat_jobs_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(fetch_myamcat_jobs_async(start_limit, max_pages))
+
+
+def scrape_myamcat(start_limit='117', max_pages=3):
+    """
+    Scrape jobs from MyAmcat (uses their AJAX API)
+    """
+    try:
+        return ResponseHelper.success_response('Success scraping MyAmcat', fetch_myamcat_jobs(start_limit, max_pages))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
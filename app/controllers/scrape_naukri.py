@@ -1,7 +1,19 @@
-import requests
+import asyncio
+import math
+import os
+import aiohttp
 from datetime import datetime
-from typing import List, Dict, Any
-from app.helpers.response import ResponseHelper
+from typing import List, Dict, Any, Optional
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import RETRY_STATUSES, source_retries
+from app.services.source_cache import source_cache
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
+
+# Results per page request (bigger pages, fewer round trips) and pages fetched at once
+PAGE_SIZE = int(os.environ.get('NAUKRI_PAGE_SIZE', '50'))
+PAGE_CONCURRENCY = int(os.environ.get('NAUKRI_PAGE_CONCURRENCY', '4'))
 
 
 def _infer_remote(text: str) -> bool:
@@ -26,7 +38,42 @@ def _extract_location(placeholders: List[Dict[str, Any]]) -> str:
     return ''
 
 
-def scrape_naukri(keyword: str = 'developer', location: str = '', limit: int = 20) -> Any:
+def _parse_job(jd: Dict[str, Any], location: str) -> Optional[Dict[str, Any]]:
+    title = jd.get('title') or 'N/A'
+    company = jd.get('companyName') or 'N/A'
+    if title == 'N/A' or company == 'N/A':
+        return None
+
+    loc = _extract_location(jd.get('placeholders') or []) or location
+    created = jd.get('createdDate')
+    posted_on = _iso_date_from_epoch(created) if created else ''
+    desc = (jd.get('jobDescription') or '')
+    jd_url = jd.get('jdURL') or ''
+    link = f"https://www.naukri.com{jd_url}" if jd_url.startswith('/') else jd_url
+    is_remote = _infer_remote(f"{title} {company} {loc} {desc}")
+
+    return {
+        'title': title,
+        'company': company,
+        'location': loc,
+        'description': desc[:500],
+        'link': link or 'N/A',
+        'posted_on': posted_on or 'Recently',
+        'isRemote': is_remote,
+        'source': 'Naukri'
+    }
+
+
+@source_cache.cached_async('naukri')
+async def fetch_naukri_jobs_async(keyword: str = 'developer', location: str = '', limit: int = 20) -> Dict[str, Any]:
+    """
+    Fetch Naukri jobs as plain Python data ({'jobs': [...], 'pagination': {...}}).
+    The pages needed for `limit` are fetched concurrently (at most PAGE_CONCURRENCY
+    at a time) and merged in page order; an empty page ends the search.
+    Page 1 failing (non-200, or still erroring after retries) fails the source;
+    a later page failing ends the search and keeps the earlier pages.
+    Runs on the AsyncRuntime loop with the shared HTTP client. Raises ScraperError on failure.
+    """
     base_url = 'https://www.naukri.com/jobapi/v3/search'
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -36,68 +83,102 @@ def scrape_naukri(keyword: str = 'developer', location: str = '', limit: int = 2
     }
 
     jobs: List[Dict[str, Any]] = []
-    page = 1
-    per_page = 20
+    semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+    # Pages after the first empty one are not requested
+    last_page = {'value': float('inf')}
+
+    async def fetch_page(session: aiohttp.ClientSession, page: int) -> List[Dict[str, Any]]:
+        params = {
+            'noOfResults': PAGE_SIZE,
+            'urlType': 'search_by_keyword',
+            'searchType': 'adv',
+            'keyword': keyword,
+            'pageNo': page,
+            'seoKey': f"{(keyword or '').lower().replace(' ', '-')}-jobs",
+            'src': 'jobsearchDesk',
+            'latLong': '',
+            'location': location,
+        }
+
+        async def _get_page():
+            await host_rate_limiter.acquire_async(base_url)
+            async with session.get(base_url, headers=headers, params=params,
+                                   timeout=aiohttp.ClientTimeout(total=20)) as resp:
+                if resp.status in RETRY_STATUSES:
+                    resp.raise_for_status()
+                if resp.status != 200:
+                    if page == 1:
+                        raise ScraperError(f'Naukri HTTP {resp.status}', status_code=resp.status)
+                    return None
+                return await resp.json(content_type=None)
+
+        async with semaphore:
+            if page > last_page['value']:
+                return []
+            try:
+                data = await source_retries.call_async('naukri', _get_page)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if page == 1:
+                    raise
+                # Still failing after retries: treat as the end, keep earlier pages
+                print(f"⚠️ Naukri page {page}: {type(e).__name__}, keeping earlier pages")
+                data = None
+
+        job_details = (data or {}).get('jobDetails') or []
+        if not job_details:
+            last_page['value'] = min(last_page['value'], page - 1)
+        return job_details
 
     try:
-        while len(jobs) < limit:
-            params = {
-                'noOfResults': per_page,
-                'urlType': 'search_by_keyword',
-                'searchType': 'adv',
-                'keyword': keyword,
-                'pageNo': page,
-                'seoKey': f"{(keyword or '').lower().replace(' ', '-')}-jobs",
-                'src': 'jobsearchDesk',
-                'latLong': '',
-                'location': location,
-            }
-
-            resp = requests.get(base_url, headers=headers, params=params, timeout=20)
-            if resp.status_code != 200:
-                break
-            data = resp.json()
-            job_details = data.get('jobDetails') or []
-            if not job_details:
-                break
-
-            for jd in job_details:
-                title = jd.get('title') or 'N/A'
-                company = jd.get('companyName') or 'N/A'
-                loc = _extract_location(jd.get('placeholders') or []) or location
-                created = jd.get('createdDate')
-                posted_on = _iso_date_from_epoch(created) if created else ''
-                desc = (jd.get('jobDescription') or '')
-                jd_url = jd.get('jdURL') or ''
-                link = f"https://www.naukri.com{jd_url}" if jd_url.startswith('/') else jd_url
-                is_remote = _infer_remote(f"{title} {company} {loc} {desc}")
-
-                if title == 'N/A' or company == 'N/A':
-                    continue
-
-                jobs.append({
-                    'title': title,
-                    'company': company,
-                    'location': loc,
-                    'description': desc[:500],
-                    'link': link or 'N/A',
-                    'posted_on': posted_on or 'Recently',
-                    'isRemote': is_remote,
-                    'source': 'Naukri'
-                })
-
-                if len(jobs) >= limit:
+        session = await AsyncHttpClient.get_instance().get_session()
+        next_page = 1
+        while len(jobs) < limit and next_page <= last_page['value']:
+            # Pages still needed, assuming full pages; skipped N/A rows are topped up next round
+            pages = list(range(next_page, next_page + math.ceil((limit - len(jobs)) / PAGE_SIZE)))
+            # Let every page task finish before surfacing a failure, so none is left running
+            results = await asyncio.gather(*[fetch_page(session, page) for page in pages],
+                                           return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            next_page = pages[-1] + 1
+
+            for page, job_details in zip(pages, results):
+                if page > last_page['value']:
                     break
-
-            page += 1
-
-        return ResponseHelper.success_response('Success scraping Naukri jobs', {
-            'jobs': jobs,
+                for jd in job_details:
+                    job = _parse_job(jd, location)
+                    if job is not None:
+                        jobs.append(job)
+
+        fetched_pages = min(next_page - 1, last_page['value'])
+        return {
+            'jobs': jobs[:limit],
             'pagination': {
-                'current_page': page,
-                'last_page': page,
+                'current_page': fetched_pages,
+                'last_page': fetched_pages,
                 'next_page': None
             }
-        })
+        }
+    except ScraperError:
+        raise
+    except asyncio.TimeoutError:
+        raise ScraperError('Naukri request timed out.', status_code=504)
+    except aiohttp.ClientResponseError as e:
+        raise ScraperError(f'Naukri HTTP {e.status}', status_code=e.status)
     except Exception as e:
-        return ResponseHelper.failure_response(f'Error scraping Naukri: {str(e)}', status_code=500)
+        raise ScraperError(f'Error scraping Naukri: {str(e)}', status_code=500)
+
+
+def fetch_naukri_jobs(keyword: str = 'developer', location: str = '', limit: int = 20) -> Dict[str, Any]:
+    """
+    Blocking fetch_naukri_jobs_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(fetch_naukri_jobs_async(keyword, location, limit))
+
+
+def scrape_naukri(keyword: str = 'developer', location: str = '', limit: int = 20) -> Any:
+    try:
+        return ResponseHelper.success_response('Success scraping Naukri jobs', fetch_naukri_jobs(keyword, location, limit))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -2,14 +2,18 @@ import re
 import json
 from bs4 import BeautifulSoup
 from flask import jsonify
-from app.helpers.response import ResponseHelper
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.retry_policy import get_with_retries
+from app.services.source_cache import source_cache
 from app.singletons.cloudscraper import CloudScraper
 
 
-def scrape_remoteok(keywords="Programmer"):
+@source_cache.cached('remoteok')
+def fetch_remoteok_jobs(keywords="Programmer"):
     """
     RemoteOK provides a public JSON API at https://remoteok.com/api
     This is much more reliable than web scraping
+    Returns plain Python data, raises ScraperError on failure.
     """
     suggestions_keywords = [
         "engineer",
@@ -121,7 +125,7 @@ def scrape_remoteok(keywords="Programmer"):
         scraper = CloudScraper.get_instance()
 
         # Kirim permintaan ke API
-        response = scraper.get(api_url)
+        response = get_with_retries('remoteok', scraper, api_url)
         response.raise_for_status()
         data = response.json()
         
@@ -158,11 +162,19 @@ def scrape_remoteok(keywords="Programmer"):
                 # Skip jobs that cause errors
                 continue
 
-        return ResponseHelper.success_response(
-            "Success scraping RemoteOK jobs",
-            {"jobs": results, "suggestions_keywords": suggestions_keywords},
-        )
+        return {"jobs": results, "suggestions_keywords": suggestions_keywords}
 
+    except ScraperError:
+        raise
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}")
+        raise ScraperError(f"Error: {str(e)}")
+
+
+def scrape_remoteok(keywords="Programmer"):
+    try:
+        return ResponseHelper.success_response(
+            "Success scraping RemoteOK jobs", fetch_remoteok_jobs(keywords)
+        )
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
 
@@ -1,10 +1,18 @@
-import requests
-from app.helpers.response import ResponseHelper
+import asyncio
+import aiohttp
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import source_retries
+from app.services.source_cache import source_cache
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
 
 
-def scrape_timesjobs(location='bangalore', limit='50'):
+@source_cache.cached_async('timesjobs')
+async def fetch_timesjobs_jobs_async(location='bangalore', limit='50'):
     """
-    Scrape jobs from TimesJobs (uses their API)
+    Fetch jobs from TimesJobs (uses their API) as plain Python data.
+    Runs on the AsyncRuntime loop with the shared HTTP client. Raises ScraperError on failure.
     """
     
     # TimesJobs API endpoint
@@ -29,10 +37,16 @@ def scrape_timesjobs(location='bangalore', limit='50'):
             'Referer': 'https://www.timesjobs.com/'
         }
         
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        session = await AsyncHttpClient.get_instance().get_session()
+
+        async def _get_jobs():
+            await host_rate_limiter.acquire_async(url)
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        data = await source_retries.call_async('timesjobs', _get_jobs)
         
-        data = response.json()
         jobs = data.get('jobsList', [])
         
         print(f"🔍 Found {len(jobs)} jobs from TimesJobs")
@@ -66,10 +80,31 @@ def scrape_timesjobs(location='bangalore', limit='50'):
             except Exception as e:
                 continue
         
-        return ResponseHelper.success_response('Success scraping TimesJobs', {
+        return {
             'jobs': results,
             'pagination': {'current_page': 1, 'last_page': 1, 'next_page': None}
-        })
+        }
         
+    except ScraperError:
+        raise
+    except asyncio.TimeoutError:
+        raise ScraperError("TimesJobs request timed out.", status_code=504)
     except Exception as e:
-        return ResponseHelper.failure_response(f"Error: {str(e)}", status_code=500)
+        raise ScraperError(f"Error: {str(e)}", status_code=500)
+
+
+def fetch_timesjobs_jobs(location='bangalore', limit='50'):
+    """
+    Blocking fetch_timesjobs_jobs_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(fetch_timesjobs_jobs_async(location, limit))
+
+
+def scrape_timesjobs(location='bangalore', limit='50'):
+    """
+    Scrape jobs from TimesJobs (uses their API)
+    """
+    try:
+        return ResponseHelper.success_response('Success scraping TimesJobs', fetch_timesjobs_jobs(location, limit))
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
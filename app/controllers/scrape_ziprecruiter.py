@@ -1,7 +1,14 @@
-import requests
+import asyncio
+import aiohttp
 from datetime import datetime
 from typing import List, Dict, Any
-from app.helpers.response import ResponseHelper
+from app.helpers.pages import fetch_pages_async, page_count
+from app.helpers.response import ResponseHelper, ScraperError
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import RETRY_STATUSES, source_retries
+from app.services.source_cache import source_cache
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
 
 
 def _map_country(code: str) -> str:
@@ -12,7 +19,12 @@ def _map_country(code: str) -> str:
     return code or ''
 
 
-def scrape_ziprecruiter(search_term: str = '', location: str = '', distance: int = 50, job_type: str = '', is_remote: bool = False, hours_old: int = 96, page: int = 1) -> Any:
+@source_cache.cached_async('ziprecruiter')
+async def fetch_ziprecruiter_jobs_async(search_term: str = '', location: str = '', distance: int = 50, job_type: str = '', is_remote: bool = False, hours_old: int = 96, page: int = 1) -> Dict[str, Any]:
+    """
+    Fetch ZipRecruiter jobs as plain Python data ({'jobs': [...], 'pagination': {...}}).
+    Runs on the AsyncRuntime loop with the shared HTTP client. Raises ScraperError on failure.
+    """
     base_url = 'https://api.ziprecruiter.com/jobs-app/jobs'
     params: Dict[str, Any] = {}
 
@@ -37,10 +49,18 @@ def scrape_ziprecruiter(search_term: str = '', location: str = '', distance: int
     params['page'] = str(page)
 
     try:
-        resp = requests.get(base_url, params=params, timeout=20)
-        if resp.status_code != 200:
-            return ResponseHelper.failure_response(f'ZipRecruiter HTTP {resp.status_code}', status_code=resp.status_code)
-        data = resp.json() or {}
+        session = await AsyncHttpClient.get_instance().get_session()
+
+        async def _get_jobs():
+            await host_rate_limiter.acquire_async(base_url)
+            async with session.get(base_url, params=params, timeout=aiohttp.ClientTimeout(total=20)) as resp:
+                if resp.status in RETRY_STATUSES:
+                    resp.raise_for_status()
+                if resp.status != 200:
+                    raise ScraperError(f'ZipRecruiter HTTP {resp.status}', status_code=resp.status)
+                return await resp.json(content_type=None) or {}
+
+        data = await source_retries.call_async('ziprecruiter', _get_jobs)
         job_posts = data.get('jobs') or []
         jobs: List[Dict[str, Any]] = []
 
@@ -77,13 +97,61 @@ def scrape_ziprecruiter(search_term: str = '', location: str = '', distance: int
                 'source': 'ZipRecruiter'
             })
 
-        return ResponseHelper.success_response('Success scraping ZipRecruiter jobs', {
+        return {
             'jobs': jobs,
             'pagination': {
                 'current_page': page,
                 'last_page': page,
                 'next_page': None
             }
-        })
+        }
+    except ScraperError:
+        raise
+    except aiohttp.ClientResponseError as e:
+        raise ScraperError(f'ZipRecruiter HTTP {e.status}', status_code=e.status)
+    except asyncio.TimeoutError:
+        raise ScraperError('ZipRecruiter request timed out.', status_code=504)
     except Exception as e:
-        return ResponseHelper.failure_response(f'Error scraping ZipRecruiter: {str(e)}', status_code=500)
+        raise ScraperError(f'Error scraping ZipRecruiter: {str(e)}', status_code=500)
+
+
+def fetch_ziprecruiter_jobs(search_term: str = '', location: str = '', distance: int = 50, job_type: str = '', is_remote: bool = False, hours_old: int = 96, page: int = 1) -> Dict[str, Any]:
+    """
+    Blocking fetch_ziprecruiter_jobs_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(
+        fetch_ziprecruiter_jobs_async(search_term, location, distance, job_type, is_remote, hours_old, page)
+    )
+
+
+@source_cache.cached_async('ziprecruiter')
+async def fetch_ziprecruiter_pages_async(search_term: str = '', location: str = '', distance: int = 50, job_type: str = '', is_remote: bool = False, hours_old: int = 96, page: int = 1, pages: int = 1) -> Dict[str, Any]:
+    """
+    Fetch `pages` consecutive result pages concurrently, merged in order and
+    de-duplicated. Raises ScraperError if the first page fails.
+    """
+    numbers = [page + i for i in range(page_count(pages))]
+    return await fetch_pages_async(
+        lambda number: fetch_ziprecruiter_jobs_async.uncached(search_term, location, distance, job_type, is_remote, hours_old, number),
+        numbers
+    )
+
+
+def fetch_ziprecruiter_pages(search_term: str = '', location: str = '', distance: int = 50, job_type: str = '', is_remote: bool = False, hours_old: int = 96, page: int = 1, pages: int = 1) -> Dict[str, Any]:
+    """
+    Blocking fetch_ziprecruiter_pages_async for sync callers (Flask routes)
+    """
+    return AsyncRuntime.get_instance().run(
+        fetch_ziprecruiter_pages_async(search_term, location, distance, job_type, is_remote, hours_old, page, pages)
+    )
+
+
+def scrape_ziprecruiter(search_term: str = '', location: str = '', distance: int = 50, job_type: str = '', is_remote: bool = False, hours_old: int = 96, page: int = 1, pages: int = 1) -> Any:
+    try:
+        if pages > 1:
+            data = fetch_ziprecruiter_pages(search_term, location, distance, job_type, is_remote, hours_old, page, pages)
+        else:
+            data = fetch_ziprecruiter_jobs(search_term, location, distance, job_type, is_remote, hours_old, page)
+        return ResponseHelper.success_response('Success scraping ZipRecruiter jobs', data)
+    except ScraperError as e:
+        return ResponseHelper.failure_response(e.message, status_code=e.status_code)
@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+# Upper bound for ?pages=N on the paginated routes
+MAX_PAGES = 10
+
+# Blocking page fetches (CloudScraper sources) run here; the per-host rate limiter still applies
+_page_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='page-fetch')
+
+
+def page_count(pages: Any) -> int:
+    """
+    Number of pages to fetch for ?pages=N, clamped to 1..MAX_PAGES
+    """
+    return max(1, min(int(pages), MAX_PAGES))
+
+
+def _job_key(job: Dict[str, Any]) -> Any:
+    link = job.get('link') or ''
+    if link.startswith('http'):
+        return link
+    return ((job.get('title') or '').strip().lower(),
+            (job.get('company') or '').strip().lower(),
+            (job.get('location') or '').strip().lower())
+
+
+def merge_pages(payloads: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge fetch_* payloads of consecutive pages into one, in page order,
+    dropping jobs already seen on an earlier page (same link, or same title/company/location)
+    """
+    seen = set()
+    jobs = []
+    for payload in payloads:
+        for job in payload.get('jobs') or []:
+            key = _job_key(job)
+            if key not in seen:
+                seen.add(key)
+                jobs.append(job)
+
+    first, last = payloads[0].get('pagination') or {}, payloads[-1].get('pagination') or {}
+    return {
+        'jobs': jobs,
+        'pagination': {
+            'current_page': first.get('current_page'),
+            'last_page': last.get('last_page'),
+            'next_page': last.get('next_page')
+        }
+    }
+
+
+def _collect(pages: Sequence[Any], outcomes: List[Any]) -> Dict[str, Any]:
+    # The first page decides success; a later failing page only shortens the result
+    if isinstance(outcomes[0], BaseException):
+        raise outcomes[0]
+    payloads = []
+    for page, outcome in zip(pages, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"⚠️ Error fetching page {page}: {str(outcome)}")
+            continue
+        payloads.append(outcome)
+    return merge_pages(payloads)
+
+
+def fetch_pages(fetch_page: Callable[[Any], Dict[str, Any]], pages: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Call fetch_page(page) for every page concurrently and merge the payloads
+    """
+    futures = [_page_executor.submit(fetch_page, page) for page in pages]
+    outcomes = []
+    for future in futures:
+        try:
+            outcomes.append(future.result())
+        except Exception as e:
+            outcomes.append(e)
+    return _collect(pages, outcomes)
+
+
+async def fetch_pages_async(fetch_page: Callable[[Any], Awaitable[Dict[str, Any]]],
+                            pages: Sequence[Any]) -> Dict[str, Any]:
+    """
+    fetch_pages() for coroutine page fetchers
+    """
+    outcomes = await asyncio.gather(*[fetch_page(page) for page in pages], return_exceptions=True)
+    return _collect(pages, list(outcomes))
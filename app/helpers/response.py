@@ -15,3 +15,15 @@ class ResponseHelper:
             'status': 'failed',
             'message': message
         }), status_code
+
+
+class ScraperError(Exception):
+    """
+    Raised by the fetch_* scraper functions when a source cannot be scraped.
+    Carries the status code the Flask route should answer with.
+    """
+
+    def __init__(self, message, status_code=500):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
@@ -0,0 +1,147 @@
+from flask import Blueprint
+from app.helpers.response import ResponseHelper
+from app.services.aggregate_cache import aggregate_cache
+from app.services.circuit_breaker import source_breakers
+from app.services.prewarm import prewarm_scheduler
+from app.services.ranking_profiles import ranking_profiles
+from app.services.rate_limiter import host_rate_limiter
+from app.services.retry_policy import source_retries
+from app.services.single_flight import source_flights
+from app.services.source_cache import source_cache
+from app.services.source_latency import source_latency
+from app.singletons.async_http import AsyncHttpClient
+from app.singletons.event_loop import AsyncRuntime
+
+admin_bp = Blueprint("admin", __name__)
+
+
+@admin_bp.route("/http-pool", methods=["GET"])
+def http_pool_stats_route():
+    """
+    Shared async HTTP client stats: limits, connections created/reused and reuse ratio
+    GET /api/admin/http-pool
+    """
+    try:
+        return ResponseHelper.success_response('HTTP pool stats', AsyncHttpClient.get_instance().stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/runtime", methods=["GET"])
+def runtime_stats_route():
+    """
+    Background event loop stats: thread state, pending tasks and coroutine counters
+    GET /api/admin/runtime
+    """
+    try:
+        return ResponseHelper.success_response('Async runtime stats', AsyncRuntime.get_instance().stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/aggregate-cache", methods=["GET"])
+def aggregate_cache_stats_route():
+    """
+    Aggregate pool cache stats: entries, hits, stale hits, misses and background refreshes
+    GET /api/admin/aggregate-cache
+    """
+    try:
+        return ResponseHelper.success_response('Aggregate cache stats', aggregate_cache.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/source-cache", methods=["GET"])
+def source_cache_stats_route():
+    """
+    Per-source response cache stats: size, TTLs and hit/miss/eviction counters
+    GET /api/admin/source-cache
+    """
+    try:
+        return ResponseHelper.success_response('Source cache stats', source_cache.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/single-flight", methods=["GET"])
+def single_flight_stats_route():
+    """
+    Request coalescing stats: in-flight fetches, waiting callers and coalesced calls per source
+    GET /api/admin/single-flight
+    """
+    try:
+        return ResponseHelper.success_response('Single flight stats', source_flights.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/prewarm", methods=["GET"])
+def prewarm_stats_route():
+    """
+    Pre-warming scheduler stats: hot searches and refreshed/failed/deferred source fetches
+    GET /api/admin/prewarm
+    """
+    try:
+        return ResponseHelper.success_response('Prewarm stats', prewarm_scheduler.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/circuit-breakers", methods=["GET"])
+def circuit_breakers_route():
+    """
+    Per-source circuit breaker states: closed, open (skipped until retry_in) or half_open
+    GET /api/admin/circuit-breakers
+    """
+    try:
+        return ResponseHelper.success_response('Circuit breaker states', source_breakers.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/source-latency", methods=["GET"])
+def source_latency_route():
+    """
+    Per-source upstream latency percentiles and the adaptive timeout derived from them
+    GET /api/admin/source-latency
+    """
+    try:
+        return ResponseHelper.success_response('Source latency stats', source_latency.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/rate-limits", methods=["GET"])
+def rate_limits_route():
+    """
+    Per-host token bucket limits, queued requests and wait times
+    GET /api/admin/rate-limits
+    """
+    try:
+        return ResponseHelper.success_response('Rate limit stats', host_rate_limiter.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/retries", methods=["GET"])
+def retries_route():
+    """
+    Per-source retry counters (retries, recovered, gave up, budget exhausted) and remaining retry budget
+    GET /api/admin/retries
+    """
+    try:
+        return ResponseHelper.success_response('Retry stats', source_retries.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
+
+
+@admin_bp.route("/ranking-profiles", methods=["GET"])
+def ranking_profiles_route():
+    """
+    Available ranking profiles (weights, source bonuses, selection quotas) and the default one
+    GET /api/admin/ranking-profiles
+    """
+    try:
+        return ResponseHelper.success_response('Ranking profiles', ranking_profiles.stats())
+    except Exception as e:
+        return {"status": "failed", "message": f"Error: {str(e)}"}, 500
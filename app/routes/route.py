@@ -12,14 +12,26 @@ from app.controllers.scrape_jobguru import scrape_jobguru
 from app.controllers.scrape_timesjobs import scrape_timesjobs
 from app.controllers.scrape_myamcat import scrape_myamcat
 from app.controllers.scrape_linkedin import scrape_linkedin
-from app.controllers.aggregate_jobs import get_aggregate_jobs
+from app.controllers.aggregate_jobs import get_aggregate_jobs, stream_aggregate_jobs_response
 from app.controllers.jobspy_proxy import jobspy_search
 from app.controllers.scrape_naukri import scrape_naukri
 from app.controllers.scrape_ziprecruiter import scrape_ziprecruiter
+from app.services.prewarm import prewarm_scheduler
 
 scraper_bp = Blueprint("scraper", __name__)
 
 
+@scraper_bp.before_request
+def record_search():
+    """
+    Feed every searched (keyword, location) pair to the pre-warming scheduler (ignored unless it runs)
+    """
+    keyword = (request.args.get("keyword") or request.args.get("keywords")
+               or request.args.get("search_term") or request.args.get("work"))
+    if keyword:
+        prewarm_scheduler.record(keyword, request.args.get("location", ""))
+
+
 @scraper_bp.route("/glints", methods=["GET"])
 def scrape():
     try:
@@ -69,8 +81,9 @@ def scrape_indeed_route():
         location = request.args.get("location", "")
         country = request.args.get("country", "id")
         page = request.args.get("page", "0")
+        pages = int(request.args.get("pages", "1"))
 
-        return scrape_indeed(keyword, location, country, page)
+        return scrape_indeed(keyword, location, country, page, pages)
     except Exception as e:
         return {"status": "failed", "message": f"Error: {str(e)}"}, 500
 
@@ -91,8 +104,9 @@ def scrape_internshala_route():
         keyword = request.args.get("keyword", "developer")
         location = request.args.get("location", "bangalore")
         page = request.args.get("page", "1")
+        pages = int(request.args.get("pages", "1"))
 
-        return scrape_internshala(keyword, location, page)
+        return scrape_internshala(keyword, location, page, pages)
     except Exception as e:
         return {"status": "failed", "message": f"Error: {str(e)}"}, 500
 
@@ -189,9 +203,22 @@ def aggregate_jobs_route():
     - Analyzes and scores each job based on recency, location match, title match
     - Returns top 20 best matching jobs
     - Ensures diversity (at least 2 from each working source)
+    - ?profile= picks a ranking profile (weights and source bonuses, see /api/admin/ranking-profiles)
     """
     return get_aggregate_jobs()
 
+
+@scraper_bp.route("/aggregate/stream", methods=["GET"])
+def aggregate_jobs_stream_route():
+    """
+    Streaming job aggregator endpoint - emits each source's jobs as soon as it finishes
+    GET /api/aggregate/stream?keyword=developer&location=bangalore&format=sse|ndjson
+    
+    Every event carries the source's jobs, the running top 20 and the per-source progress.
+    A final 'done' event has the same shape as the /aggregate response.
+    """
+    return stream_aggregate_jobs_response()
+
 @scraper_bp.route("/jobspy", methods=["GET"])
 def jobspy_route():
     try:
@@ -219,7 +246,8 @@ def scrape_ziprecruiter_route():
         is_remote = request.args.get("is_remote") == 'true'
         hours_old = int(request.args.get("hours_old", "96"))
         page = int(request.args.get("page", "1"))
-        return scrape_ziprecruiter(search_term, location, distance, job_type, is_remote, hours_old, page)
+        pages = int(request.args.get("pages", "1"))
+        return scrape_ziprecruiter(search_term, location, distance, job_type, is_remote, hours_old, page, pages)
     except Exception as e:
         return {"status": "failed", "message": f"Error: {str(e)}"}, 500
 
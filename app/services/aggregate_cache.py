@@ -0,0 +1,124 @@
+"""
+Aggregate Cache
+Caches the raw candidate pool of /api/aggregate per (keyword, location)
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.job_record import JobRecord, build_records
+
+
+def normalize_key(keyword: str, location: str) -> Tuple[str, str]:
+    """
+    Case and whitespace insensitive cache key
+    """
+    return (' '.join((keyword or '').lower().split()), ' '.join((location or '').lower().split()))
+
+
+class AggregateCache:
+    """
+    TTL cache with stale-while-revalidate for aggregated candidate pools.
+    Only user-independent data is stored, so one entry serves every
+    jobTitle / workMode / maxDaysOld / profile combination through re-ranking.
+    Entries keep the pool's JobRecords (features as of fetch time) next to
+    the raw jobs, so re-ranking skips feature extraction.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, keyword: str, location: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Return (entry, state) where state is 'hit', 'stale' or 'miss'.
+        Stale entries are still returned; the caller should refresh them.
+        """
+        key = normalize_key(keyword, location)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters['misses'] += 1
+                return None, 'miss'
+
+            age = time.monotonic() - entry['stored_at']
+            if age >= self.ttl + self.stale_ttl:
+                del self._entries[key]
+                self._counters['misses'] += 1
+                return None, 'miss'
+
+            self._entries.move_to_end(key)
+            if age < self.ttl and not entry['partial']:
+                self._counters['hits'] += 1
+                return entry, 'hit'
+
+            self._counters['stale_hits'] += 1
+            return entry, 'stale'
+
+    def put(self, keyword: str, location: str, jobs: List[Dict[str, Any]],
+            sources: Dict[str, str], partial: bool = False,
+            records: Optional[List[JobRecord]] = None) -> None:
+        """
+        Store a candidate pool. Partial pools (cut off by a deadline) are
+        served as stale so the next request triggers a full refresh.
+        """
+        if not self.enabled or not jobs:
+            return
+        key = normalize_key(keyword, location)
+        with self._lock:
+            self._entries[key] = {
+                'jobs': jobs,
+                'records': records if records is not None else build_records(jobs),
+                'sources': dict(sources),
+                'partial': partial,
+                'stored_at': time.monotonic()
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def begin_refresh(self, keyword: str, location: str) -> bool:
+        """
+        Claim the background refresh for a key; False if one is already running
+        """
+        key = normalize_key(keyword, location)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._counters['refreshes'] += 1
+            return True
+
+    def end_refresh(self, keyword: str, location: str) -> None:
+        with self._lock:
+            self._refreshing.discard(normalize_key(keyword, location))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'ttl': self.ttl,
+                'stale_ttl': self.stale_ttl,
+                'max_entries': self.max_entries,
+                'entries': len(self._entries),
+                'refreshing': len(self._refreshing),
+                **self._counters
+            }
+
+
+aggregate_cache = AggregateCache(
+    ttl=float(os.environ.get('AGGREGATE_CACHE_TTL', '300')),
+    stale_ttl=float(os.environ.get('AGGREGATE_CACHE_STALE_TTL', '1800')),
+    max_entries=int(os.environ.get('AGGREGATE_CACHE_MAX_ENTRIES', '256'))
+)
@@ -0,0 +1,75 @@
+"""
+Batch Scorer
+Scores a whole candidate pool at once: per-job features are extracted into
+NumPy arrays and weighted in one vectorized pass
+"""
+
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from app.services.job_record import JobRecord
+from app.services.ranking_profiles import RankingProfile
+
+
+def _memoized(fn: Callable[[str, str], float], other: str) -> Callable[[str], float]:
+    # Pools repeat the same location and title strings a lot; score each distinct one once
+    cache: Dict[str, float] = {}
+
+    def score(value: str) -> float:
+        if value not in cache:
+            cache[value] = fn(value, other)
+        return cache[value]
+    return score
+
+
+def score_jobs(aggregator: Any, records: List[JobRecord], user_preferences: Dict[str, str],
+               profile: RankingProfile) -> np.ndarray:
+    """
+    Same scores as calling aggregator.calculate_job_score(record.job, user_preferences)
+    for every record, where profile is ranking_profiles.get(user_preferences.get('profile')):
+    the weighted sum is accumulated in the same order, so the float64 results (and
+    therefore the ranking) are identical.
+    Recency and the work-mode/URL/source features come pre-computed on the
+    records; only the location/title match depends on the user.
+    """
+    count = len(records)
+    if not count:
+        return np.zeros(0)
+
+    weights = profile.weights
+    location_score = _memoized(aggregator.calculate_location_match_score, user_preferences.get('location', ''))
+    title_score = _memoized(aggregator.calculate_job_title_match_score, user_preferences.get('jobTitle', ''))
+    source_bonus = _memoized(lambda source, _: profile.bonus_for(source), '')
+
+    recency = np.fromiter((record.recency for record in records), dtype=float, count=count)
+    locations = np.fromiter((location_score(record.location) for record in records), dtype=float, count=count)
+    titles = np.fromiter((title_score(record.title) for record in records), dtype=float, count=count)
+    remote = np.fromiter((record.is_remote for record in records), dtype=bool, count=count)
+    hybrid = np.fromiter((record.is_hybrid for record in records), dtype=bool, count=count)
+    has_url = np.fromiter((record.has_url for record in records), dtype=bool, count=count)
+    bonuses = np.fromiter((source_bonus(record.source) for record in records), dtype=float, count=count)
+
+    pref = (user_preferences.get('workMode') or '').lower()
+    onsite = ~(remote | hybrid)
+    if pref == 'remote':
+        work_mode = np.where(remote, 1.0, np.where(hybrid, 0.7, 0.3))
+    elif pref == 'hybrid':
+        work_mode = np.where(hybrid, 1.0, np.where(remote, 0.8, 0.5))
+    elif pref == 'onsite':
+        work_mode = np.where(onsite, 1.0, 0.5)
+    elif pref == 'any':
+        work_mode = np.full(count, 0.6)
+    elif pref:
+        work_mode = np.full(count, 0.5)
+    else:
+        work_mode = np.where(remote | hybrid, 0.7, 0.5)
+
+    score = np.zeros(count)
+    score += recency * weights['recency']
+    score += locations * weights['location']
+    score += titles * weights['title_match']
+    score += work_mode * weights['work_mode']
+    score += np.where(has_url, 1.0, 0.3) * weights['has_url']
+    score *= bonuses
+    return np.minimum(score, 1.0)
@@ -0,0 +1,138 @@
+"""
+Circuit Breaker
+Skips sources that keep failing instead of waiting out their timeout on every aggregate call
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# JobAggregator.progress statuses that count as a source failure / success;
+# anything else (e.g. 'cutoff' at a request deadline) says nothing about the source
+FAILURE_STATUSES = ('failed', 'timeout', 'error')
+SUCCESS_STATUSES = ('completed',)
+
+
+class CircuitBreaker:
+    """
+    Breaker for one source.
+    closed: calls pass; failure_threshold consecutive failures open it.
+    open: calls are skipped until the cooldown expires.
+    half_open: one probe call passes; success closes it, failure re-opens it
+    with a doubled cooldown (capped at max_open_seconds).
+    """
+
+    def __init__(self, failure_threshold: int, open_seconds: float, max_open_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = open_seconds
+        self.opened_at = 0.0
+        self.probing = False
+        self.counters = {'skipped': 0, 'opened': 0, 'probes': 0}
+        self.last_status = None
+
+    def allow(self, now: float) -> bool:
+        if self.state == OPEN and now - self.opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and not self.probing:
+            self.probing = True
+            self.counters['probes'] += 1
+            return True
+        if self.state == CLOSED:
+            return True
+        self.counters['skipped'] += 1
+        return False
+
+    def record(self, status: str, now: float) -> None:
+        probe = self.probing
+        self.probing = False
+        if status in SUCCESS_STATUSES:
+            self.last_status = status
+            self.state = CLOSED
+            self.failures = 0
+            self.cooldown = self.open_seconds
+        elif status in FAILURE_STATUSES:
+            self.last_status = status
+            self.failures += 1
+            if probe:
+                self.cooldown = min(self.cooldown * 2, self.max_open_seconds)
+            if probe or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.counters['opened'] += 1
+                self.state = OPEN
+                self.opened_at = now
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'consecutive_failures': self.failures,
+            'last_status': self.last_status,
+            'cooldown': self.cooldown,
+            'retry_in': round(max(0.0, self.opened_at + self.cooldown - now), 1) if self.state == OPEN else 0.0,
+            **self.counters
+        }
+
+
+class SourceBreakers:
+    """
+    Thread-safe registry of one CircuitBreaker per source
+    """
+
+    def __init__(self, failure_threshold: int, open_seconds: float, max_open_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, source: str) -> CircuitBreaker:
+        breaker = self._breakers.get(source)
+        if breaker is None:
+            breaker = self._breakers[source] = CircuitBreaker(
+                self.failure_threshold, self.open_seconds, self.max_open_seconds
+            )
+        return breaker
+
+    def allow(self, source: str) -> bool:
+        """
+        Whether the source should be called now (False while its breaker is open)
+        """
+        with self._lock:
+            return self._breaker(source).allow(time.monotonic())
+
+    def record(self, source: str, status: str) -> None:
+        """
+        Feed the source's final progress status back into its breaker
+        """
+        with self._lock:
+            self._breaker(source).record(status, time.monotonic())
+
+    def reset(self, source: str) -> None:
+        with self._lock:
+            self._breakers.pop(source, None)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'failure_threshold': self.failure_threshold,
+                'open_seconds': self.open_seconds,
+                'max_open_seconds': self.max_open_seconds,
+                'sources': {source: breaker.stats(now) for source, breaker in self._breakers.items()}
+            }
+
+
+source_breakers = SourceBreakers(
+    failure_threshold=int(os.environ.get('BREAKER_FAILURE_THRESHOLD', '3')),
+    open_seconds=float(os.environ.get('BREAKER_OPEN_SECONDS', '60')),
+    max_open_seconds=float(os.environ.get('BREAKER_MAX_OPEN_SECONDS', '900'))
+)
@@ -0,0 +1,107 @@
+"""
+Date Parser
+Turns the posted-date strings scraped from job boards into millisecond timestamps
+"""
+
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+
+RELATIVE_PATTERN = re.compile(r'(\d+)\s*(second|minute|hour|day|week|month|year)s?\s*(ago)?')
+DAYS_PATTERN = re.compile(r'(\d+)\+?\s*days?\+?\s*(ago)?')
+LAST_PATTERN = re.compile(r'last\s+(second|minute|hour|day|week|month|year)')
+
+UNIT_DELTAS = {
+    'second': timedelta(seconds=1),
+    'minute': timedelta(minutes=1),
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+    'month': timedelta(days=30),
+    'year': timedelta(days=365)
+}
+NOW_WORDS = ('just now', 'recently', 'today')
+
+# Parsed forms: ('ago', timedelta) relative to "now", ('at', ms) absolute, None unparseable
+ParsedDate = Optional[Tuple[str, object]]
+
+
+@lru_cache(maxsize=4096)
+def _parse(date_string: str) -> ParsedDate:
+    """
+    Parse a raw string once; the result does not depend on the current time, so it is cached
+    """
+    if not date_string or date_string == 'N/A' or date_string.strip() == '':
+        return None
+
+    date_lower = date_string.lower().strip()
+
+    # Handle "Just now", "Recently", "Today"
+    if date_lower in NOW_WORDS:
+        return ('ago', timedelta(0))
+
+    # Handle "Yesterday"
+    if date_lower == 'yesterday':
+        return ('ago', timedelta(days=1))
+
+    # Handle relative time: "X time ago"
+    match = RELATIVE_PATTERN.search(date_lower)
+    if match:
+        try:
+            return ('ago', UNIT_DELTAS[match.group(2)] * int(match.group(1)))
+        except OverflowError:
+            return None
+
+    # Handle "30+ days ago"
+    match = DAYS_PATTERN.search(date_lower)
+    if match:
+        try:
+            return ('ago', timedelta(days=int(match.group(1))))
+        except OverflowError:
+            return None
+
+    # Handle "last X"
+    match = LAST_PATTERN.search(date_lower)
+    if match:
+        return ('ago', UNIT_DELTAS[match.group(1)])
+
+    # Try parsing ISO date
+    try:
+        return ('at', int(datetime.fromisoformat(date_string.replace('Z', '+00:00')).timestamp() * 1000))
+    except ValueError:
+        pass
+
+    # Try standard date parsing
+    try:
+        return ('at', int(datetime.strptime(date_string, '%Y-%m-%d').timestamp() * 1000))
+    except ValueError:
+        pass
+
+    return None
+
+
+def parse_date_to_timestamp(date_string: str, now: Optional[datetime] = None) -> int:
+    """
+    Timestamp in milliseconds of a posted-date string (0 if invalid).
+    Relative dates ("2 days ago") are resolved against `now`; pass the same
+    value for a whole batch so every job is measured from one instant.
+    """
+    if not isinstance(date_string, str):
+        return 0
+    parsed = _parse(date_string)
+    if parsed is None:
+        return 0
+
+    kind, value = parsed
+    if kind == 'at':
+        return value
+    try:
+        return int(((now or datetime.now()) - value).timestamp() * 1000)
+    except (OverflowError, ValueError):
+        # e.g. "5000 years ago" falls before datetime.min
+        return 0
+
+
+def cache_info():
+    return _parse.cache_info()
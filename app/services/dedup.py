@@ -0,0 +1,177 @@
+"""
+Near-Duplicate Detection
+The same posting shows up on several sources with slightly different titles
+and locations. Jobs are shingled (title, company, location), hashed into
+MinHash signatures and bucketed with LSH, so only jobs sharing a band are
+compared; each cluster of near-duplicates keeps its best-scored job
+"""
+
+import os
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.services.gazetteer import resolve_location
+from app.services.job_record import JobRecord
+from app.services.similarity import similarity, trigram_set
+
+# Universal hashing (a * x + b) mod p; with x and a below 2^31 nothing overflows uint64
+_PRIME = (1 << 31) - 1
+SIGNATURE_CACHE_SIZE = 16384
+
+# "Acme Corp" / "Acme Corp Pvt. Ltd." / "PT Acme Tbk" are one company
+_COMPANY_NOISE = re.compile(r'\b(pvt|private|ltd|limited|inc|llc|llp|corp|corporation|co|plc|gmbh|pt|tbk)\b\.?')
+_TITLE_ABBREVIATIONS = {'sr': 'senior', 'snr': 'senior', 'jr': 'junior'}
+# Words that make two otherwise similar titles different roles ("Software Engineer I" / "II")
+_LEVEL_WORDS = frozenset({'intern', 'trainee', 'fresher', 'junior', 'associate', 'senior', 'lead',
+                          'principal', 'staff', 'head', 'chief', 'manager', 'director', 'vp',
+                          'i', 'ii', 'iii', 'iv', 'v'})
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def _company_key(company: str) -> str:
+    return ' '.join(_COMPANY_NOISE.sub(' ', re.sub(r'[^\w\s]+', ' ', company.lower())).split())
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def _title_key(title: str) -> str:
+    words = re.sub(r'[^\w\s]+', ' ', title).split()
+    return ' '.join(_TITLE_ABBREVIATIONS.get(word, word) for word in words)
+
+
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
+def _level_key(title_key: str) -> frozenset:
+    return frozenset(word for word in title_key.split() if word in _LEVEL_WORDS or word.isdigit())
+
+
+def _link(record: JobRecord) -> str:
+    return record.job.get('link') or record.job.get('url') or ''
+
+
+class JobDeduplicator:
+    """
+    MinHash/LSH clustering of near-duplicate jobs
+    threshold: estimated Jaccard similarity of the combined shingle sets for a candidate pair
+    title_threshold: trigram similarity the two titles need on their own
+    num_perm / bands: signature length and LSH bands (num_perm / bands rows each);
+    the defaults (64 / 16) make jobs with ~0.5 similarity or more likely to share a bucket
+    LSH only proposes candidates; a pair is merged when is_duplicate() agrees field by field.
+    """
+
+    def __init__(self, threshold: float = 0.6, title_threshold: float = 0.85, num_perm: int = 64,
+                 bands: int = 16, enabled: bool = True, seed: int = 1):
+        self.threshold = threshold
+        self.title_threshold = title_threshold
+        self.num_perm = num_perm - num_perm % bands
+        self.bands = bands
+        self.rows = self.num_perm // bands
+        self.enabled = enabled
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, self.num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, self.num_perm, dtype=np.uint64)
+        # MinHash of a union is the element-wise min, so each field is hashed once per distinct string
+        self.field_signature = lru_cache(maxsize=SIGNATURE_CACHE_SIZE)(self._field_signature)
+
+    def _field_signature(self, field: str, text: str) -> np.ndarray:
+        if field == 'l':
+            # Known cities shingle to their canonical id, whatever the spelling
+            place = resolve_location(text)
+            shingles = [f'l:{place.id}'] if place else [f'l:{gram}' for gram in trigram_set(text)]
+        else:
+            shingles = [f'{field}:{gram}' for gram in trigram_set(text)]
+        if not shingles:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) % _PRIME for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        return ((np.outer(hashes, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def signatures(self, records: List[JobRecord]) -> np.ndarray:
+        """
+        One MinHash row per record (records x num_perm)
+        """
+        titles = np.stack([self.field_signature('t', _title_key(r.title_lower)) for r in records])
+        companies = np.stack([self.field_signature('c', _company_key(r.company or '')) for r in records])
+        locations = np.stack([self.field_signature('l', r.location_lower) for r in records])
+        return np.minimum(np.minimum(titles, companies), locations)
+
+    def clusters(self, records: List[JobRecord]) -> List[int]:
+        """
+        Cluster id (index of a member) for every record
+        """
+        count = len(records)
+        parent = list(range(count))
+        if count < 2:
+            return parent
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        signatures = self.signatures(records)
+        # Candidate pairs: every job paired with the first job of each LSH bucket it lands in
+        # (linear per bucket; members that fail against it can still meet in other bands)
+        pairs = []
+        for band in range(self.bands):
+            rows = np.ascontiguousarray(signatures[:, band * self.rows:(band + 1) * self.rows])
+            keys = rows.view(np.dtype((np.void, rows.dtype.itemsize * self.rows))).ravel()
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+            leaders = first[inverse.ravel()]
+            members = np.flatnonzero(leaders != np.arange(count))
+            pairs.append(leaders[members] * count + members)
+        pairs = np.unique(np.concatenate(pairs))
+        if not len(pairs):
+            return parent
+        pairs = np.stack([pairs // count, pairs % count], axis=1)
+
+        # Cheap filter on the full signatures (estimated Jaccard), then the field-by-field check
+        agreement = np.count_nonzero(signatures[pairs[:, 0]] == signatures[pairs[:, 1]], axis=1)
+        for i, j in pairs[agreement >= self.threshold * self.num_perm].tolist():
+            if not self.is_duplicate(records[i], records[j]):
+                continue
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        return [find(i) for i in range(count)]
+
+    def is_duplicate(self, a: JobRecord, b: JobRecord) -> bool:
+        """
+        Same company, same seniority/level words, near-identical titles, no two
+        different known cities, and never two different links from one source
+        """
+        if a.via == b.via and _link(a) != _link(b):
+            return False
+        if _company_key(a.company or '') != _company_key(b.company or ''):
+            return False
+        title_a, title_b = _title_key(a.title_lower), _title_key(b.title_lower)
+        if _level_key(title_a) != _level_key(title_b):
+            return False
+        if similarity(title_a, title_b) < self.title_threshold:
+            return False
+        # Same role at the same company in two known, different cities is two postings
+        place_a = resolve_location(a.location_lower)
+        place_b = resolve_location(b.location_lower)
+        return place_a is None or place_b is None or place_a == place_b
+
+    def keep_best(self, records: List[JobRecord], scores: Sequence[float]) -> List[int]:
+        """
+        Index of one record per cluster, the highest scored (earliest on ties), in input order
+        """
+        best: Dict[int, int] = {}
+        for i, cluster in enumerate(self.clusters(records)):
+            if cluster not in best or scores[i] > scores[best[cluster]]:
+                best[cluster] = i
+        return sorted(best.values())
+
+
+job_deduplicator = JobDeduplicator(
+    threshold=float(os.environ.get('DEDUP_THRESHOLD', 0.6)),
+    title_threshold=float(os.environ.get('DEDUP_TITLE_THRESHOLD', 0.85)),
+    num_perm=int(os.environ.get('DEDUP_NUM_PERM', 64)),
+    bands=int(os.environ.get('DEDUP_BANDS', 16)),
+    enabled=os.environ.get('DEDUP_ENABLED', 'true').lower() != 'false'
+)
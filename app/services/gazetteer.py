@@ -0,0 +1,83 @@
+"""
+Location Gazetteer
+Resolves free-form job/user locations ("Bangalore, Karnataka", "Jakarta Selatan,
+DKI Jakarta", "Hybrid - Pune") to a canonical city using a precomputed
+alias -> city hash index loaded from app/config/locations.json
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional
+
+GAZETTEER_FILE = os.environ.get(
+    'GAZETTEER_FILE',
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'locations.json')
+)
+
+# Location strings list places from most to least specific, separated by these
+_SEGMENT_SEPARATORS = re.compile(r'[,/|;()\-–]+')
+_NON_WORD = re.compile(r'[^\w\s]+')
+
+
+class Place(NamedTuple):
+    id: str
+    name: str
+    region: str
+    country: str
+
+
+def _normalize(text: str) -> str:
+    return ' '.join(_NON_WORD.sub(' ', text.lower()).split())
+
+
+class Gazetteer:
+    """
+    Alias index over the gazetteer file: every alias (and the city name)
+    maps to its Place, so resolving a phrase is a dict lookup
+    """
+
+    def __init__(self, entries: List[Dict]):
+        self.index: Dict[str, Place] = {}
+        for entry in entries:
+            place = Place(entry['id'], entry['name'], entry.get('region', ''), entry.get('country', ''))
+            for alias in [entry['name']] + entry.get('aliases', []):
+                self.index[_normalize(alias)] = place
+        self.max_alias_words = max((len(alias.split()) for alias in self.index), default=0)
+
+    @classmethod
+    def load(cls, path: str = GAZETTEER_FILE) -> 'Gazetteer':
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Gazetteer not loaded from {path}: {str(e)}")
+            return cls([])
+
+    def resolve(self, location: str) -> Optional[Place]:
+        """
+        First city found, scanning segments left to right and preferring
+        the longest alias within a segment ("navi mumbai" over "mumbai")
+        """
+        for segment in _SEGMENT_SEPARATORS.split(location):
+            words = _normalize(segment).split()
+            for size in range(min(len(words), self.max_alias_words), 0, -1):
+                for start in range(len(words) - size + 1):
+                    place = self.index.get(' '.join(words[start:start + size]))
+                    if place:
+                        return place
+        return None
+
+
+gazetteer = Gazetteer.load()
+
+
+@lru_cache(maxsize=8192)
+def resolve_location(location: str) -> Optional[Place]:
+    """
+    Cached per distinct location string
+    """
+    if not location:
+        return None
+    return gazetteer.resolve(location)
@@ -4,18 +4,48 @@ Fetches jobs from all sources, analyzes, filters, and returns best 20 jobs
 """
 
 import asyncio
+import os
 import aiohttp
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import re
-from difflib import SequenceMatcher
+from typing import AsyncIterator, Collection, List, Dict, Any, Optional, Tuple
+
+from app.helpers.response import ScraperError
+from app.services.aggregate_cache import aggregate_cache
+from app.services.batch_scorer import score_jobs
+from app.services.date_parser import parse_date_to_timestamp
+from app.services.dedup import job_deduplicator
+from app.services.gazetteer import resolve_location
+from app.services.job_record import JobRecord, build_records
+from app.services.job_selector import select_top_k
+from app.services.ranking_profiles import ranking_profiles
+from app.services.rate_limiter import RateLimitExceeded
+from app.services.similarity import similarity
+from app.services.circuit_breaker import source_breakers
+from app.services.source_latency import source_latency
+from app.services.job_sources import SOURCE_PAGES, build_source_calls, is_async_call, peek_source_call
+from app.singletons.async_http import AsyncHttpClient
+
+# Blocking fetch_* calls run here in 'direct' dispatch mode, never on WSGI workers
+_source_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='job-source')
+# Sources that would likely have answered given more time; their results are cached as partial
+PARTIAL_STATUSES = ('cutoff', 'throttled', 'deferred')
+
+
+def _is_partial(sources: Dict[str, str]) -> bool:
+    return any(status in PARTIAL_STATUSES for status in sources.values())
+
 
 class JobAggregator:
     """
     Aggregates jobs from multiple sources and returns top 20 filtered results
     """
     
-    def __init__(self):
+    def __init__(self, dispatch: Optional[str] = None):
+        # 'direct' calls the scraper functions in process,
+        # 'http' goes through this app's own /api/* routes
+        self.dispatch = dispatch or os.environ.get('AGGREGATOR_DISPATCH', 'direct')
+        self.base_url = os.environ.get('AGGREGATOR_BASE_URL', 'http://localhost:5000')
         self.sources = [
             'timesjobs',
             'indeed',
@@ -33,84 +63,12 @@ class JobAggregator:
         self.all_jobs = []
         self.progress = {}
         
-    def parse_date_to_timestamp(self, date_string: str) -> int:
+    def parse_date_to_timestamp(self, date_string: str, now: Optional[datetime] = None) -> int:
         """
         Parse various date formats to timestamp
         Returns timestamp in milliseconds (0 if invalid)
         """
-        if not date_string or date_string == 'N/A' or date_string.strip() == '':
-            return 0
-        
-        now = datetime.now()
-        date_lower = date_string.lower().strip()
-        
-        # Handle "Just now", "Recently", "Today"
-        if date_lower in ['just now', 'recently', 'today']:
-            return int(now.timestamp() * 1000)
-        
-        # Handle "Yesterday"
-        if date_lower == 'yesterday':
-            return int((now - timedelta(days=1)).timestamp() * 1000)
-        
-        # Handle relative time: "X time ago"
-        relative_match = re.search(r'(\d+)\s*(second|minute|hour|day|week|month|year)s?\s*(ago)?', date_lower)
-        if relative_match:
-            value = int(relative_match.group(1))
-            unit = relative_match.group(2)
-            
-            delta_map = {
-                'second': timedelta(seconds=value),
-                'minute': timedelta(minutes=value),
-                'hour': timedelta(hours=value),
-                'day': timedelta(days=value),
-                'week': timedelta(weeks=value),
-                'month': timedelta(days=value * 30),
-                'year': timedelta(days=value * 365)
-            }
-            
-            if unit in delta_map:
-                target_time = now - delta_map[unit]
-                return int(target_time.timestamp() * 1000)
-        
-        # Handle "30+ days ago"
-        days_match = re.search(r'(\d+)\+?\s*days?\+?\s*(ago)?', date_lower)
-        if days_match:
-            days = int(days_match.group(1))
-            target_time = now - timedelta(days=days)
-            return int(target_time.timestamp() * 1000)
-        
-        # Handle "last X"
-        last_match = re.search(r'last\s+(second|minute|hour|day|week|month|year)', date_lower)
-        if last_match:
-            unit = last_match.group(1)
-            delta_map = {
-                'second': timedelta(seconds=1),
-                'minute': timedelta(minutes=1),
-                'hour': timedelta(hours=1),
-                'day': timedelta(days=1),
-                'week': timedelta(weeks=1),
-                'month': timedelta(days=30),
-                'year': timedelta(days=365)
-            }
-            if unit in delta_map:
-                target_time = now - delta_map[unit]
-                return int(target_time.timestamp() * 1000)
-        
-        # Try parsing ISO date
-        try:
-            parsed = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            return int(parsed.timestamp() * 1000)
-        except:
-            pass
-        
-        # Try standard date parsing
-        try:
-            parsed = datetime.strptime(date_string, '%Y-%m-%d')
-            return int(parsed.timestamp() * 1000)
-        except:
-            pass
-        
-        return 0
+        return parse_date_to_timestamp(date_string, now)
     
     def calculate_location_match_score(self, job_location: str, user_location: str) -> float:
         """
@@ -135,25 +93,14 @@ class JobAggregator:
         if 'remote' in job_loc or 'work from home' in job_loc or 'wfh' in job_loc:
             return 0.95
         
-        # Similar using sequence matcher
-        similarity = SequenceMatcher(None, job_loc, user_loc).ratio()
-        if similarity > 0.7:
-            return 0.8
-        
-        # Check for city variations
-        location_mappings = {
-            'bangalore': ['bengaluru', 'banglore', 'blr'],
-            'mumbai': ['bombay'],
-            'delhi': ['new delhi', 'ncr'],
-            'chennai': ['madras'],
-            'kolkata': ['calcutta'],
-            'gurugram': ['gurgaon']
-        }
+        # Same city under another name (Bombay/Mumbai, Jakarta Selatan/DKI Jakarta)
+        job_place = resolve_location(job_loc)
+        if job_place is not None and job_place == resolve_location(user_loc):
+            return 0.95
         
-        for main_city, variations in location_mappings.items():
-            if user_loc in [main_city] + variations:
-                if job_loc in [main_city] + variations:
-                    return 0.95
+        # Similar spelling (trigram overlap)
+        if similarity(job_loc, user_loc) > 0.7:
+            return 0.8
         
         return 0.3  # Low score for different locations
     
@@ -186,9 +133,8 @@ class JobAggregator:
             if overlap_ratio > 0.5:
                 return 0.7 + (overlap_ratio * 0.2)
         
-        # Similarity
-        similarity = SequenceMatcher(None, job_t, user_t).ratio()
-        return similarity * 0.8
+        # Similarity (trigram overlap)
+        return similarity(job_t, user_t) * 0.8
     
     def calculate_job_score(self, job: Dict[str, Any], user_preferences: Dict[str, str]) -> float:
         """
@@ -196,14 +142,9 @@ class JobAggregator:
         Higher score = better match
         """
         score = 0.0
-        # Emphasize recency and work mode alignment
-        weights = {
-            'recency': 0.40,      # 40% - Most important
-            'location': 0.25,     # 25% - Very important
-            'title_match': 0.20,  # 20% - Important
-            'work_mode': 0.10,    # 10% - Prefer remote/hybrid if requested
-            'has_url': 0.05       # 5%  - Nice to have
-        }
+        # Weights and source bonus come from the ranking profile (?profile=, RANKING_PROFILE)
+        profile = ranking_profiles.get(user_preferences.get('profile'))
+        weights = profile.weights
         
         # Recency score
         timestamp = self.parse_date_to_timestamp(job.get('posted_on', ''))
@@ -275,30 +216,91 @@ class JobAggregator:
         url_score = 1.0 if (job_url and job_url.startswith('http')) else 0.3
         score += url_score * weights['has_url']
 
-        # Source bonus: prioritize TimesJobs slightly
-        via = (job.get('via') or '').lower()
-        source_bonus = 1.0
-        if 'timesjobs' in via:
-            source_bonus = 1.12  # ~12% boost
-
-        score *= source_bonus
+        # Source bonus (default profile: TimesJobs ~12% boost)
+        score *= profile.bonus_for((job.get('via') or '').lower())
         # Clamp score to max 1.0 for consistency
         return min(score, 1.0)
     
-    async def fetch_from_source(self, session: aiohttp.ClientSession, source: str, 
+    async def fetch_from_source(self, session: Optional[aiohttp.ClientSession], source: str,
                                 keyword: str, location: str) -> List[Dict[str, Any]]:
         """
         Fetch jobs from a single source
         """
-        base_url = 'http://localhost:5000'  # Adjust if needed
+        if source not in build_source_calls(keyword, location):
+            return []
+        
+        if not source_breakers.allow(source):
+            self.progress[source] = 'skipped'
+            print(f"⛔ {source}: Circuit open, skipped")
+            return []
+        
+        # Adaptive per source (p99 latency x factor); a request deadline cuts it off earlier
+        timeout = source_latency.timeout_for(source)
+        try:
+            self.progress[source] = 'fetching'
+            
+            if self.dispatch == 'http':
+                jobs = await self._fetch_over_http(session, source, keyword, location, timeout)
+            else:
+                jobs = await self._fetch_in_process(source, keyword, location, timeout)
+            
+            # Add source to each job (copies, the payload may be shared with the caller)
+            jobs = [dict(job, via=source.title()) for job in jobs]
+            
+            self.progress[source] = 'completed'
+            print(f"✅ {source}: {len(jobs)} jobs")
+            return jobs
+        except RateLimitExceeded as e:
+            # Our own host budget, not a source failure (the breaker ignores 'throttled')
+            self.progress[source] = 'throttled'
+            print(f"🚦 {source}: {e.message}")
+            return []
+        except ScraperError as e:
+            self.progress[source] = 'failed'
+            print(f"❌ {source}: HTTP {e.status_code}")
+            return []
+        except asyncio.TimeoutError:
+            self.progress[source] = 'timeout'
+            # No latency sample here: the abandoned fetch keeps running and the source cache
+            # records its real duration (or a censored one if it fails) when it ends
+            print(f"⏱️ {source}: Timeout after {timeout:.1f}s")
+            return []
+        except Exception as e:
+            self.progress[source] = 'error'
+            print(f"❌ {source}: {str(e)}")
+            return []
+        finally:
+            # Still 'fetching' if cancelled at a deadline, which only releases a half-open probe
+            source_breakers.record(source, self.progress[source])
+    
+    async def _fetch_in_process(self, source: str, keyword: str, location: str,
+                                timeout: float) -> List[Dict[str, Any]]:
+        """
+        Call the source's fetch_* function directly: async-native sources are
+        awaited on this loop, blocking ones run on the source executor
+        """
+        call = build_source_calls(keyword, location)[source]
+        if is_async_call(call):
+            data = await asyncio.wait_for(call(), timeout=timeout)
+        else:
+            loop = asyncio.get_running_loop()
+            data = await asyncio.wait_for(loop.run_in_executor(_source_executor, call), timeout=timeout)
+        return data.get('jobs') or []
+    
+    async def _fetch_over_http(self, session: aiohttp.ClientSession, source: str,
+                               keyword: str, location: str, timeout: float) -> List[Dict[str, Any]]:
+        """
+        Fetch a source through this app's own /api/* route (loopback HTTP)
+        """
+        base_url = self.base_url
         
         url_map = {
-            'internshala': f'{base_url}/api/internshala?keyword={keyword}&location={location}&page=1',
-            'indeed': f'{base_url}/api/indeed?keyword={keyword}&location={location}&country=in&page=0',
+            'internshala': f'{base_url}/api/internshala?keyword={keyword}&location={location}&page=1&pages={SOURCE_PAGES}',
+            'indeed': f'{base_url}/api/indeed?keyword={keyword}&location={location}&country=in&page=0&pages={SOURCE_PAGES}',
             'linkedin': f'{base_url}/api/linkedin?keyword={keyword}&location={location}&limit=25',
             'remoteok': f'{base_url}/api/remoteok?keywords={keyword}',
             'naukri': f'{base_url}/api/naukri?keyword={keyword}&location={location}&limit=30',
-            'ziprecruiter': f'{base_url}/api/ziprecruiter?search_term={keyword}&location={location}&distance=50&hours_old=168',
+            'ziprecruiter': f'{base_url}/api/ziprecruiter?search_term={keyword}&location={location}&distance=50&hours_old=168&pages={SOURCE_PAGES}',
             'aasaanjobs': f'{base_url}/api/aasaanjobs?keyword={keyword}',
             'dare2compete': f'{base_url}/api/dare2compete',
             'freshersworld': f'{base_url}/api/freshersworld?keyword={keyword}&location={location}',
@@ -308,70 +310,114 @@ class JobAggregator:
             'jobspy': f"{base_url}/api/jobspy?site_names=indeed,linkedin,glassdoor,zip_recruiter&search_term={keyword}&location={location}&results_wanted=25&hours_old=96"
         }
         
-        if source not in url_map:
-            return []
-        
-        try:
-            self.progress[source] = 'fetching'
+        async with session.get(url_map[source], timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status != 200:
+                raise ScraperError(f'HTTP {response.status}', status_code=response.status)
             
-            async with session.get(url_map[source], timeout=aiohttp.ClientTimeout(total=120)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Extract jobs from response
-                    jobs = []
-                    if isinstance(data, dict):
-                        if 'data' in data:
-                            if isinstance(data['data'], dict) and 'jobs' in data['data']:
-                                jobs = data['data']['jobs']
-                            elif isinstance(data['data'], list):
-                                jobs = data['data']
-                        elif 'jobs' in data:
-                            jobs = data['jobs']
-                    elif isinstance(data, list):
-                        jobs = data
-                    
-                    # Add source to each job
-                    for job in jobs:
-                        job['via'] = source.title()
-                    
-                    self.progress[source] = 'completed'
-                    print(f"✅ {source}: {len(jobs)} jobs")
-                    return jobs
-                else:
-                    self.progress[source] = 'failed'
-                    print(f"❌ {source}: HTTP {response.status}")
-                    return []
-        except asyncio.TimeoutError:
-            self.progress[source] = 'timeout'
-            print(f"⏱️ {source}: Timeout")
-            return []
-        except Exception as e:
-            self.progress[source] = 'error'
-            print(f"❌ {source}: {str(e)}")
-            return []
+            data = await response.json()
+            
+            # Extract jobs from response
+            jobs = []
+            if isinstance(data, dict):
+                if 'data' in data:
+                    if isinstance(data['data'], dict) and 'jobs' in data['data']:
+                        jobs = data['data']['jobs']
+                    elif isinstance(data['data'], list):
+                        jobs = data['data']
+                elif 'jobs' in data:
+                    jobs = data['jobs']
+            elif isinstance(data, list):
+                jobs = data
+            
+            return jobs
+    
+    async def _http_session(self) -> Optional[aiohttp.ClientSession]:
+        """
+        Shared keep-alive session for 'http' dispatch (None in 'direct' mode)
+        """
+        if self.dispatch != 'http':
+            return None
+        return await AsyncHttpClient.get_instance().get_session()
     
-    async def fetch_all_jobs(self, keyword: str, location: str) -> List[Dict[str, Any]]:
+    async def fetch_all_jobs(self, keyword: str, location: str,
+                             budget_ms: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch jobs from all sources concurrently
+        With budget_ms, sources still pending when the deadline expires are
+        cancelled, marked 'cutoff' in progress, and only arrived jobs are returned.
         """
         print(f"🔍 Fetching jobs for: {keyword} in {location}")
         
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self.fetch_from_source(session, source, keyword, location)
-                for source in self.sources
-            ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            all_jobs = []
-            for result in results:
-                if isinstance(result, list):
-                    all_jobs.extend(result)
-            
-            print(f"📦 Total jobs fetched: {len(all_jobs)}")
-            return all_jobs
+        session = await self._http_session()
+        results = await self._gather_sources(session, keyword, location, budget_ms)
+        
+        all_jobs = []
+        for result in results:
+            if isinstance(result, list):
+                all_jobs.extend(result)
+        
+        print(f"📦 Total jobs fetched: {len(all_jobs)}")
+        return all_jobs
+    
+    async def _gather_sources(self, session: Optional[aiohttp.ClientSession],
+                              keyword: str, location: str,
+                              budget_ms: Optional[int] = None) -> List[Any]:
+        source_tasks = {
+            source: asyncio.ensure_future(self.fetch_from_source(session, source, keyword, location))
+            for source in self.sources
+        }
+        if budget_ms is None:
+            return await asyncio.gather(*source_tasks.values(), return_exceptions=True)
+        
+        done, _ = await asyncio.wait(source_tasks.values(), timeout=budget_ms / 1000)
+        results = [task.result() for task in source_tasks.values() if task in done]
+        await self._cut_off_pending(source_tasks)
+        return results
+    
+    async def _cut_off_pending(self, source_tasks: Dict[str, 'asyncio.Future']) -> None:
+        """
+        Cancel sources that missed the deadline and mark them 'cutoff'
+        """
+        pending = {source: task for source, task in source_tasks.items() if not task.done()}
+        for task in pending.values():
+            task.cancel()
+        await asyncio.gather(*pending.values(), return_exceptions=True)
+        
+        # Set after the tasks settle so a late finish cannot overwrite it
+        for source in pending:
+            self.progress[source] = 'cutoff'
+            print(f"✂️ {source}: Cut off at deadline")
+    
+    async def iter_source_results(self, keyword: str, location: str,
+                                  budget_ms: Optional[int] = None) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Yield (source, jobs) for each source as soon as its fetch completes.
+        Sources still pending at the deadline (budget_ms) or when the consumer
+        stops iterating are cancelled.
+        """
+        session = await self._http_session()
+        
+        async def _fetch(source: str) -> Tuple[str, List[Dict[str, Any]]]:
+            return source, await self.fetch_from_source(session, source, keyword, location)
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget_ms / 1000 if budget_ms is not None else None
+        source_tasks = {source: asyncio.ensure_future(_fetch(source)) for source in self.sources}
+        pending = set(source_tasks.values())
+        try:
+            while pending:
+                timeout = max(0.0, deadline - loop.time()) if deadline is not None else None
+                done, pending = await asyncio.wait(pending, timeout=timeout,
+                                                   return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    await self._cut_off_pending(source_tasks)
+                    break
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in source_tasks.values():
+                task.cancel()
+            await asyncio.gather(*source_tasks.values(), return_exceptions=True)
     
     def filter_and_select_top_jobs(self, jobs: List[Dict[str, Any]], 
                                    user_preferences: Dict[str, str], 
@@ -379,91 +425,66 @@ class JobAggregator:
         """
         Filter and select top N jobs based on scoring
         """
-        print(f"🔬 Analyzing {len(jobs)} jobs...")
+        # One "now" for the whole batch: every job's date is parsed exactly once, here
+        now = datetime.now()
+        return self.select_top_records(build_records(jobs, now), user_preferences, target_count, now)
+    
+    def select_top_records(self, records: List[JobRecord], user_preferences: Dict[str, str],
+                           target_count: int = 20, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Ranking on pre-built records (see filter_and_select_top_jobs)
+        Returns copies of the selected jobs; the records' dicts are left untouched.
+        """
+        print(f"🔬 Analyzing {len(records)} jobs...")
         # Strict recency filter (drop very old jobs)
         try:
             max_days_old = int(user_preferences.get('maxDaysOld', 14))
         except Exception:
             max_days_old = 14
-        cutoff_ts = int((datetime.now() - timedelta(days=max_days_old)).timestamp() * 1000)
+        now = now or datetime.now()
+        cutoff_ts = int((now - timedelta(days=max_days_old)).timestamp() * 1000)
         
         # Filter out invalid jobs
         valid_jobs = []
-        for job in jobs:
+        for record in records:
             # Must have title and company
-            if not job.get('title') or not job.get('company'):
+            if not record.title or not record.company:
                 continue
-            if job.get('title') == 'N/A' or job.get('company') == 'N/A':
+            if record.title == 'N/A' or record.company == 'N/A':
                 continue
             # Drop jobs older than cutoff when we have a valid timestamp
-            ts = self.parse_date_to_timestamp(job.get('posted_on') or job.get('postedAt') or job.get('datePosted') or '')
-            if ts > 0 and ts < cutoff_ts:
+            if record.timestamp > 0 and record.timestamp < cutoff_ts:
                 continue
             
-            valid_jobs.append(job)
+            valid_jobs.append(record)
         
         print(f"✅ Valid jobs: {len(valid_jobs)}")
         
-        # Calculate score for each job
-        for job in valid_jobs:
-            job['_score'] = self.calculate_job_score(job, user_preferences)
-        
-        # Sort by score (highest first)
-        sorted_jobs = sorted(valid_jobs, key=lambda x: x['_score'], reverse=True)
+        # Score the whole pool in one vectorized pass (same result as calculate_job_score per job)
+        profile = ranking_profiles.get(user_preferences.get('profile'))
+        scores = score_jobs(self, valid_jobs, user_preferences, profile).tolist()
+        
+        # Collapse the same posting seen on several sources, keeping its best-scored copy
+        if job_deduplicator.enabled:
+            kept = job_deduplicator.keep_best(valid_jobs, scores)
+            valid_jobs = [valid_jobs[i] for i in kept]
+            scores = [scores[i] for i in kept]
+            print(f"🧬 Unique jobs: {len(valid_jobs)}")
+        
+        # Select top jobs with diversity (heap-based, no full sort of the pool)
+        # Boosted sources first (default profile: up to 5 from TimesJobs if quality allows),
+        # then at least min_per_source from each source, then fill by score
+        selected_jobs, source_counts = select_top_k(
+            valid_jobs, scores, target_count, min_per_source=profile.min_per_source,
+            boosted_sources=profile.boosted_sources, max_boosted=profile.max_boosted
+        )
         
-        # Select top jobs with diversity
-        selected_jobs: List[Dict[str, Any]] = []
-        source_counts: Dict[str, int] = {}
-        min_per_source = 2  # Default diversity minimum per source
-
-        # Special priority: pick extra from TimesJobs first (if available)
-        boosted_source_names = {'TimesJobs', 'Timesjobs'}
-        max_timesjobs = 5  # Try to include up to 5 from TimesJobs if quality allows
-        for job in sorted_jobs:
-            if len(selected_jobs) >= target_count:
-                break
-            source = job.get('via', 'Unknown')
-            if source in boosted_source_names:
-                count = source_counts.get(source, 0)
-                if count < max_timesjobs:
-                    selected_jobs.append(job)
-                    source_counts[source] = count + 1
-
-        # First pass: Ensure diversity (at least min_per_source from each source)
-        for job in sorted_jobs:
-            if len(selected_jobs) >= target_count:
-                break
-            source = job.get('via', 'Unknown')
-            count = source_counts.get(source, 0)
-            if count < min_per_source and job not in selected_jobs:
-                selected_jobs.append(job)
-                source_counts[source] = count + 1
-                if len(selected_jobs) >= target_count:
-                    break
-
-        # Second pass: Fill remaining slots with highest scored jobs
-        if len(selected_jobs) < target_count:
-            for job in sorted_jobs:
-                if job not in selected_jobs:
-                    selected_jobs.append(job)
-                    if len(selected_jobs) >= target_count:
-                        break
-        
-        # Remove score field before returning
-        for job in selected_jobs:
-            if '_score' in job:
-                del job['_score']
-        
-        print(f"🎯 Selected top {len(selected_jobs)} jobs")
+        print(f"🎯 Selected top {len(selected_jobs)} jobs ({profile.name} profile)")
         print(f"📊 Source distribution: {source_counts}")
 
         # Final sort: by recency (most recent first) using parsed timestamp
-        def _ts(j: Dict[str, Any]) -> int:
-            ts = self.parse_date_to_timestamp(j.get('posted_on') or j.get('postedAt') or j.get('datePosted') or '')
-            return ts
-
-        selected_jobs.sort(key=lambda j: _ts(j), reverse=True)
-        return selected_jobs
+        selected_jobs.sort(key=lambda record: record.timestamp, reverse=True)
+        return [record.to_dict() for record in selected_jobs]
     
     def get_progress_percentage(self) -> float:
         """
@@ -473,7 +494,7 @@ class JobAggregator:
             return 0.0
         
         completed = sum(1 for status in self.progress.values() 
-                       if status in ['completed', 'failed', 'timeout', 'error'])
+                       if status in ['completed', 'failed', 'timeout', 'error', 'cutoff', 'skipped', 'throttled'])
         return (completed / len(self.sources)) * 100
     
     def get_current_source(self) -> Optional[str]:
@@ -486,14 +507,87 @@ class JobAggregator:
         return None
 
 
-async def aggregate_jobs(keyword: str, location: str, user_preferences: Dict[str, str]) -> Dict[str, Any]:
+# Keeps background refresh tasks referenced until they finish
+_background_tasks = set()
+
+
+async def refresh_candidate_pool(keyword: str, location: str) -> None:
+    """
+    Re-fetch the cached pool for (keyword, location)
+    Used for stale-while-revalidate.
+    """
+    aggregator = JobAggregator()
+    all_jobs = await aggregator.fetch_all_jobs(keyword, location)
+    aggregate_cache.put(keyword, location, all_jobs, aggregator.progress,
+                        partial=_is_partial(aggregator.progress), records=build_records(all_jobs))
+
+
+def rebuild_pool_from_cache(keyword: str, location: str, skip: Collection[str] = ()) -> int:
+    """
+    Re-assemble the cached pool for (keyword, location) from source cache entries only,
+    never calling upstream. Sources in skip or without a fresh entry are marked
+    'deferred' and the pool is stored as partial. Returns the number of jobs.
+    Used by the pre-warming scheduler.
+    """
+    aggregator = JobAggregator()
+    calls = build_source_calls(keyword, location)
+    all_jobs = []
+    for source in aggregator.sources:
+        if source not in calls:
+            continue
+        data = peek_source_call(calls[source]) if source not in skip else None
+        if data is None:
+            aggregator.progress[source] = 'deferred'
+            continue
+        all_jobs.extend(dict(job, via=source.title()) for job in data.get('jobs') or [])
+        aggregator.progress[source] = 'completed'
+    aggregate_cache.put(keyword, location, all_jobs, aggregator.progress,
+                        partial=_is_partial(aggregator.progress), records=build_records(all_jobs))
+    return len(all_jobs)
+
+
+async def _background_refresh(keyword: str, location: str) -> None:
+    try:
+        await refresh_candidate_pool(keyword, location)
+    except Exception as e:
+        print(f"❌ Background refresh failed for {keyword} in {location}: {str(e)}")
+    finally:
+        aggregate_cache.end_refresh(keyword, location)
+
+
+def _schedule_refresh(keyword: str, location: str) -> None:
+    if aggregate_cache.begin_refresh(keyword, location):
+        task = asyncio.ensure_future(_background_refresh(keyword, location))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+async def aggregate_jobs(keyword: str, location: str, user_preferences: Dict[str, str],
+                         budget_ms: Optional[int] = None) -> Dict[str, Any]:
     """
     Main function to aggregate and filter jobs
+    budget_ms: optional request-level deadline; ranking runs on whatever arrived in time
+    
+    The raw candidate pool is cached per (keyword, location); stale pools are served
+    immediately while a background refresh runs, and re-ranked for each request.
     """
     aggregator = JobAggregator()
     
-    # Fetch all jobs
-    all_jobs = await aggregator.fetch_all_jobs(keyword, location)
+    entry, cache_state = aggregate_cache.get(keyword, location) if aggregate_cache.enabled else (None, 'off')
+    if entry is not None:
+        all_jobs = entry['jobs']
+        records = entry['records']
+        sources = entry['sources']
+        print(f"♻️ Serving cached pool ({cache_state}) for: {keyword} in {location}")
+        if cache_state == 'stale':
+            _schedule_refresh(keyword, location)
+    else:
+        # Fetch all jobs
+        all_jobs = await aggregator.fetch_all_jobs(keyword, location, budget_ms)
+        records = build_records(all_jobs)
+        sources = aggregator.progress
+        aggregate_cache.put(keyword, location, all_jobs, sources, partial=_is_partial(sources),
+                            records=records)
     
     if not all_jobs:
         return {
@@ -503,8 +597,8 @@ async def aggregate_jobs(keyword: str, location: str, user_preferences: Dict[str
             'progress': 100
         }
     
-    # Filter and select top 20
-    top_jobs = aggregator.filter_and_select_top_jobs(all_jobs, user_preferences, target_count=20)
+    # Filter and select top 20 on the pool's records (cached with it, so only the scoring is per request)
+    top_jobs = aggregator.select_top_records(records, user_preferences, target_count=20)
     
     return {
         'status': 'success',
@@ -514,6 +608,60 @@ async def aggregate_jobs(keyword: str, location: str, user_preferences: Dict[str
         'stats': {
             'total_fetched': len(all_jobs),
             'selected': len(top_jobs),
-            'sources': aggregator.progress
+            'sources': sources,
+            'partial': _is_partial(sources),
+            'cache': cache_state,
+            'profile': ranking_profiles.get(user_preferences.get('profile')).name
+        }
+    }
+
+
+async def stream_aggregate_jobs(keyword: str, location: str, user_preferences: Dict[str, str],
+                                target_count: int = 20,
+                                budget_ms: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Streaming variant of aggregate_jobs.
+    Yields one 'source' event per finished source (its jobs plus the running top N)
+    and a final 'done' event with the same stats as aggregate_jobs.
+    The streamed pool is stored in the aggregate cache for later requests.
+    """
+    aggregator = JobAggregator()
+    all_jobs: List[Dict[str, Any]] = []
+    # Records are built once per job as sources arrive and re-ranked on each event
+    records: List[JobRecord] = []
+    top_jobs: List[Dict[str, Any]] = []
+    
+    async for source, jobs in aggregator.iter_source_results(keyword, location, budget_ms):
+        all_jobs.extend(jobs)
+        if jobs:
+            now = datetime.now()
+            records.extend(build_records(jobs, now))
+            top_jobs = aggregator.select_top_records(records, user_preferences, target_count=target_count, now=now)
+        
+        yield {
+            'event': 'source',
+            'source': source,
+            'status': aggregator.progress.get(source),
+            'data': {'jobs': jobs, 'top': top_jobs},
+            'progress': aggregator.get_progress_percentage(),
+            'sources': dict(aggregator.progress)
+        }
+    
+    aggregate_cache.put(keyword, location, all_jobs, aggregator.progress,
+                        partial=_is_partial(aggregator.progress), records=records)
+    
+    yield {
+        'event': 'done',
+        'status': 'success' if top_jobs else 'failed',
+        'message': (f'Found {len(top_jobs)} best matching jobs from {len(all_jobs)} total jobs'
+                    if top_jobs else 'No jobs found from any source'),
+        'data': {'jobs': top_jobs},
+        'progress': 100,
+        'stats': {
+            'total_fetched': len(all_jobs),
+            'selected': len(top_jobs),
+            'sources': aggregator.progress,
+            'partial': _is_partial(aggregator.progress),
+            'profile': ranking_profiles.get(user_preferences.get('profile')).name
         }
     }
@@ -0,0 +1,82 @@
+"""
+Job Record
+Compact, slotted view of one job for the ranking pipeline: the fields ranking
+reads are resolved from the sources' inconsistent keys once, at ingestion
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.services.date_parser import parse_date_to_timestamp
+
+# Recency buckets: (max age in hours, score), first match wins
+RECENCY_BUCKETS = [(24, 1.0), (48, 0.9), (72, 0.8), (168, 0.6), (720, 0.4)]
+RECENCY_OLDER = 0.2
+RECENCY_UNDATED = 0.1
+
+
+def recency_score(timestamp: int, now_ms: int) -> float:
+    if timestamp <= 0:
+        return RECENCY_UNDATED
+    age_hours = (now_ms - timestamp) / (1000 * 60 * 60)
+    for hours, score in RECENCY_BUCKETS:
+        if age_hours < hours:
+            return score
+    return RECENCY_OLDER
+
+
+class JobRecord:
+    """
+    One job as seen by filtering and scoring.
+    The source dict is kept as-is (it may be shared with the aggregate cache)
+    and is never mutated. Every field here is user-independent, so records
+    are cached with their pool and only the weighted sum changes per request.
+    """
+
+    __slots__ = ('job', 'title', 'company', 'location', 'via',
+                 'title_lower', 'location_lower', 'timestamp', 'recency',
+                 'is_remote', 'is_hybrid', 'has_url', 'source')
+
+    def __init__(self, job: Dict[str, Any], now: Optional[datetime] = None):
+        now = now or datetime.now()
+        self.job = job
+        # Raw values: the match scorers do their own normalization
+        self.title = job.get('title', '')
+        self.company = job.get('company') or job.get('company_name')
+        self.location = job.get('location', '')
+        self.via = job.get('via', 'Unknown')
+
+        self.title_lower = (self.title or '').lower()
+        self.location_lower = (self.location or '').lower()
+
+        # Any date key for the recency cutoff and final order; recency scoring only trusts posted_on
+        posted_on = job.get('posted_on')
+        self.timestamp = parse_date_to_timestamp(posted_on or job.get('postedAt') or job.get('datePosted') or '', now)
+        self.recency = recency_score(self.timestamp if posted_on else 0, int(now.timestamp() * 1000))
+
+        work_mode = (job.get('work_mode') or '').lower()
+        self.is_remote = (bool(job.get('isRemote') or job.get('is_remote'))
+                          or 'remote' in self.location_lower or 'remote' in self.title_lower or 'remote' in work_mode)
+        self.is_hybrid = 'hybrid' in self.location_lower or 'hybrid' in self.title_lower or 'hybrid' in work_mode
+
+        job_url = job.get('link', '') or job.get('url', '')
+        self.has_url = bool(job_url and job_url.startswith('http'))
+        # Lowercased source name, matched against the ranking profile's source bonuses
+        self.source = (job.get('via') or '').lower()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Output copy of the job, with `company` filled in for sources that only send `company_name`
+        """
+        job = dict(self.job)
+        if not job.get('company'):
+            job['company'] = self.company
+        return job
+
+
+def build_records(jobs: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> List[JobRecord]:
+    """
+    Wrap a batch of job dicts, parsing relative dates against one shared `now`
+    """
+    now = now or datetime.now()
+    return [JobRecord(job, now) for job in jobs]
@@ -0,0 +1,65 @@
+"""
+Job Selector
+Top-K selection with per-source diversity, built on heaps instead of a full
+sort: O(n) to heapify, then O(log n) per pick
+"""
+
+import heapq
+from typing import Collection, Dict, List, Sequence, Tuple
+
+from app.services.job_record import JobRecord
+
+
+def select_top_k(records: List[JobRecord], scores: Sequence[float], target_count: int,
+                 min_per_source: int = 2, boosted_sources: Collection[str] = (), max_boosted: int = 5
+                 ) -> Tuple[List[JobRecord], Dict[str, int]]:
+    """
+    Same picks, in the same order, as walking the records sorted by score
+    (scores[i] for records[i], highest first, ties in input order) three times:
+      1. up to max_boosted from each boosted source
+      2. up to min_per_source from every source
+      3. the best remaining jobs until target_count
+    Returns (selected records, picks per source).
+    """
+    # Heap entries are (-score, index): min-heap order is score desc, then input order
+    entries = [(-score, i) for i, score in enumerate(scores)]
+    by_source: Dict[str, List[Tuple[float, int]]] = {}
+    for entry in entries:
+        by_source.setdefault(records[entry[1]].via, []).append(entry)
+    for heap in by_source.values():
+        heapq.heapify(heap)
+    heapq.heapify(entries)
+
+    selected: List[JobRecord] = []
+    chosen = set()
+    source_counts: Dict[str, int] = {}
+
+    def pick(candidates: List[Tuple[float, int]]) -> None:
+        # Candidates come off several source heaps; take them in global order
+        for entry in sorted(candidates):
+            if len(selected) >= target_count:
+                return
+            source = records[entry[1]].via
+            selected.append(records[entry[1]])
+            chosen.add(entry[1])
+            source_counts[source] = source_counts.get(source, 0) + 1
+
+    def pop_best(source: str, quota: int) -> List[Tuple[float, int]]:
+        heap = by_source.get(source, [])
+        return [heapq.heappop(heap) for _ in range(min(quota, len(heap)))]
+
+    # Special priority: boosted sources first
+    pick([entry for source in boosted_sources for entry in pop_best(source, max_boosted)])
+
+    # Diversity: the best unpicked jobs of each source, up to min_per_source
+    pick([entry for source in by_source
+          for entry in pop_best(source, min_per_source - source_counts.get(source, 0))])
+
+    # Fill remaining slots with the highest scored jobs
+    while len(selected) < target_count and entries:
+        _, i = heapq.heappop(entries)
+        if i not in chosen:
+            selected.append(records[i])
+            chosen.add(i)
+
+    return selected, source_counts
@@ -0,0 +1,95 @@
+"""
+Job Sources
+In-process entry points for every source the aggregator can query
+"""
+
+import inspect
+import os
+from functools import partial
+from typing import Any, Callable, Dict, Optional
+
+from app.controllers.jobspy_proxy import fetch_jobspy_jobs
+from app.controllers.scrape_aasaanjobs import fetch_aasaanjobs_jobs
+from app.controllers.scrape_dare2compete import fetch_dare2compete_jobs_async
+from app.controllers.scrape_freshersworld import fetch_freshersworld_jobs
+from app.controllers.scrape_indeed import fetch_indeed_pages
+from app.controllers.scrape_internshala import fetch_internshala_pages
+from app.controllers.scrape_jobguru import fetch_jobguru_jobs_async
+from app.controllers.scrape_linkedin import fetch_linkedin_jobs
+from app.controllers.scrape_myamcat import fetch_myamcat_jobs_async
+from app.controllers.scrape_naukri import fetch_naukri_jobs_async
+from app.controllers.scrape_remoteok import fetch_remoteok_jobs
+from app.controllers.scrape_timesjobs import fetch_timesjobs_jobs_async
+from app.controllers.scrape_ziprecruiter import fetch_ziprecruiter_pages_async
+from app.helpers.pages import page_count
+from app.services.aggregate_cache import normalize_key
+from app.singletons.event_loop import AsyncRuntime
+
+DEFAULT_SOURCE_PAGES = 2
+
+
+def _source_pages() -> int:
+    value = os.environ.get('AGGREGATOR_PAGES', str(DEFAULT_SOURCE_PAGES))
+    try:
+        return page_count(value)
+    except ValueError:
+        print(f"⚠️ Invalid AGGREGATOR_PAGES '{value}', using {DEFAULT_SOURCE_PAGES}")
+        return DEFAULT_SOURCE_PAGES
+
+
+# Result pages requested (concurrently) from the paginated sources: Indeed, Internshala, ZipRecruiter
+SOURCE_PAGES = _source_pages()
+
+
+def build_source_calls(keyword: str, location: str) -> Dict[str, Callable[[], Dict[str, Any]]]:
+    """
+    Map each source name to a zero-argument call of its fetch_* function.
+    Async-native sources map to their fetch_*_async coroutine function (see is_async_call).
+    Parameters mirror what the aggregator used to send to the /api/* routes.
+    Keyword and location are normalized so equivalent searches share source cache entries.
+    """
+    keyword, location = normalize_key(keyword, location)
+    return {
+        'internshala': partial(fetch_internshala_pages, keyword, location, '1', SOURCE_PAGES),
+        'indeed': partial(fetch_indeed_pages, keyword, location, 'in', '0', SOURCE_PAGES),
+        'linkedin': partial(fetch_linkedin_jobs, keyword, location, 25),
+        'remoteok': partial(fetch_remoteok_jobs, keyword),
+        'naukri': partial(fetch_naukri_jobs_async, keyword, location, 30),
+        'ziprecruiter': partial(fetch_ziprecruiter_pages_async, keyword, location, 50, '', False, 168, 1, SOURCE_PAGES),
+        'aasaanjobs': partial(fetch_aasaanjobs_jobs, keyword),
+        'dare2compete': partial(fetch_dare2compete_jobs_async),
+        'freshersworld': partial(fetch_freshersworld_jobs, keyword, location),
+        'jobguru': partial(fetch_jobguru_jobs_async),
+        'timesjobs': partial(fetch_timesjobs_jobs_async, location),
+        'myamcat': partial(fetch_myamcat_jobs_async),
+        'jobspy': partial(fetch_jobspy_jobs, {
+            'site_names': 'indeed,linkedin,glassdoor,zip_recruiter',
+            'search_term': keyword,
+            'location': location,
+            'results_wanted': '25',
+            'hours_old': '96'
+        }),
+    }
+
+
+def is_async_call(call: partial) -> bool:
+    """
+    True when calling returns a coroutine that must be awaited on the AsyncRuntime loop
+    """
+    return inspect.iscoroutinefunction(call.func)
+
+
+def refresh_source_call(call: partial) -> Dict[str, Any]:
+    """
+    Re-run a call from build_source_calls upstream, replacing its source cache entry
+    """
+    if is_async_call(call):
+        return AsyncRuntime.get_instance().run(call.func.refresh(*call.args, **call.keywords))
+    return call.func.refresh(*call.args, **call.keywords)
+
+
+def peek_source_call(call: partial) -> Optional[Dict[str, Any]]:
+    """
+    The source cache entry for a call from build_source_calls, or None; never goes upstream
+    """
+    return call.func.peek(*call.args, **call.keywords)
@@ -0,0 +1,167 @@
+"""
+Pre-warming Scheduler
+Keeps the source and aggregate caches warm for the most requested searches
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.helpers.response import ScraperError
+from app.services.aggregate_cache import normalize_key
+from app.services.job_aggregator import JobAggregator, rebuild_pool_from_cache
+from app.services.job_sources import build_source_calls, refresh_source_call
+from app.services.source_cache import source_cache
+
+
+class PrewarmScheduler:
+    """
+    Tracks how often each (keyword, location) pair is searched, with exponential
+    decay, and refreshes the hottest pairs on a background thread.
+
+    Each source is refreshed on its own cadence (a fraction of its cache TTL, so
+    entries are replaced before they expire) and never more often than
+    min_interval seconds per source, whatever the number of hot pairs.
+
+    Searches are only counted while the scheduler thread runs (it is what decays
+    them), and at most max_tracked pairs are kept: a new pair replaces the coldest.
+    """
+
+    def __init__(self, tick: float, top_n: int, min_hits: float, decay: float,
+                 min_interval: float, refresh_ratio: float, sources: Optional[List[str]] = None,
+                 max_tracked: int = 1000):
+        self.tick = tick
+        self.top_n = top_n
+        self.min_hits = min_hits
+        self.decay = decay
+        self.min_interval = min_interval
+        self.refresh_ratio = refresh_ratio
+        self.max_tracked = max_tracked
+        self.sources = sources or JobAggregator().sources
+
+        self._scores: Dict[Tuple[str, str], float] = {}
+        self._last_refresh: Dict[Tuple[str, Tuple[str, str]], float] = {}
+        self._last_source_fetch: Dict[str, float] = {}
+        self._counters = {'ticks': 0, 'refreshed': 0, 'failed': 0, 'deferred': 0}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def record(self, keyword: str, location: str) -> None:
+        """
+        Count one search for (keyword, location); a no-op while the scheduler is stopped
+        """
+        key = normalize_key(keyword, location)
+        if not key[0] or not self.running:
+            return
+        with self._lock:
+            if key not in self._scores and len(self._scores) >= self.max_tracked:
+                del self._scores[min(self._scores, key=self._scores.get)]
+            self._scores[key] = self._scores.get(key, 0.0) + 1.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def hot_pairs(self) -> List[Tuple[Tuple[str, str], float]]:
+        with self._lock:
+            ranked = sorted(self._scores.items(), key=lambda item: item[1], reverse=True)
+        return [(key, score) for key, score in ranked[:self.top_n] if score >= self.min_hits]
+
+    def _decay_scores(self) -> None:
+        with self._lock:
+            for key in list(self._scores):
+                self._scores[key] *= self.decay
+                if self._scores[key] < 0.1:
+                    del self._scores[key]
+
+    def _is_due(self, source: str, pair: Tuple[str, str], now: float) -> bool:
+        cadence = source_cache.ttl_for(source) * self.refresh_ratio
+        return now - self._last_refresh.get((source, pair), 0.0) >= cadence
+
+    def _is_polite(self, source: str, now: float) -> bool:
+        return now - self._last_source_fetch.get(source, 0.0) >= self.min_interval
+
+    def run_once(self) -> None:
+        """
+        One scheduler pass: refresh every due (source, hot pair), then rebuild the pair's
+        aggregate pool from the source cache (sources deferred by min_interval are left out)
+        """
+        self._counters['ticks'] += 1
+        for pair, _ in self.hot_pairs():
+            keyword, location = pair
+            calls = build_source_calls(keyword, location)
+            refreshed = 0
+            deferred = set()
+            for source in self.sources:
+                now = time.monotonic()
+                if source not in calls or not self._is_due(source, pair, now):
+                    continue
+                if not self._is_polite(source, now):
+                    self._counters['deferred'] += 1
+                    deferred.add(source)
+                    continue
+
+                self._last_source_fetch[source] = now
+                self._last_refresh[(source, pair)] = now
+                try:
+                    refresh_source_call(calls[source])
+                    refreshed += 1
+                    self._counters['refreshed'] += 1
+                except ScraperError as e:
+                    self._counters['failed'] += 1
+                    print(f"⚠️ Prewarm {source} for {keyword} in {location}: {e.message}")
+                except Exception as e:
+                    self._counters['failed'] += 1
+                    print(f"⚠️ Prewarm {source} for {keyword} in {location}: {str(e)}")
+
+            if refreshed:
+                rebuild_pool_from_cache(keyword, location, skip=deferred)
+                print(f"🔥 Prewarmed {refreshed} sources for: {keyword} in {location}")
+        self._decay_scores()
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.tick):
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"❌ Prewarm pass failed: {str(e)}")
+
+    def start(self) -> None:
+        """
+        Start the scheduler thread (idempotent)
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='prewarm-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'running': self.running,
+            'tracked_pairs': len(self._scores),
+            'tick': self.tick,
+            'min_interval': self.min_interval,
+            'hot_pairs': [
+                {'keyword': keyword, 'location': location, 'score': round(score, 2)}
+                for (keyword, location), score in self.hot_pairs()
+            ],
+            **self._counters
+        }
+
+
+prewarm_scheduler = PrewarmScheduler(
+    tick=float(os.environ.get('PREWARM_TICK', '30')),
+    top_n=int(os.environ.get('PREWARM_TOP_N', '10')),
+    min_hits=float(os.environ.get('PREWARM_MIN_HITS', '3')),
+    decay=float(os.environ.get('PREWARM_DECAY', '0.95')),
+    min_interval=float(os.environ.get('PREWARM_MIN_INTERVAL', '10')),
+    refresh_ratio=float(os.environ.get('PREWARM_REFRESH_RATIO', '0.8')),
+    sources=[s for s in os.environ.get('PREWARM_SOURCES', '').split(',') if s] or None,
+    max_tracked=int(os.environ.get('PREWARM_MAX_TRACKED', '1000'))
+)
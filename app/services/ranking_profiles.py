@@ -0,0 +1,110 @@
+"""
+Ranking Profiles
+Named scoring weights, source bonuses and selection quotas, loaded once from
+app/config/ranking_profiles.json and picked per request (?profile=) or by
+the RANKING_PROFILE setting
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+RANKING_PROFILES_FILE = os.environ.get(
+    'RANKING_PROFILES_FILE',
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'ranking_profiles.json')
+)
+WEIGHT_KEYS = ('recency', 'location', 'title_match', 'work_mode', 'has_url')
+
+# Used when the profiles file is missing or has no 'default'
+DEFAULT_PROFILE = {
+    'description': 'Balanced: recency first, then location and title',
+    'weights': {'recency': 0.40, 'location': 0.25, 'title_match': 0.20, 'work_mode': 0.10, 'has_url': 0.05},
+    'source_bonus': {'timesjobs': 1.12},
+    'boosted_sources': ['TimesJobs', 'Timesjobs'],
+    'max_boosted': 5,
+    'min_per_source': 2
+}
+
+
+class RankingProfile:
+    """
+    weights: share of each feature in the score (WEIGHT_KEYS)
+    source_bonus: score multiplier for jobs whose source name contains the key
+    boosted_sources / max_boosted: sources picked first during selection, and how many
+    min_per_source: diversity quota for every source
+    """
+
+    __slots__ = ('name', 'description', 'weights', 'source_bonus',
+                 'boosted_sources', 'max_boosted', 'min_per_source')
+
+    def __init__(self, name: str, config: Dict[str, Any]):
+        self.name = name
+        self.description = config.get('description', '')
+        self.weights = {key: float(config.get('weights', {}).get(key, 0.0)) for key in WEIGHT_KEYS}
+        self.source_bonus = {key.lower(): float(value) for key, value in config.get('source_bonus', {}).items()}
+        self.boosted_sources = tuple(config.get('boosted_sources', ()))
+        self.max_boosted = int(config.get('max_boosted', 0))
+        self.min_per_source = int(config.get('min_per_source', 2))
+
+    def bonus_for(self, source: str) -> float:
+        """
+        Multiplier for a lowercased source name (first matching key, 1.0 if none)
+        """
+        for key, bonus in self.source_bonus.items():
+            if key in source:
+                return bonus
+        return 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'description': self.description,
+            'weights': self.weights,
+            'source_bonus': self.source_bonus,
+            'boosted_sources': list(self.boosted_sources),
+            'max_boosted': self.max_boosted,
+            'min_per_source': self.min_per_source
+        }
+
+
+class RankingProfiles:
+    """
+    Profile registry; unknown names fall back to the configured default
+    """
+
+    def __init__(self, profiles: Dict[str, Dict[str, Any]], default: str = 'default'):
+        profiles = dict(profiles)
+        profiles.setdefault('default', DEFAULT_PROFILE)
+        self.profiles = {name: RankingProfile(name, config) for name, config in profiles.items()}
+        if default not in self.profiles:
+            print(f"⚠️ Unknown RANKING_PROFILE '{default}', using 'default'")
+            default = 'default'
+        self.default = default
+
+    @classmethod
+    def load(cls, path: str = RANKING_PROFILES_FILE, default: str = 'default') -> 'RankingProfiles':
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls(json.load(f), default)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ranking profiles not loaded from {path}: {str(e)}")
+            return cls({}, default)
+
+    def get(self, name: Optional[str] = None) -> RankingProfile:
+        profile = self.profiles.get((name or '').strip().lower())
+        if profile is None:
+            if name:
+                print(f"⚠️ Unknown ranking profile '{name}', using '{self.default}'")
+            profile = self.profiles[self.default]
+        return profile
+
+    def names(self) -> List[str]:
+        return list(self.profiles)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'default': self.default,
+            'profiles': {name: profile.to_dict() for name, profile in self.profiles.items()}
+        }
+
+
+ranking_profiles = RankingProfiles.load(default=os.environ.get('RANKING_PROFILE', 'default'))
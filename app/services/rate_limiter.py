@@ -0,0 +1,246 @@
+"""
+Rate Limiter
+Token bucket per upstream host, shared by every thread and worker process on this machine
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from app.helpers.response import ScraperError
+
+try:
+    import fcntl
+except ImportError:  # Windows: buckets are shared by threads only
+    fcntl = None
+
+# (requests per second, burst) per upstream host; subdomains share their parent's bucket.
+# Override with RATE_LIMITS="naukri.com=1:3,indeed.com=0.5:2"
+DEFAULT_HOST_LIMITS = {
+    'naukri.com': (2.0, 5),
+    'indeed.com': (0.5, 2),
+    'internshala.com': (1.0, 3),
+    'linkedin.com': (0.5, 2),
+    'glints.com': (1.0, 3),
+    'jobstreet.co.id': (1.0, 3),
+    'remoteok.com': (0.5, 2),
+    'aasaanjobs.com': (1.0, 3),
+    'freshersworld.com': (1.0, 3),
+}
+LOOPBACK_HOSTS = ('localhost', '127.0.0.1', '::1')
+
+
+class RateLimitExceeded(ScraperError):
+    """
+    Raised instead of queueing when a host's bucket would make the caller wait longer than max_wait.
+    A local decision, not an upstream failure: it does not count against the source's circuit breaker.
+    """
+
+    def __init__(self, bucket: str, wait: float):
+        super().__init__(f'Rate limit for {bucket}: next slot in {wait:.1f}s, not queueing', status_code=429)
+        self.bucket = bucket
+        self.wait = wait
+
+
+class HostRateLimiter:
+    """
+    Token bucket per host: `rate` tokens per second, at most `burst` saved up.
+    Callers reserve a token and sleep until it is theirs, so a throttled host
+    queues requests in arrival order instead of failing them, for at most
+    max_wait seconds: a longer queue raises RateLimitExceeded without taking
+    a token, which also bounds how far a bucket can go into debt. Callers
+    cancelled while queued give their token back. Bucket state lives in small
+    files under state_dir guarded by fcntl locks, so all worker processes draw
+    from the same buckets.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, int]], default_limit: Tuple[float, int],
+                 state_dir: str, enabled: bool = True, max_wait: float = 10.0):
+        self.limits = dict(limits)
+        self.default_limit = default_limit
+        self.state_dir = state_dir
+        self.enabled = enabled
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, float]] = {}
+        os.makedirs(state_dir, exist_ok=True)
+
+    def bucket_for(self, host: str) -> Optional[str]:
+        """
+        Bucket name for a host or URL (its configured parent domain, or the host itself), None if unlimited
+        """
+        if host and '://' in host:
+            host = urlparse(host).hostname
+        host = (host or '').lower()
+        if not self.enabled or not host or host in LOOPBACK_HOSTS:
+            return None
+        for domain in self.limits:
+            if host == domain or host.endswith('.' + domain):
+                return domain
+        return host[4:] if host.startswith('www.') else host
+
+    def _update(self, bucket: str, delta: float, max_wait: Optional[float] = None) -> float:
+        """
+        Add delta tokens to the bucket (after refilling) and return the seconds until
+        the balance is non-negative. With max_wait, a change that would need a longer
+        wait is not applied and the would-be wait is returned as a negative number.
+        """
+        rate, burst = self.limits.get(bucket, self.default_limit)
+        path = os.path.join(self.state_dir, bucket)
+        with self._lock, open(path, 'a+') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                tokens, updated = (float(v) for v in f.read().split())
+            except ValueError:
+                tokens, updated = float(burst), time.time()
+
+            now = time.time()
+            tokens = min(float(burst), tokens + (now - updated) * rate)
+            wait = -(tokens + delta) / rate if tokens + delta < 0 else 0.0
+            if max_wait is not None and wait > max_wait:
+                wait = -wait
+            else:
+                tokens = min(float(burst), tokens + delta)
+            f.seek(0)
+            f.truncate()
+            f.write(f'{tokens} {now}')
+            f.flush()
+        return wait
+
+    def _reserve(self, bucket: str) -> float:
+        """
+        Take one token and return the seconds to wait for it; RateLimitExceeded past max_wait
+        """
+        wait = self._update(bucket, -1, self.max_wait)
+        if wait < 0:
+            self._count(bucket, 0.0, rejected=True)
+            raise RateLimitExceeded(bucket, -wait)
+        return wait
+
+    def _refund(self, bucket: str) -> None:
+        """
+        Give back a reserved token whose request was never sent
+        """
+        self._update(bucket, 1)
+        with self._lock:
+            self._bucket_counters(bucket)['refunded'] += 1
+
+    def _bucket_counters(self, bucket: str) -> Dict[str, float]:
+        # Caller holds self._lock
+        return self._counters.setdefault(bucket, {
+            'requests': 0, 'queued': 0, 'rejected': 0, 'refunded': 0, 'total_wait': 0.0, 'max_wait': 0.0
+        })
+
+    def _count(self, bucket: str, waited: float, rejected: bool = False) -> None:
+        with self._lock:
+            counters = self._bucket_counters(bucket)
+            if rejected:
+                counters['rejected'] += 1
+                return
+            counters['requests'] += 1
+            if waited > 0:
+                counters['queued'] += 1
+                counters['total_wait'] += waited
+                counters['max_wait'] = max(counters['max_wait'], waited)
+        if waited >= 1:
+            print(f"🚦 {bucket}: queued {waited:.1f}s by rate limit")
+
+    def acquire(self, host: str) -> float:
+        """
+        Block until a request to host (or URL) is allowed; returns the seconds waited.
+        Raises RateLimitExceeded instead of blocking longer than max_wait.
+        """
+        bucket = self.bucket_for(host)
+        if bucket is None:
+            return 0.0
+        wait = self._reserve(bucket)
+        if wait:
+            time.sleep(wait)
+        self._count(bucket, wait)
+        return wait
+
+    async def acquire_async(self, host: str) -> float:
+        """
+        acquire() for coroutines. Call it before session.get(), so queueing does not
+        eat into the request's own timeout. The locked state file is updated on an
+        executor thread, never on the event loop; a caller cancelled before its
+        slot comes gives the token back.
+        """
+        bucket = self.bucket_for(host)
+        if bucket is None:
+            return 0.0
+        loop = asyncio.get_running_loop()
+        reservation = loop.run_in_executor(None, self._reserve, bucket)
+        try:
+            wait = await asyncio.shield(reservation)
+            if wait:
+                await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            reservation.add_done_callback(
+                lambda done: done.cancelled() or done.exception() is not None
+                or loop.run_in_executor(None, self._refund, bucket)
+            )
+            raise
+        self._count(bucket, wait)
+        return wait
+
+    def wrap_session(self, session: Any) -> Any:
+        """
+        Rate-limit every call made through a requests.Session (or CloudScraper) instance
+        """
+        request: Callable = session.request
+
+        def limited_request(method, url, *args, **kwargs):
+            self.acquire(url)
+            return request(method, url, *args, **kwargs)
+
+        session.request = limited_request
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hosts = {
+                bucket: {
+                    'rate': self.limits.get(bucket, self.default_limit)[0],
+                    'burst': self.limits.get(bucket, self.default_limit)[1],
+                    **counters,
+                    'avg_wait': round(counters['total_wait'] / counters['queued'], 3) if counters['queued'] else 0.0
+                }
+                for bucket, counters in self._counters.items()
+            }
+        return {
+            'enabled': self.enabled,
+            'shared_across_processes': fcntl is not None,
+            'queue_limit': self.max_wait,
+            'default': {'rate': self.default_limit[0], 'burst': self.default_limit[1]},
+            'hosts': hosts
+        }
+
+
+def _parse_limit(value: str) -> Tuple[float, int]:
+    rate, _, burst = value.partition(':')
+    return float(rate), int(burst or 1)
+
+
+def _load_limits() -> Dict[str, Tuple[float, int]]:
+    limits = dict(DEFAULT_HOST_LIMITS)
+    for item in os.environ.get('RATE_LIMITS', '').split(','):
+        host, _, value = item.strip().partition('=')
+        if host and value:
+            limits[host.lower()] = _parse_limit(value)
+    return limits
+
+
+host_rate_limiter = HostRateLimiter(
+    limits=_load_limits(),
+    default_limit=_parse_limit(os.environ.get('RATE_LIMIT_DEFAULT', '2:5')),
+    state_dir=os.environ.get('RATE_LIMIT_DIR', os.path.join(tempfile.gettempdir(), 'job-scraper-rate-limits')),
+    enabled=os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() != 'false',
+    max_wait=float(os.environ.get('RATE_LIMIT_MAX_WAIT', '10'))
+)
@@ -0,0 +1,188 @@
+"""
+Retry Policy
+Budgeted retries with exponential backoff and full jitter for transient upstream errors
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aiohttp
+import requests
+
+# Upstream statuses worth another try; anything else (403 blocks, 404s) fails at once
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def _status_of(error: BaseException) -> Optional[int]:
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code
+    return None
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Connection errors and 429/5xx responses.
+    Timeouts are not retried: the attempt already used a full request timeout, so
+    another one would run past the source's deadline (aiohttp's ServerTimeoutError
+    and requests' ConnectTimeout are connection errors too, hence the explicit check).
+    ScraperError is never transient: controllers raise it for decided outcomes (e.g. blocked).
+    """
+    if isinstance(error, (asyncio.TimeoutError, requests.Timeout)):
+        return False
+    status = _status_of(error)
+    if status is not None:
+        return status in RETRY_STATUSES
+    return isinstance(error, (aiohttp.ClientConnectionError, requests.ConnectionError))
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    headers = getattr(error, 'headers', None)
+    if headers is None and isinstance(error, requests.HTTPError) and error.response is not None:
+        headers = error.response.headers
+    try:
+        return float(headers.get('Retry-After')) if headers else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Per-source retries of idempotent upstream calls.
+    Delays grow as base_delay * 2**n with full jitter (capped at max_delay; a
+    Retry-After header below the cap is honoured). Every first attempt deposits
+    budget_ratio tokens in the source's retry budget (capped at budget_max) and
+    every retry spends one, so retries stay a bounded share of traffic and
+    cannot multiply load on a failing board.
+    """
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float,
+                 budget_ratio: float, budget_min: float, budget_max: float):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min = budget_min
+        self.budget_max = budget_max
+        self._budgets: Dict[str, float] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, source: str, name: str) -> None:
+        counters = self._counters.setdefault(source, {
+            'calls': 0, 'retries': 0, 'recovered': 0, 'gave_up': 0, 'budget_exhausted': 0
+        })
+        counters[name] += 1
+
+    def _start_call(self, source: str) -> None:
+        with self._lock:
+            balance = self._budgets.get(source, self.budget_min)
+            self._budgets[source] = min(self.budget_max, balance + self.budget_ratio)
+            self._count(source, 'calls')
+
+    def _plan_retry(self, source: str, method: str, attempt: int, error: BaseException) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None to give up and re-raise
+        """
+        if method.upper() not in IDEMPOTENT_METHODS or not is_transient(error):
+            return None
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self._count(source, 'gave_up')
+                return None
+            if self._budgets.get(source, self.budget_min) < 1:
+                self._count(source, 'budget_exhausted')
+                return None
+            self._budgets[source] -= 1
+            self._count(source, 'retries')
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+        retry_after = _retry_after(error)
+        if retry_after is not None and retry_after <= self.max_delay:
+            delay = max(delay, retry_after)
+        print(f"🔁 {source}: retry {attempt}/{self.max_attempts - 1} in {delay:.2f}s after {type(error).__name__}")
+        return delay
+
+    def _finish(self, source: str, attempt: int) -> None:
+        if attempt > 1:
+            with self._lock:
+                self._count(source, 'recovered')
+
+    def call(self, source: str, fn: Callable[[], Any], method: str = 'GET') -> Any:
+        """
+        Run fn(), retrying transient failures; for blocking callers
+        """
+        self._start_call(source)
+        attempt = 1
+        while True:
+            try:
+                result = fn()
+                self._finish(source, attempt)
+                return result
+            except Exception as e:
+                delay = self._plan_retry(source, method, attempt, e)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, source: str, fn: Callable[[], Awaitable[Any]], method: str = 'GET') -> Any:
+        """
+        Await fn(), retrying transient failures; backoff sleeps do not block the loop
+        """
+        self._start_call(source)
+        attempt = 1
+        while True:
+            try:
+                result = await fn()
+                self._finish(source, attempt)
+                return result
+            except Exception as e:
+                delay = self._plan_retry(source, method, attempt, e)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'max_attempts': self.max_attempts,
+                'base_delay': self.base_delay,
+                'max_delay': self.max_delay,
+                'budget_ratio': self.budget_ratio,
+                'sources': {
+                    source: {'budget': round(self._budgets.get(source, self.budget_min), 2), **counters}
+                    for source, counters in self._counters.items()
+                }
+            }
+
+
+source_retries = RetryPolicy(
+    max_attempts=int(os.environ.get('RETRY_MAX_ATTEMPTS', '3')),
+    base_delay=float(os.environ.get('RETRY_BASE_DELAY', '0.2')),
+    max_delay=float(os.environ.get('RETRY_MAX_DELAY', '2')),
+    budget_ratio=float(os.environ.get('RETRY_BUDGET_RATIO', '0.1')),
+    budget_min=float(os.environ.get('RETRY_BUDGET_MIN', '5')),
+    budget_max=float(os.environ.get('RETRY_BUDGET_MAX', '10'))
+)
+
+
+def get_with_retries(source: str, session: requests.Session, url: str, **kwargs) -> requests.Response:
+    """
+    session.get(url, **kwargs) under source_retries. 429/5xx responses are retried;
+    once retries run out the last response is raised as requests.HTTPError.
+    """
+    def _get():
+        response = session.get(url, **kwargs)
+        if response.status_code in RETRY_STATUSES:
+            response.raise_for_status()
+        return response
+
+    return source_retries.call(source, _get)
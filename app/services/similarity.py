@@ -0,0 +1,42 @@
+"""
+String Similarity
+Character-trigram similarity for title/location matching: each distinct
+string is turned into a trigram set once, so comparing a candidate against
+the (already cached) query costs a single set intersection
+"""
+
+from functools import lru_cache
+from typing import FrozenSet
+
+TRIGRAM_CACHE_SIZE = 16384
+
+
+@lru_cache(maxsize=TRIGRAM_CACHE_SIZE)
+def trigram_set(text: str) -> FrozenSet[str]:
+    """
+    Trigrams of each word, padded like pg_trgm ("  py", " py", "pyt", ..., "on ")
+    so short words and word starts still contribute
+    """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: str, b: str) -> float:
+    """
+    Dice coefficient of the trigram sets, 0.0 to 1.0
+    (stand-in for difflib's SequenceMatcher.ratio(), which is quadratic)
+    """
+    if a == b:
+        return 1.0 if a.strip() else 0.0
+    grams_a = trigram_set(a)
+    grams_b = trigram_set(b)
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+def cache_info():
+    return trigram_set.cache_info()
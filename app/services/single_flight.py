@@ -0,0 +1,107 @@
+"""
+Single Flight
+Coalesces concurrent identical source fetches into one upstream request
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error', 'waiters')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+        self.waiters = 0
+
+
+class _AsyncCall:
+    __slots__ = ('task', 'waiters')
+
+    def __init__(self, task: 'asyncio.Task'):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    While a call for (source, key) is running, identical calls from other
+    threads wait for it and share its result (or its exception) instead of
+    starting their own upstream request.
+    Async fetches (do_async) are coalesced the same way on the AsyncRuntime loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[str, str], _Call] = {}
+        self._async_calls: Dict[Tuple[str, str], _AsyncCall] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, source: str, name: str) -> None:
+        counters = self._counters.setdefault(source, {'flights': 0, 'coalesced': 0})
+        counters[name] += 1
+
+    def do(self, source: str, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get((source, key))
+            leader = call is None
+            if leader:
+                call = self._calls[(source, key)] = _Call()
+                self._count(source, 'flights')
+            else:
+                call.waiters += 1
+                self._count(source, 'coalesced')
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[(source, key)]
+            call.done.set()
+
+    async def do_async(self, source: str, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn() once per (source, key) among concurrent callers on the same loop.
+        The shared fetch is shielded, so a caller cancelled at its deadline
+        does not cancel it for the others (or for the cache it fills).
+        """
+        with self._lock:
+            call = self._async_calls.get((source, key))
+            if call is None:
+                call = self._async_calls[(source, key)] = _AsyncCall(asyncio.ensure_future(fn()))
+                call.task.add_done_callback(lambda _: self._forget_async(source, key))
+                self._count(source, 'flights')
+            else:
+                call.waiters += 1
+                self._count(source, 'coalesced')
+
+        return await asyncio.shield(call.task)
+
+    def _forget_async(self, source: str, key: str) -> None:
+        with self._lock:
+            del self._async_calls[(source, key)]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            calls = list(self._calls.values()) + list(self._async_calls.values())
+            return {
+                'in_flight': len(calls),
+                'waiting': sum(call.waiters for call in calls),
+                'sources': {source: dict(counters) for source, counters in self._counters.items()}
+            }
+
+
+source_flights = SingleFlight()
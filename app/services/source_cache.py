@@ -0,0 +1,285 @@
+"""
+Source Cache
+LRU response cache around the controllers' fetch_* functions, shared by the
+individual /api/* routes and the aggregator fan-out
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.services.rate_limiter import RateLimitExceeded
+from app.services.single_flight import SingleFlight, source_flights
+from app.services.source_latency import SourceLatency, source_latency
+
+# Seconds a source's payload stays fresh; slow-moving feeds are kept longer.
+# Override per source with SOURCE_CACHE_TTL_<SOURCE>, e.g. SOURCE_CACHE_TTL_NAUKRI=120
+DEFAULT_SOURCE_TTLS = {
+    'naukri': 300,
+    'timesjobs': 600,
+    'indeed': 600,
+    'ziprecruiter': 600,
+    'internshala': 900,
+    'linkedin': 900,
+    'jobspy': 900,
+    'glints': 900,
+    'jobstreet': 900,
+    'aasaanjobs': 1800,
+    'dare2compete': 1800,
+    'freshersworld': 1800,
+    'jobguru': 1800,
+    'myamcat': 1800,
+    'remoteok': 1800,
+    'disnaker_bandung': 3600,
+}
+FALLBACK_TTL = 600
+
+_MISS = object()
+# Free-text arguments compared case and whitespace insensitively (as the aggregator's normalize_key),
+# so /api/<source> calls and the aggregator fan-out share entries
+_SEARCH_ARGS = ('keyword', 'keywords', 'search_term', 'work', 'location', 'location_name')
+
+
+def _key_value(name: str, value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _key_value(key, item) for key, item in value.items()}
+    if name in _SEARCH_ARGS and isinstance(value, str):
+        return ' '.join(value.lower().split())
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Routes pass query strings ('25'), in-process callers numbers (25)
+        return str(value)
+    return value
+
+
+def _make_key(signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """
+    Cache key from the bound call arguments (defaults applied), so positional and keyword calls share entries
+    """
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return json.dumps([(name, _key_value(name, value)) for name, value in bound.arguments.items()],
+                      sort_keys=True, default=str)
+
+
+class SourceCache:
+    """
+    Thread-safe LRU cache of source payloads with per-source TTLs,
+    a memory cap (approximate JSON size) and per-source hit/miss counters.
+    Cached payloads are shared between callers and must be treated as read-only.
+    Upstream fetch durations (misses and refreshes only) are recorded in `latency`,
+    failed attempts included.
+    """
+
+    def __init__(self, max_bytes: int, ttls: Optional[Dict[str, float]] = None,
+                 flights: Optional[SingleFlight] = None, latency: Optional[SourceLatency] = None):
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls or {})
+        self.flights = flights or SingleFlight()
+        self.latency = latency
+        self._entries: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, source: str) -> float:
+        return self.ttls.get(source, FALLBACK_TTL)
+
+    def _count(self, source: str, name: str) -> None:
+        counters = self._counters.setdefault(source, {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0})
+        counters[name] += 1
+
+    def get(self, source: str, key: str, count: bool = True) -> Any:
+        with self._lock:
+            entry = self._entries.get((source, key))
+            if entry is not None and time.monotonic() - entry['stored_at'] < self.ttl_for(source):
+                self._entries.move_to_end((source, key))
+                if count:
+                    self._count(source, 'hits')
+                return entry['value']
+            if entry is not None:
+                self._remove((source, key))
+            if count:
+                self._count(source, 'misses')
+            return _MISS
+
+    def put(self, source: str, key: str, value: Any) -> None:
+        size = len(json.dumps(value, default=str))
+        if self.ttl_for(source) <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if (source, key) in self._entries:
+                self._remove((source, key))
+            self._entries[(source, key)] = {'value': value, 'size': size, 'stored_at': time.monotonic()}
+            self._size += size
+            self._count(source, 'stores')
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._count(oldest[0], 'evictions')
+
+    @contextmanager
+    def _timed(self, source: str):
+        """
+        Record how long the upstream fetch took. A failed attempt (e.g. a controller
+        timeout raised as ScraperError 504) is a censored sample: the source took at
+        least that long. Local rate-limit rejections never reached the source and are skipped.
+        """
+        started = time.monotonic()
+        try:
+            yield
+        except RateLimitExceeded:
+            raise
+        except Exception:
+            self._record_latency(source, started)
+            raise
+        self._record_latency(source, started)
+
+    def _record_latency(self, source: str, started: float) -> None:
+        if self.latency is not None:
+            self.latency.record(source, time.monotonic() - started)
+
+    def _remove(self, entry_key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(entry_key)
+        self._size -= entry['size']
+
+    def cached(self, source: str) -> Callable:
+        """
+        Decorator for a fetch_* function. The cache key is the source plus the
+        bound call arguments (see _make_key).
+        Failures (exceptions) are never cached. Concurrent misses for the same
+        key are coalesced into a single upstream fetch.
+        """
+        def decorator(fetch: Callable) -> Callable:
+            signature = inspect.signature(fetch)
+
+            def make_key(args, kwargs) -> str:
+                return _make_key(signature, args, kwargs)
+
+            @functools.wraps(fetch)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+
+                value = self.get(source, key)
+                if value is not _MISS:
+                    return value
+
+                def fetch_and_store():
+                    # A flight that just finished may have stored it already
+                    value = self.get(source, key, count=False)
+                    if value is _MISS:
+                        with self._timed(source):
+                            value = fetch(*args, **kwargs)
+                        self.put(source, key, value)
+                    return value
+
+                return self.flights.do(source, key, fetch_and_store)
+
+            def refresh(*args, **kwargs):
+                """Fetch upstream even if cached and store the new payload"""
+                key = make_key(args, kwargs)
+
+                def fetch_and_store():
+                    with self._timed(source):
+                        value = fetch(*args, **kwargs)
+                    self.put(source, key, value)
+                    return value
+
+                return self.flights.do(source, key, fetch_and_store)
+
+            def peek(*args, **kwargs):
+                """Cached payload for these arguments, or None; never fetches"""
+                value = self.get(source, make_key(args, kwargs), count=False)
+                return None if value is _MISS else value
+
+            wrapper.uncached = fetch
+            wrapper.refresh = refresh
+            wrapper.peek = peek
+            return wrapper
+        return decorator
+
+    def cached_async(self, source: str) -> Callable:
+        """
+        cached() for async fetch_*_async coroutine functions: same keys and
+        entries, misses coalesced on the event loop instead of across threads
+        """
+        def decorator(fetch: Callable) -> Callable:
+            signature = inspect.signature(fetch)
+
+            def make_key(args, kwargs) -> str:
+                return _make_key(signature, args, kwargs)
+
+            @functools.wraps(fetch)
+            async def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+
+                value = self.get(source, key)
+                if value is not _MISS:
+                    return value
+
+                async def fetch_and_store():
+                    value = self.get(source, key, count=False)
+                    if value is _MISS:
+                        with self._timed(source):
+                            value = await fetch(*args, **kwargs)
+                        self.put(source, key, value)
+                    return value
+
+                return await self.flights.do_async(source, key, fetch_and_store)
+
+            async def refresh(*args, **kwargs):
+                """Fetch upstream even if cached and store the new payload"""
+                key = make_key(args, kwargs)
+
+                async def fetch_and_store():
+                    with self._timed(source):
+                        value = await fetch(*args, **kwargs)
+                    self.put(source, key, value)
+                    return value
+
+                return await self.flights.do_async(source, key, fetch_and_store)
+
+            def peek(*args, **kwargs):
+                """Cached payload for these arguments, or None; never fetches (not a coroutine)"""
+                value = self.get(source, make_key(args, kwargs), count=False)
+                return None if value is _MISS else value
+
+            wrapper.uncached = fetch
+            wrapper.refresh = refresh
+            wrapper.peek = peek
+            return wrapper
+        return decorator
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'sources': {
+                    source: {'ttl': self.ttl_for(source), **counters}
+                    for source, counters in self._counters.items()
+                }
+            }
+
+
+def _load_ttls() -> Dict[str, float]:
+    ttls = dict(DEFAULT_SOURCE_TTLS)
+    for source in DEFAULT_SOURCE_TTLS:
+        override = os.environ.get(f'SOURCE_CACHE_TTL_{source.upper()}')
+        if override:
+            ttls[source] = float(override)
+    return ttls
+
+
+source_cache = SourceCache(
+    max_bytes=int(float(os.environ.get('SOURCE_CACHE_MAX_MB', '64')) * 1024 * 1024),
+    ttls=_load_ttls(),
+    flights=source_flights,
+    latency=source_latency
+)
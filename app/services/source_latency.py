@@ -0,0 +1,114 @@
+"""
+Source Latency
+Rolling latency histograms per source and the adaptive timeouts derived from them
+"""
+
+import bisect
+import math
+import os
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+# Bucket upper bounds in seconds, log-spaced (x1.25) from 50ms to ~10 minutes
+BUCKET_BOUNDS: List[float] = [round(0.05 * 1.25 ** i, 3) for i in range(43)]
+
+
+class LatencyHistogram:
+    """
+    Bucketed histogram over the last `window` samples of one source.
+    Recording is O(1); the oldest sample's bucket is decremented as it falls out of the window.
+    """
+
+    def __init__(self, window: int):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.samples: Deque[int] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        if len(self.samples) == self.samples.maxlen:
+            self.counts[self.samples[0]] -= 1
+        bucket = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        self.samples.append(bucket)
+        self.counts[bucket] += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Upper bound (seconds) of the bucket holding the q-th percentile, None without samples
+        """
+        total = len(self.samples)
+        if not total:
+            return None
+        rank = max(1, math.ceil(total * q / 100))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return BUCKET_BOUNDS[bucket] if bucket < len(BUCKET_BOUNDS) else float('inf')
+        return None
+
+
+class SourceLatency:
+    """
+    Per-source latency histograms of upstream fetches (cache hits are not recorded).
+    timeout_for() derives each source's timeout as p99 x factor once enough samples
+    exist, bounded by [min_timeout, max_timeout]; until then max_timeout applies.
+    """
+
+    def __init__(self, window: int, min_samples: int, factor: float,
+                 min_timeout: float, max_timeout: float):
+        self.window = window
+        self.min_samples = min_samples
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(self, source: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(source)
+            if histogram is None:
+                histogram = self._histograms[source] = LatencyHistogram(self.window)
+            histogram.record(seconds)
+
+    def timeout_for(self, source: str) -> float:
+        """
+        Seconds to wait for the source; the caller's request deadline still cuts it off earlier
+        """
+        with self._lock:
+            histogram = self._histograms.get(source)
+            if histogram is None or len(histogram.samples) < self.min_samples:
+                return self.max_timeout
+            p99 = histogram.percentile(99)
+        return min(max(p99 * self.factor, self.min_timeout), self.max_timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sources = {
+                source: {
+                    'samples': len(histogram.samples),
+                    'p50': histogram.percentile(50),
+                    'p90': histogram.percentile(90),
+                    'p99': histogram.percentile(99),
+                }
+                for source, histogram in self._histograms.items()
+            }
+        for source, numbers in sources.items():
+            numbers['timeout'] = self.timeout_for(source)
+        return {
+            'window': self.window,
+            'min_samples': self.min_samples,
+            'factor': self.factor,
+            'min_timeout': self.min_timeout,
+            'max_timeout': self.max_timeout,
+            'sources': sources
+        }
+
+
+source_latency = SourceLatency(
+    window=int(os.environ.get('SOURCE_LATENCY_WINDOW', '200')),
+    min_samples=int(os.environ.get('SOURCE_LATENCY_MIN_SAMPLES', '20')),
+    factor=float(os.environ.get('SOURCE_TIMEOUT_FACTOR', '1.5')),
+    min_timeout=float(os.environ.get('SOURCE_TIMEOUT_MIN', '5')),
+    max_timeout=float(os.environ.get('SOURCE_TIMEOUT_MAX', '120'))
+)
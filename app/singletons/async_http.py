@@ -0,0 +1,121 @@
+import asyncio
+import os
+import threading
+import aiohttp
+from app.singletons.event_loop import AsyncRuntime
+
+
+class AsyncHttpClient:
+    """
+    Process-wide aiohttp session living on the AsyncRuntime loop.
+    Keeps TCP/TLS connections alive between requests and counts how often they are reused.
+    Not rate limited itself: callers await host_rate_limiter.acquire_async(url) before
+    session.get(), outside the request's ClientTimeout.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Return the client shared by all requests, creating it on first use.
+        """
+        if AsyncHttpClient._instance is None:
+            with AsyncHttpClient._lock:
+                if AsyncHttpClient._instance is None:
+                    AsyncHttpClient()
+        return AsyncHttpClient._instance
+
+    def __init__(self):
+        if AsyncHttpClient._instance is not None:
+            raise Exception("This class is a singleton!")
+
+        self.limit = int(os.environ.get('HTTP_POOL_LIMIT', '100'))
+        self.limit_per_host = int(os.environ.get('HTTP_POOL_LIMIT_PER_HOST', '10'))
+        self.dns_ttl = int(os.environ.get('HTTP_POOL_DNS_TTL', '300'))
+        self.keepalive_timeout = float(os.environ.get('HTTP_POOL_KEEPALIVE', '30'))
+
+        self._session = None
+        self._counters = {
+            'requests': 0,
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
+
+        AsyncHttpClient._instance = self
+        AsyncRuntime.get_instance().add_shutdown_hook(self.close)
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        def counter(name):
+            async def _count(session, ctx, params):
+                self._counters[name] += 1
+            return _count
+
+        trace.on_request_start.append(counter('requests'))
+        trace.on_connection_create_end.append(counter('connections_created'))
+        trace.on_connection_reuseconn.append(counter('connections_reused'))
+        trace.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        return trace
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared session, creating it on first use.
+        Must be awaited on the AsyncRuntime loop, the session is bound to it.
+        """
+        if asyncio.get_running_loop() is not AsyncRuntime.get_instance().loop:
+            raise RuntimeError("AsyncHttpClient can only be used on the AsyncRuntime loop")
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Close the shared session and its pooled connections
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def stats(self) -> dict:
+        """
+        Pool sizing numbers: limits, request/connection counters, reuse ratio and current connections
+        """
+        counters = dict(self._counters)
+        opened = counters['connections_created'] + counters['connections_reused']
+        connector = self._session.connector if self._session is not None and not self._session.closed else None
+
+        return {
+            'limits': {
+                'total': self.limit,
+                'per_host': self.limit_per_host,
+                'dns_ttl': self.dns_ttl,
+                'keepalive_timeout': self.keepalive_timeout
+            },
+            **counters,
+            'reuse_ratio': round(counters['connections_reused'] / opened, 4) if opened else 0.0,
+            # Connector internals, best effort: idle pooled vs checked out connections
+            'idle_connections': sum(len(conns) for conns in getattr(connector, '_conns', {}).values()),
+            'active_connections': len(getattr(connector, '_acquired', ())),
+        }
+
+
+def _reset_after_fork():
+    # The session belongs to the parent's loop, a forked worker opens its own
+    AsyncHttpClient._instance = None
+    AsyncHttpClient._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
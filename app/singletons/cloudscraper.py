@@ -1,5 +1,6 @@
 import cloudscraper
 from app.helpers.cookie_helper import load_cookies
+from app.services.rate_limiter import host_rate_limiter
 
 class CloudScraper:
     _instance = None
@@ -38,4 +39,5 @@ class CloudScraper:
                 'Connection': 'keep-alive'
             })
 
-            CloudScraper._instance = scraper
+            # Setiap request melewati token bucket per host
+            CloudScraper._instance = host_rate_limiter.wrap_session(scraper)
@@ -0,0 +1,159 @@
+import asyncio
+import atexit
+import concurrent.futures
+import os
+import threading
+
+
+class AsyncRuntime:
+    """
+    Persistent asyncio event loop running on a background thread.
+    Async state that must outlive a request (HTTP sessions, caches, semaphores)
+    lives on this loop; sync code submits coroutines to it.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_instance():
+        """
+        Return the running runtime, starting it on first use.
+        """
+        if AsyncRuntime._instance is None:
+            with AsyncRuntime._lock:
+                if AsyncRuntime._instance is None:
+                    AsyncRuntime()
+        return AsyncRuntime._instance
+
+    def __init__(self):
+        if AsyncRuntime._instance is not None:
+            raise Exception("This class is a singleton!")
+
+        self.loop = asyncio.new_event_loop()
+        self._shutdown_hooks = []
+        self._counters = {'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
+        # Counters are bumped from submitting threads and from the loop thread's done callbacks
+        self._counters_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='async-runtime', daemon=True)
+        self._thread.start()
+
+        AsyncRuntime._instance = self
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _count(self, name: str) -> None:
+        with self._counters_lock:
+            self._counters[name] += 1
+
+    def _count_result(self, future: concurrent.futures.Future) -> None:
+        if future.cancelled():
+            self._count('cancelled')
+        elif future.exception() is not None:
+            self._count('failed')
+        else:
+            self._count('completed')
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """
+        Schedule a coroutine on the runtime loop and return a concurrent Future
+        """
+        if self.loop.is_closed():
+            coro.close()
+            raise RuntimeError("AsyncRuntime has been shut down")
+
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self._count('submitted')
+        future.add_done_callback(self._count_result)
+        return future
+
+    def run(self, coro, timeout=None):
+        """
+        Run a coroutine on the runtime loop and block until it finishes
+        """
+        if self.in_loop_thread():
+            # Blocking the loop thread on its own work would deadlock forever
+            coro.close()
+            raise RuntimeError("AsyncRuntime.run() called from the runtime loop, await the coroutine instead")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def add_shutdown_hook(self, hook) -> None:
+        """
+        Register a coroutine function awaited on the loop before it stops (e.g. closing sessions)
+        """
+        self._shutdown_hooks.append(hook)
+
+    async def _shutdown(self):
+        for hook in self._shutdown_hooks:
+            try:
+                await hook()
+            except Exception as e:
+                print(f"⚠️ Runtime shutdown hook failed: {str(e)}")
+
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self, timeout: float = 5) -> None:
+        """
+        Run shutdown hooks, cancel leftover tasks and stop the loop thread
+        """
+        if self.loop.is_closed() or not self._thread.is_alive():
+            return
+        try:
+            self.submit(self._shutdown()).result(timeout)
+        except Exception as e:
+            print(f"⚠️ Runtime shutdown incomplete: {str(e)}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
+
+    def stats(self) -> dict:
+        """
+        Loop health: thread state, pending tasks and submitted/completed/failed coroutine counts
+        """
+        alive = self._thread.is_alive() and not self.loop.is_closed()
+        pending = 0
+        if alive:
+            # all_tasks is not thread-safe, ask the loop itself
+            pending = asyncio.run_coroutine_threadsafe(self._pending_tasks(), self.loop).result(1)
+        with self._counters_lock:
+            counters = dict(self._counters)
+        return {
+            'running': alive,
+            'thread': self._thread.name,
+            'pending_tasks': pending,
+            **counters
+        }
+
+    async def _pending_tasks(self) -> int:
+        return len(asyncio.all_tasks()) - 1
+
+
+def _shutdown_at_exit():
+    if AsyncRuntime._instance is not None:
+        AsyncRuntime._instance.shutdown()
+
+
+def _reset_after_fork():
+    # The loop thread does not survive fork(): a forked worker (e.g. gunicorn --preload)
+    # starts its own runtime on first use instead of submitting to a dead loop
+    AsyncRuntime._instance = None
+    AsyncRuntime._lock = threading.Lock()
+
+
+atexit.register(_shutdown_at_exit)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
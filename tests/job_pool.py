@@ -0,0 +1,33 @@
+"""
+Seeded random job pools shared by the ranking tests
+"""
+
+import random
+from datetime import datetime, timedelta
+
+SOURCES = ['Naukri', 'Indeed', 'Timesjobs', 'Linkedin', 'Remoteok', 'Internshala']
+TITLES = ['Python Developer', 'Senior Software Engineer', 'Data Analyst', 'DevOps Engineer',
+          'Frontend Developer (Remote)', 'QA Engineer', 'Hybrid Backend Engineer', 'Intern']
+LOCATIONS = ['Bangalore, Karnataka', 'Bengaluru', 'Pune', 'Mumbai', 'Remote', 'Jakarta Selatan', '']
+# Hours old, away from the 24/48/72/168/720 recency bucket edges
+AGES = [2, 30, 60, 100, 400, 2000]
+
+
+def make_pool(seed, size=300):
+    rng = random.Random(seed)
+    now = datetime.now()
+    jobs = []
+    for i in range(size):
+        job = {
+            'title': rng.choice(TITLES),
+            'company': f'Company {rng.randrange(40)}',
+            'location': rng.choice(LOCATIONS),
+            'via': rng.choice(SOURCES),
+            'link': f'https://example.com/jobs/{i}' if rng.random() < 0.8 else 'N/A',
+        }
+        if rng.random() < 0.8:
+            job['posted_on'] = (now - timedelta(hours=rng.choice(AGES))).isoformat()
+        if rng.random() < 0.2:
+            job['work_mode'] = rng.choice(['remote', 'hybrid', 'onsite'])
+        jobs.append(job)
+    return jobs
@@ -0,0 +1,118 @@
+"""
+Aggregate cache: fresh, stale and partial pools, and stale-while-revalidate in aggregate_jobs
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import aggregate_cache as aggregate_cache_module
+from app.services import job_aggregator
+from app.services.aggregate_cache import AggregateCache
+
+JOBS = [{'title': 'Python Developer', 'company': 'Acme', 'location': 'Pune',
+         'via': 'Naukri', 'link': 'https://example.com/1', 'posted_on': 'Recently'}]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(aggregate_cache_module.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def cache(clock):
+    return AggregateCache(ttl=300, stale_ttl=1800, max_entries=2)
+
+
+def test_fresh_then_stale_then_miss(cache, clock):
+    assert cache.get('python', 'pune') == (None, 'miss')
+    cache.put('Python ', 'PUNE', JOBS, {'naukri': 'completed'})
+
+    entry, state = cache.get('python', 'pune')
+    assert state == 'hit' and entry['jobs'] == JOBS
+
+    clock.now += 300
+    entry, state = cache.get('python', 'pune')
+    assert state == 'stale' and entry['jobs'] == JOBS
+
+    clock.now += 1800
+    assert cache.get('python', 'pune') == (None, 'miss')
+
+
+def test_partial_pool_is_served_as_stale(cache):
+    cache.put('python', 'pune', JOBS, {'naukri': 'completed', 'indeed': 'cutoff'}, partial=True)
+    entry, state = cache.get('python', 'pune')
+    assert state == 'stale' and entry['partial']
+
+
+def test_empty_pool_is_not_stored(cache):
+    cache.put('python', 'pune', [], {'naukri': 'failed'})
+    assert cache.get('python', 'pune') == (None, 'miss')
+
+
+def test_least_recently_used_pool_is_evicted(cache):
+    cache.put('a', '', JOBS, {})
+    cache.put('b', '', JOBS, {})
+    cache.get('a', '')
+    cache.put('c', '', JOBS, {})
+    assert cache.get('b', '')[1] == 'miss'
+    assert cache.get('a', '')[1] == 'hit'
+
+
+def test_one_refresh_per_key(cache):
+    assert cache.begin_refresh('python', 'pune')
+    assert not cache.begin_refresh('Python', ' pune ')
+    cache.end_refresh('python', 'pune')
+    assert cache.begin_refresh('python', 'pune')
+
+
+def test_aggregate_serves_stale_pool_and_refreshes_in_background(cache, monkeypatch):
+    fetches = []
+
+    async def fetch_all_jobs(self, keyword, location, budget_ms=None):
+        fetches.append((keyword, location))
+        self.progress = {'naukri': 'completed'}
+        return [dict(JOBS[0], title='Senior Python Developer')]
+
+    monkeypatch.setattr(job_aggregator, 'aggregate_cache', cache)
+    monkeypatch.setattr(job_aggregator.JobAggregator, 'fetch_all_jobs', fetch_all_jobs)
+    cache.put('python', 'pune', JOBS, {'naukri': 'completed', 'indeed': 'cutoff'}, partial=True)
+
+    async def scenario():
+        result = await job_aggregator.aggregate_jobs('python', 'pune', {})
+        # Let the background refresh run
+        await asyncio.gather(*job_aggregator._background_tasks)
+        return result
+
+    result = asyncio.run(scenario())
+    assert result['stats']['cache'] == 'stale'
+    assert result['stats']['partial']
+    assert [job['title'] for job in result['data']['jobs']] == ['Python Developer']
+
+    assert fetches == [('python', 'pune')]
+    entry, state = cache.get('python', 'pune')
+    assert state == 'hit' and not entry['partial']
+    assert entry['jobs'][0]['title'] == 'Senior Python Developer'
+
+
+def test_background_refresh_with_throttled_sources_stays_partial(cache, monkeypatch):
+    async def fetch_all_jobs(self, keyword, location, budget_ms=None):
+        self.progress = {'naukri': 'completed', 'indeed': 'throttled'}
+        return JOBS
+
+    monkeypatch.setattr(job_aggregator, 'aggregate_cache', cache)
+    monkeypatch.setattr(job_aggregator.JobAggregator, 'fetch_all_jobs', fetch_all_jobs)
+
+    asyncio.run(job_aggregator.refresh_candidate_pool('python', 'pune'))
+    entry, state = cache.get('python', 'pune')
+    assert state == 'stale' and entry['partial']
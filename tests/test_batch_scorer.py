@@ -0,0 +1,30 @@
+"""
+Batch scorer: the NumPy scores match calculate_job_score job by job
+"""
+
+import pytest
+
+from app.services.batch_scorer import score_jobs
+from app.services.job_aggregator import JobAggregator
+from app.services.job_record import build_records
+from app.services.ranking_profiles import ranking_profiles
+from tests.job_pool import make_pool
+
+
+@pytest.mark.parametrize('profile', ranking_profiles.names())
+@pytest.mark.parametrize('preferences', [
+    {},
+    {'location': 'Bangalore', 'jobTitle': 'python developer'},
+    {'location': 'Pune', 'jobTitle': 'engineer', 'workMode': 'remote'},
+    {'location': 'Jakarta', 'workMode': 'hybrid'},
+    {'jobTitle': 'data', 'workMode': 'onsite'},
+    {'workMode': 'any'},
+    {'workMode': 'flexible'},
+])
+def test_batch_scores_match_per_job_scores(profile, preferences):
+    aggregator = JobAggregator()
+    preferences = dict(preferences, profile=profile)
+    records = build_records(make_pool(7))
+    expected = [aggregator.calculate_job_score(record.job, preferences) for record in records]
+    scores = score_jobs(aggregator, records, preferences, ranking_profiles.get(profile))
+    assert scores.tolist() == expected
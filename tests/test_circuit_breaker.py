@@ -0,0 +1,88 @@
+"""
+Circuit breaker state changes
+"""
+
+import pytest
+
+from app.services.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(failure_threshold=3, open_seconds=60, max_open_seconds=200)
+
+
+def open_breaker(breaker, now=0.0):
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow(now)
+        breaker.record('failed', now)
+    assert breaker.state == OPEN
+
+
+def test_opens_after_consecutive_failures(breaker):
+    for status in ('failed', 'timeout'):
+        breaker.allow(0)
+        breaker.record(status, 0)
+    assert breaker.state == CLOSED
+    breaker.record('error', 0)
+    assert breaker.state == OPEN
+    assert not breaker.allow(10)
+    assert breaker.stats(10)['retry_in'] == 50.0
+
+
+def test_success_resets_the_failure_count(breaker):
+    breaker.record('failed', 0)
+    breaker.record('failed', 0)
+    breaker.record('completed', 0)
+    breaker.record('failed', 0)
+    assert breaker.state == CLOSED
+    assert breaker.failures == 1
+
+
+@pytest.mark.parametrize('status', ['cutoff', 'skipped', 'throttled', 'deferred', 'fetching'])
+def test_other_statuses_say_nothing_about_the_source(breaker, status):
+    for _ in range(5):
+        breaker.record(status, 0)
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+
+
+def test_half_open_lets_one_probe_through(breaker):
+    open_breaker(breaker)
+    assert breaker.allow(60)
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow(60)
+    assert breaker.counters['probes'] == 1
+
+
+def test_successful_probe_closes(breaker):
+    open_breaker(breaker)
+    breaker.allow(60)
+    breaker.record('completed', 61)
+    assert breaker.state == CLOSED
+    assert breaker.cooldown == 60
+    assert breaker.allow(61)
+
+
+def test_failed_probe_reopens_with_doubled_cooldown(breaker):
+    open_breaker(breaker)
+    breaker.allow(60)
+    breaker.record('timeout', 60)
+    assert breaker.state == OPEN
+    assert breaker.cooldown == 120
+    assert not breaker.allow(179)
+
+    assert breaker.allow(180)
+    breaker.record('failed', 180)
+    # Capped at max_open_seconds
+    assert breaker.cooldown == 200
+    assert breaker.counters['opened'] == 3
+
+
+def test_cancelled_probe_is_released(breaker):
+    open_breaker(breaker)
+    breaker.allow(60)
+    # Cut off at a deadline: no verdict, but the next call may probe
+    breaker.record('cutoff', 60)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow(60)
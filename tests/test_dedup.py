@@ -0,0 +1,79 @@
+"""
+Near-duplicate detection: real cross-source duplicates merge, distinct roles never do
+"""
+
+import pytest
+
+from app.services.dedup import JobDeduplicator
+from app.services.job_record import JobRecord
+
+
+def make_record(title, company, location, via='Naukri', link=None):
+    return JobRecord({
+        'title': title,
+        'company': company,
+        'location': location,
+        'via': via,
+        'link': link or f'https://{via.lower()}.example/{title}/{company}'.replace(' ', '-')
+    })
+
+
+@pytest.fixture
+def deduplicator():
+    return JobDeduplicator(enabled=True)
+
+
+def merged(deduplicator, a, b):
+    clusters = deduplicator.clusters([a, b])
+    return clusters[0] == clusters[1]
+
+
+@pytest.mark.parametrize('title_a,title_b,company', [
+    ('QA Engineer', 'DevOps Engineer', 'Tata Consultancy Services'),
+    ('QA Engineer', 'DevOps Engineer', 'Cognizant Technology Solutions India Pvt Ltd'),
+    ('Senior Software Engineer', 'Software Engineer', 'Acme'),
+    ('Software Engineer I', 'Software Engineer II', 'Acme'),
+    ('Lead Data Engineer', 'Data Engineer', 'Infosys Limited'),
+])
+def test_distinct_roles_at_same_company_are_kept(deduplicator, title_a, title_b, company):
+    a = make_record(title_a, company, 'Bangalore', via='Naukri')
+    b = make_record(title_b, company, 'Bangalore', via='Indeed')
+    assert not merged(deduplicator, a, b)
+
+
+def test_same_source_with_different_links_is_kept(deduplicator):
+    a = make_record('Python Developer', 'Acme', 'Pune', link='https://naukri.example/1')
+    b = make_record('Python Developer', 'Acme', 'Pune', link='https://naukri.example/2')
+    assert not merged(deduplicator, a, b)
+
+
+def test_different_known_cities_are_kept(deduplicator):
+    a = make_record('Python Developer', 'Acme', 'Pune', via='Naukri')
+    b = make_record('Python Developer', 'Acme', 'Mumbai', via='Indeed')
+    assert not merged(deduplicator, a, b)
+
+
+def test_different_companies_are_kept(deduplicator):
+    a = make_record('Python Developer', 'Acme', 'Pune', via='Naukri')
+    b = make_record('Python Developer', 'Globex', 'Pune', via='Indeed')
+    assert not merged(deduplicator, a, b)
+
+
+def test_cross_source_copies_are_merged(deduplicator):
+    a = make_record('Sr. Python Developer', 'Acme Corp', 'Bangalore', via='Naukri')
+    b = make_record('Senior Python Developer', 'Acme Corp Pvt. Ltd.', 'Bengaluru, Karnataka', via='Indeed')
+    assert merged(deduplicator, a, b)
+
+
+def test_keep_best_keeps_highest_score(deduplicator):
+    records = [
+        make_record('Python Developer', 'Acme', 'Pune', via='Naukri'),
+        make_record('Java Developer', 'Acme', 'Pune', via='Naukri'),
+        make_record('Python Developer', 'Acme', 'Pune', via='Indeed'),
+    ]
+    assert deduplicator.keep_best(records, [0.5, 0.4, 0.9]) == [1, 2]
+
+
+def test_enabled_by_default():
+    assert JobDeduplicator().enabled is True
+    assert JobDeduplicator(enabled=False).enabled is False
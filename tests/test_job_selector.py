@@ -0,0 +1,52 @@
+"""
+Job selector: select_top_k picks what the sort + list-scan selection it replaced picked
+"""
+
+import random
+
+import pytest
+
+from app.services.job_record import build_records
+from app.services.job_selector import select_top_k
+from app.services.ranking_profiles import ranking_profiles
+from tests.job_pool import make_pool
+
+
+def sort_based_selection(records, scores, target_count, min_per_source, boosted_sources, max_boosted):
+    """The selection select_top_k replaced: full sort, then three list scans"""
+    ranked = [record for record, _ in sorted(zip(records, scores), key=lambda pair: pair[1], reverse=True)]
+    selected, source_counts = [], {}
+
+    for record in ranked:
+        if len(selected) >= target_count:
+            break
+        if record.via in boosted_sources and source_counts.get(record.via, 0) < max_boosted:
+            selected.append(record)
+            source_counts[record.via] = source_counts.get(record.via, 0) + 1
+
+    for record in ranked:
+        if len(selected) >= target_count:
+            break
+        if source_counts.get(record.via, 0) < min_per_source and record not in selected:
+            selected.append(record)
+            source_counts[record.via] = source_counts.get(record.via, 0) + 1
+
+    for record in ranked:
+        if len(selected) >= target_count:
+            break
+        if record not in selected:
+            selected.append(record)
+    return selected, source_counts
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('target_count', [1, 5, 20, 100, 1000])
+def test_heap_selection_matches_sort_based(seed, target_count):
+    records = build_records(make_pool(seed))
+    rng = random.Random(seed)
+    # Coarse scores so ties (broken by input order) are common
+    scores = [round(rng.random(), 1) for _ in records]
+    for profile in (ranking_profiles.get(name) for name in ranking_profiles.names()):
+        args = (target_count, profile.min_per_source, profile.boosted_sources, profile.max_boosted)
+        expected = sort_based_selection(records, scores, *args)
+        assert select_top_k(records, scores, *args) == expected
@@ -0,0 +1,52 @@
+"""
+Host rate limiter: bounded queueing, fail-fast past max_wait, refunds on cancel
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.rate_limiter import HostRateLimiter, RateLimitExceeded
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    # 1 request per second, burst 1: the second call waits ~1s, the third ~2s
+    return HostRateLimiter({'example.com': (1.0, 1)}, (1.0, 1), str(tmp_path), max_wait=1.5)
+
+
+def debt(limiter, bucket='example.com'):
+    # Seconds until the bucket is back to zero tokens
+    return limiter._update(bucket, 0)
+
+
+def test_unlimited_hosts(limiter):
+    assert limiter.bucket_for('http://localhost:5000/x') is None
+    assert limiter.bucket_for('https://www.jobs.example.com/x') == 'example.com'
+
+
+def test_rejects_past_max_wait_without_taking_a_token(limiter):
+    assert limiter._reserve('example.com') == 0
+    assert 0 < limiter._reserve('example.com') <= 1.0
+    with pytest.raises(RateLimitExceeded) as error:
+        limiter._reserve('example.com')
+    assert error.value.status_code == 429
+    # The rejected call left the debt at one token, not two
+    assert 0 < debt(limiter) <= 1.0
+    assert limiter.stats()['hosts']['example.com']['rejected'] == 1
+
+
+def test_cancelled_caller_refunds_its_token(limiter):
+    async def scenario():
+        await limiter.acquire_async('https://example.com/a')
+        queued = asyncio.ensure_future(limiter.acquire_async('https://example.com/b'))
+        await asyncio.sleep(0.1)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert limiter.stats()['hosts']['example.com']['refunded'] == 1
+    # Only the first request's token is spent: no debt left behind
+    assert debt(limiter) == 0
@@ -0,0 +1,139 @@
+"""
+Retry policy: what counts as transient, attempts and the per-source retry budget
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+import requests
+
+from app.services import retry_policy
+from app.services.retry_policy import RetryPolicy, is_transient
+
+
+def response_error(status):
+    return aiohttp.ClientResponseError(None, (), status=status)
+
+
+@pytest.mark.parametrize('error', [
+    aiohttp.ClientConnectionError(),
+    aiohttp.ServerDisconnectedError(),
+    requests.ConnectionError(),
+    response_error(429),
+    response_error(503),
+])
+def test_transient(error):
+    assert is_transient(error)
+
+
+@pytest.mark.parametrize('error', [
+    asyncio.TimeoutError(),
+    aiohttp.ServerTimeoutError(),
+    requests.Timeout(),
+    requests.ConnectTimeout(),
+    requests.ReadTimeout(),
+    response_error(403),
+    response_error(404),
+    ValueError(),
+])
+def test_not_transient(error):
+    assert not is_transient(error)
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    monkeypatch.setattr(retry_policy.time, 'sleep', lambda seconds: None)
+    return RetryPolicy(max_attempts=3, base_delay=0.01, max_delay=0.05,
+                       budget_ratio=0.5, budget_min=1, budget_max=2)
+
+
+def flaky(failures, error=aiohttp.ClientConnectionError):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error()
+        return 'ok'
+    return fn, calls
+
+
+def test_recovers_within_max_attempts(policy):
+    # Start at budget_min (1) + 0.5 for this call: enough for one retry
+    fn, calls = flaky(1)
+    assert policy.call('demo', fn) == 'ok'
+    assert len(calls) == 2
+    counters = policy.stats()['sources']['demo']
+    assert counters['retries'] == 1 and counters['recovered'] == 1
+
+
+def test_gives_up_after_max_attempts(policy):
+    policy._budgets['demo'] = 10
+    fn, calls = flaky(5)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        policy.call('demo', fn)
+    assert len(calls) == 3
+    assert policy.stats()['sources']['demo']['gave_up'] == 1
+
+
+def test_budget_bounds_retries(policy):
+    fn, calls = flaky(100)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        policy.call('demo', fn)
+    # 1 + 0.5 tokens: one retry, then the budget is exhausted
+    assert len(calls) == 2
+    assert policy.stats()['sources']['demo']['budget'] == 0.5
+
+    fn, calls = flaky(100)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        policy.call('demo', fn)
+    # 0.5 + 0.5 tokens: one more retry
+    assert len(calls) == 2
+
+    fn, calls = flaky(100)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        policy.call('demo', fn)
+    # 0 + 0.5 tokens: no retry at all
+    assert len(calls) == 1
+    counters = policy.stats()['sources']['demo']
+    assert counters['retries'] == 2 and counters['budget_exhausted'] == 3
+
+
+def test_budget_refills_up_to_its_cap(policy):
+    for _ in range(10):
+        policy.call('demo', lambda: 'ok')
+    assert policy.stats()['sources']['demo']['budget'] == 2
+
+
+def test_budgets_are_per_source(policy):
+    fn, _ = flaky(100)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        policy.call('demo', fn)
+    fn, calls = flaky(1)
+    assert policy.call('other', fn) == 'ok'
+    assert len(calls) == 2
+
+
+def test_non_transient_errors_and_writes_are_not_retried(policy):
+    fn, calls = flaky(1, error=requests.ReadTimeout)
+    with pytest.raises(requests.ReadTimeout):
+        policy.call('demo', fn)
+    fn, post_calls = flaky(1)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        policy.call('demo', fn, method='POST')
+    assert len(calls) == len(post_calls) == 1
+
+
+def test_async_retries_use_the_same_budget(policy, monkeypatch):
+    async def no_sleep(seconds):
+        pass
+    monkeypatch.setattr(retry_policy.asyncio, 'sleep', no_sleep)
+    fn, calls = flaky(1)
+
+    async def attempt():
+        return fn()
+
+    assert asyncio.run(policy.call_async('demo', attempt)) == 'ok'
+    assert len(calls) == 2
+    assert policy.stats()['sources']['demo']['budget'] == 0.5
@@ -0,0 +1,94 @@
+"""
+Source cache: upstream latency samples, failed attempts included
+"""
+
+import asyncio
+
+import pytest
+
+from app.helpers.response import ScraperError
+from app.services.rate_limiter import RateLimitExceeded
+from app.services.single_flight import SingleFlight
+from app.services.source_cache import SourceCache
+from app.services.source_latency import SourceLatency
+
+
+@pytest.fixture
+def cache():
+    latency = SourceLatency(window=10, min_samples=1, factor=1.5, min_timeout=0.0, max_timeout=120)
+    return SourceCache(max_bytes=10_000, ttls={'demo': 60}, flights=SingleFlight(), latency=latency)
+
+
+def samples(cache):
+    return cache.latency.stats()['sources'].get('demo', {}).get('samples', 0)
+
+
+def test_success_is_recorded_and_cached(cache):
+    @cache.cached('demo')
+    def fetch(keyword):
+        return {'jobs': [keyword]}
+
+    assert fetch('a') == fetch('a')
+    assert samples(cache) == 1
+
+
+def test_failed_attempts_are_censored_samples(cache):
+    @cache.cached('demo')
+    def fetch(keyword):
+        raise ScraperError('Demo request timed out.', status_code=504)
+
+    @cache.cached_async('demo')
+    async def fetch_async(keyword):
+        raise ScraperError('Demo request timed out.', status_code=504)
+
+    with pytest.raises(ScraperError):
+        fetch('a')
+    with pytest.raises(ScraperError):
+        asyncio.run(fetch_async('a'))
+    assert samples(cache) == 2
+
+
+def test_rate_limit_rejections_are_not_samples(cache):
+    @cache.cached('demo')
+    def fetch(keyword):
+        raise RateLimitExceeded('demo.example', 30.0)
+
+    with pytest.raises(RateLimitExceeded):
+        fetch('a')
+    assert samples(cache) == 0
+
+
+def test_aggregator_timeout_adds_no_second_sample(monkeypatch):
+    from app.services import job_aggregator
+    from app.services.circuit_breaker import source_breakers
+
+    latency = SourceLatency(window=10, min_samples=1, factor=1.5, min_timeout=0.0, max_timeout=120)
+    monkeypatch.setattr(job_aggregator, 'source_latency', latency)
+
+    async def fetch_in_process(self, source, keyword, location, timeout):
+        raise asyncio.TimeoutError()
+
+    monkeypatch.setattr(job_aggregator.JobAggregator, '_fetch_in_process', fetch_in_process)
+    aggregator = job_aggregator.JobAggregator(dispatch='direct')
+    try:
+        assert asyncio.run(aggregator.fetch_from_source(None, 'naukri', 'python', 'pune')) == []
+    finally:
+        source_breakers.reset('naukri')
+    assert aggregator.progress['naukri'] == 'timeout'
+    # The abandoned fetch is recorded by the source cache when it ends, not here
+    assert latency.stats()['sources'] == {}
+
+
+def test_route_and_aggregator_calls_share_entries(cache):
+    calls = []
+
+    @cache.cached('demo')
+    def fetch(keyword='developer', location='', limit=25, params=None):
+        calls.append(keyword)
+        return {'jobs': [keyword]}
+
+    # Aggregator: normalized text, numbers; route: raw query strings
+    fetch('python developer', 'pune', 25, {'search_term': 'python developer', 'results_wanted': 20})
+    fetch(' Python  Developer', 'Pune', '25', {'search_term': 'Python Developer', 'results_wanted': '20'})
+    fetch('python developer', 'Mumbai', 25)
+    assert len(calls) == 2